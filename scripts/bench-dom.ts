@@ -0,0 +1,30 @@
+// ============================================================
+// DOM for rendering benchmarks
+// Exposes a jsdom window as the Node global scope, the way a browser would,
+// and marks the environment for React's act(). Import it before React so
+// react-dom sees a DOM when it loads. Needs jsdom:
+// npm install --no-save jsdom
+// ============================================================
+
+import { loadBenchPackage } from './bench-helpers';
+
+interface JSDOMModule {
+  JSDOM: new (html: string, options: Record<string, unknown>) => { window: Window & typeof globalThis };
+}
+
+const { JSDOM } = loadBenchPackage<JSDOMModule>('jsdom');
+
+const { window } = new JSDOM('<!doctype html><html><body></body></html>', {
+  pretendToBeVisual: true,
+  url: 'http://localhost/',
+});
+
+for (const key of Object.getOwnPropertyNames(window)) {
+  if (key in globalThis) continue;
+  Object.defineProperty(globalThis, key, {
+    configurable: true,
+    get: () => window[key as keyof typeof window],
+  });
+}
+
+(globalThis as unknown as { IS_REACT_ACT_ENVIRONMENT: boolean }).IS_REACT_ACT_ENVIRONMENT = true;
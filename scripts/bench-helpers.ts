@@ -0,0 +1,128 @@
+// ============================================================
+// Benchmark helpers
+// Shared fixtures and timing for the scripts in this folder. Fixtures are
+// generated from a fixed seed so every run measures the same data.
+// ============================================================
+
+import { createRequire } from 'node:module';
+import { createEmptySchema } from '@/types/schema';
+import type { CarouselSchema, Slide, SlideElement } from '@/types/schema';
+
+/** mulberry32 — small seeded PRNG so fixtures are identical across runs */
+export function seededRandom(seed = 1): () => number {
+  let a = seed >>> 0;
+  return () => {
+    a = (a + 0x6d2b79f5) >>> 0;
+    let t = a;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+const WORDS = [
+  'carrossel', 'conteúdo', 'marca', 'crescimento', 'estratégia', 'engajamento',
+  'público', 'resultado', 'design', 'slide', 'texto', 'imagem', 'ação', 'rápida',
+];
+
+function sentence(random: () => number, length: number): string {
+  const words: string[] = [];
+  let size = 0;
+  while (size < length) {
+    const word = WORDS[Math.floor(random() * WORDS.length)];
+    words.push(word);
+    size += word.length + 1;
+  }
+  return words.join(' ');
+}
+
+export interface FixtureOptions {
+  elementsPerSlide?: number;
+  /** Approximate characters of HTML per text element */
+  contentLength?: number;
+  freeform?: boolean;
+  seed?: number;
+}
+
+export function makeSlide(index: number, random: () => number, options: FixtureOptions = {}): Slide {
+  const { elementsPerSlide = 8, contentLength = 600, freeform = false } = options;
+  const elements: SlideElement[] = [];
+  for (let i = 0; i < elementsPerSlide; i++) {
+    const base = {
+      id: `s${index}-e${i}`,
+      ...(freeform && {
+        x: Math.round(random() * 900),
+        y: Math.round(random() * 1300),
+        w: 80 + Math.round(random() * 300),
+        h: 40 + Math.round(random() * 200),
+      }),
+    };
+    elements.push(i === 0
+      ? { ...base, type: 'heading', level: 1, content: `<b>${sentence(random, 40)}</b>` }
+      : { ...base, type: 'paragraph', content: `<p>${sentence(random, contentLength)}</p>` });
+  }
+  return { id: `s${index}`, layout: freeform ? 'freeform' : 'title-body', elements };
+}
+
+export function makeCarousel(slideCount: number, options: FixtureOptions = {}): CarouselSchema {
+  const random = seededRandom(options.seed);
+  const carousel = createEmptySchema(`bench-${slideCount}`);
+  carousel.title = `Benchmark ${slideCount}`;
+  carousel.slides = Array.from({ length: slideCount }, (_, i) => makeSlide(i, random, options));
+  return carousel;
+}
+
+/**
+ * Run `fn` `iterations` times after a warm-up and return the median and p95
+ * duration of one call, in milliseconds.
+ */
+export function measure(fn: (i: number) => void, iterations: number, warmup = Math.min(50, iterations)): { median: number; p95: number } {
+  for (let i = 0; i < warmup; i++) fn(i);
+  const samples: number[] = [];
+  for (let i = 0; i < iterations; i++) {
+    const start = performance.now();
+    fn(i);
+    samples.push(performance.now() - start);
+  }
+  return summarize(samples);
+}
+
+/** Median and p95 of a list of samples */
+export function summarize(samples: number[]): { median: number; p95: number } {
+  const sorted = [...samples].sort((a, b) => a - b);
+  return {
+    median: sorted[Math.floor(sorted.length / 2)],
+    p95: sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * 0.95))],
+  };
+}
+
+export function formatMs(ms: number): string {
+  return ms < 1 ? `${(ms * 1000).toFixed(1)} µs` : `${ms.toFixed(2)} ms`;
+}
+
+export function formatBytes(bytes: number): string {
+  if (bytes < 1024) return `${bytes} B`;
+  if (bytes < 1024 * 1024) return `${(bytes / 1024).toFixed(1)} KB`;
+  return `${(bytes / 1024 / 1024).toFixed(1)} MB`;
+}
+
+export function printHeader(title: string): void {
+  console.log(`\n${title}`);
+  console.log(`node ${process.version} · ${process.platform}/${process.arch}\n`);
+}
+
+/**
+ * Load a package only the benchmarks use (fake-indexeddb, jsdom). They are
+ * kept out of package.json so installing the app doesn't pull them in; a
+ * missing one is reported with the command that installs it.
+ */
+export function loadBenchPackage<T = unknown>(name: string): T {
+  try {
+    return createRequire(import.meta.url)(name) as T;
+  } catch (err) {
+    if ((err as { code?: string }).code !== 'MODULE_NOT_FOUND') throw err;
+    const pkg = name.split('/').slice(0, name.startsWith('@') ? 2 : 1).join('/');
+    console.error(`This benchmark needs ${pkg}: npm install --no-save ${pkg}`);
+    process.exit(1);
+  }
+}
@@ -0,0 +1,9 @@
+// ============================================================
+// IndexedDB for storage benchmarks
+// Installs fake-indexeddb as the global IndexedDB. Import it before anything
+// that loads Dexie, which picks up the globals when it loads.
+// ============================================================
+
+import { loadBenchPackage } from './bench-helpers';
+
+loadBenchPackage('fake-indexeddb/auto');
@@ -0,0 +1,160 @@
+// ============================================================
+// Slide rendering benchmark
+// Renders every slide of a carousel with SlideRenderer under React's
+// <Profiler> (in jsdom) and replays edits on the first slide through the
+// editor reducer. Reports the commit time of one edit, and the same edit when
+// every slide re-renders (a fresh theme object per render defeats the memo,
+// as an unmemoized canvas would). Ends with a dump of the profiled regions of
+// the largest run. React's development build is used, so absolute numbers
+// are higher than in production; compare the columns.
+//
+//   npm run bench:render
+// ============================================================
+
+import './bench-dom';
+import { Profiler, act } from 'react';
+import type { ProfilerOnRenderCallback } from 'react';
+import { createRoot } from 'react-dom/client';
+import { SlideRenderer } from '@/components/editor/SlideRenderer';
+import { StaticAssetProvider } from '@/lib/asset-urls';
+import { createInitialState, historyReducer } from '@/hooks/useEditorReducer';
+import type { EditorState } from '@/types/editor';
+import type { CarouselSchema, SlideElement } from '@/types/schema';
+import { formatMs, makeCarousel, measure, printHeader, summarize } from './bench-helpers';
+
+const SIZES = [10, 25, 50];
+const EDITS = 100;
+
+const NO_URLS = new Map<string, string>();
+const NOOP = () => {};
+const NOOP_UPDATE = () => {};
+
+interface RegionDump {
+  renders: number;
+  totalMs: number;
+  maxMs: number;
+}
+
+let commits: number[] = [];
+const regions = new Map<string, RegionDump>();
+
+const onCanvasRender: ProfilerOnRenderCallback = (_id, _phase, actualDuration) => {
+  commits.push(actualDuration);
+};
+
+const onSlideRender: ProfilerOnRenderCallback = (id, _phase, actualDuration) => {
+  const stats = regions.get(id) ?? { renders: 0, totalMs: 0, maxMs: 0 };
+  stats.renders++;
+  stats.totalMs += actualDuration;
+  stats.maxMs = Math.max(stats.maxMs, actualDuration);
+  regions.set(id, stats);
+};
+
+/** The editor canvas: the first slide is active, every other slide is live too */
+function Canvas({ state, bypassMemo }: { state: EditorState; bypassMemo: boolean }) {
+  const { slides, theme, footer, header } = state.carousel;
+  return (
+    <StaticAssetProvider urls={NO_URLS}>
+      {slides.map((slide, idx) => (
+        <Profiler key={slide.id} id={`slide:${idx + 1}`} onRender={onSlideRender}>
+          <SlideRenderer
+            slide={slide}
+            theme={bypassMemo ? { ...theme } : theme}
+            footer={footer.text}
+            handle={header.handle}
+            showCounter={header.showCounter}
+            slideNumber={idx + 1}
+            totalSlides={slides.length}
+            isEditing={idx === 0}
+            selectedElementId={idx === 0 ? state.selectedElementId : null}
+            onSelectElement={NOOP}
+            onUpdateElement={NOOP_UPDATE}
+            scale={0.375}
+          />
+        </Profiler>
+      ))}
+    </StaticAssetProvider>
+  );
+}
+
+type Edit = (element: SlideElement, i: number) => SlideElement;
+
+const textEdit: Edit = (element, i) => {
+  const { content } = element as SlideElement & { content: string };
+  return { ...element, content: `${content.slice(0, -4)} ${i}</p>` } as SlideElement;
+};
+
+const freeformMove: Edit = (element, i) => ({ ...element, x: 100 + (i % 200), y: 300 + (i % 120) });
+
+/** Replay `EDITS` edits of one element on slide 1; returns commit and wall time */
+function run(carousel: CarouselSchema, elementIndex: number, edit: Edit, bypassMemo: boolean) {
+  const container = document.createElement('div');
+  document.body.appendChild(container);
+  const root = createRoot(container);
+  const elementId = carousel.slides[0].elements[elementIndex].id;
+  let state: EditorState = { ...createInitialState(carousel), selectedElementId: elementId };
+  const render = () => root.render(
+    <Profiler id="canvas" onRender={onCanvasRender}>
+      <Canvas state={state} bypassMemo={bypassMemo} />
+    </Profiler>,
+  );
+
+  act(render);
+  commits = [];
+  regions.clear();
+  const wall = measure((i) => {
+    const element = state.carousel.slides[0].elements[elementIndex];
+    state = historyReducer(state, {
+      type: 'UPDATE_ELEMENT',
+      payload: { slideIndex: 0, elementId, element: edit(element, i) },
+    });
+    act(render);
+  }, EDITS, 0);
+  const commit = summarize(commits);
+
+  act(() => root.unmount());
+  container.remove();
+  return { commit, wall };
+}
+
+printHeader('Slide rendering — one edit on slide 1, every slide mounted');
+
+const scenarios = [
+  { name: 'text edit', freeform: false, elementIndex: 1, edit: textEdit },
+  { name: 'freeform move', freeform: true, elementIndex: 0, edit: freeformMove },
+];
+
+const rows: Record<string, string>[] = [];
+let dump: [string, RegionDump][] = [];
+for (const scenario of scenarios) {
+  for (const size of SIZES) {
+    const carousel = makeCarousel(size, { freeform: scenario.freeform, contentLength: 400 });
+    const all = run(carousel, scenario.elementIndex, scenario.edit, true);
+    const memo = run(carousel, scenario.elementIndex, scenario.edit, false);
+    if (size === SIZES[SIZES.length - 1] && !scenario.freeform) dump = [...regions];
+
+    rows.push({
+      edit: scenario.name,
+      slides: String(size),
+      'commit (median)': formatMs(memo.commit.median),
+      'commit (p95)': formatMs(memo.commit.p95),
+      'wall (median)': formatMs(memo.wall.median),
+      'commit, all slides re-render': formatMs(all.commit.median),
+      'wall, all slides re-render': formatMs(all.wall.median),
+    });
+  }
+}
+
+console.table(rows);
+console.log(`${EDITS} edits per row. "commit" is the canvas <Profiler> actualDuration; "wall" includes the reducer and DOM updates.`);
+
+console.log(`\nProfiler dump — text edit, ${SIZES[SIZES.length - 1]} slides (top regions by total time)`);
+console.table(dump
+  .sort((a, b) => b[1].totalMs - a[1].totalMs)
+  .slice(0, 8)
+  .map(([id, stats]) => ({
+    region: id,
+    renders: stats.renders,
+    'total ms': stats.totalMs.toFixed(2),
+    'max ms': stats.maxMs.toFixed(2),
+  })));
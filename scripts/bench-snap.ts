@@ -0,0 +1,85 @@
+// ============================================================
+// Freeform drag benchmark
+// Replays the same pointer path over freeform slides with a growing number
+// of elements and reports the per-event snapping cost with a per-drag index
+// (what useFreeformDrag does) versus rebuilding targets on every event, plus
+// the cost of the one reducer dispatch each animation frame makes.
+// React rendering is not included.
+//
+//   npm run bench:snap
+// ============================================================
+
+import { calculateSmartGuides, createSnapIndex, snapToIndex, type Rect } from '@/hooks/useSmartGuides';
+import { createInitialState, historyReducer } from '@/hooks/useEditorReducer';
+import type { SlideElement } from '@/types/schema';
+import { formatMs, makeCarousel, measure, printHeader, seededRandom } from './bench-helpers';
+
+const ELEMENT_COUNTS = [25, 100, 200, 400];
+const EVENTS = 600;
+const FRAME_BUDGET_MS = 1000 / 60;
+
+function toRect(el: SlideElement): Rect {
+  return { x: el.x ?? 0, y: el.y ?? 0, w: el.w ?? 200, h: el.h ?? 50 };
+}
+
+/** A wandering pointer path across the slide, in slide coordinates */
+function pointerPath(count: number): { x: number; y: number }[] {
+  const random = seededRandom(7);
+  const path: { x: number; y: number }[] = [];
+  let x = 400;
+  let y = 600;
+  for (let i = 0; i < count; i++) {
+    x = Math.max(0, Math.min(900, x + (random() - 0.5) * 24));
+    y = Math.max(0, Math.min(1300, y + (random() - 0.5) * 24));
+    path.push({ x, y });
+  }
+  return path;
+}
+
+printHeader('Freeform drag — cost per pointer event by element count');
+
+const path = pointerPath(EVENTS);
+const rows: Record<string, string>[] = [];
+for (const count of ELEMENT_COUNTS) {
+  const carousel = makeCarousel(1, { elementsPerSlide: count, contentLength: 40, freeform: true });
+  const [dragged, ...others] = carousel.slides[0].elements;
+  const otherRects = others.map(toRect);
+  const size = toRect(dragged);
+
+  const build = measure(() => {
+    createSnapIndex(otherRects);
+  }, 200, 20);
+
+  const index = createSnapIndex(otherRects);
+  const indexed = measure((i) => {
+    const p = path[i % path.length];
+    snapToIndex(index, { ...size, x: p.x, y: p.y });
+  }, EVENTS);
+
+  const rebuilt = measure((i) => {
+    const p = path[i % path.length];
+    calculateSmartGuides({ ...size, x: p.x, y: p.y }, otherRects);
+  }, EVENTS);
+
+  let state = createInitialState(carousel);
+  const dispatch = measure((i) => {
+    const p = path[i % path.length];
+    state = historyReducer(state, {
+      type: 'UPDATE_ELEMENT',
+      payload: { slideIndex: 0, elementId: dragged.id, element: { ...dragged, x: Math.round(p.x), y: Math.round(p.y) } },
+    });
+  }, EVENTS);
+
+  rows.push({
+    elements: String(count),
+    'index build (once/drag)': formatMs(build.median),
+    'snap, indexed (median)': formatMs(indexed.median),
+    'snap, indexed (p95)': formatMs(indexed.p95),
+    'snap, rebuilt per event': formatMs(rebuilt.median),
+    'dispatch (once/frame)': formatMs(dispatch.median),
+    'frame budget used': `${(((indexed.p95 + dispatch.p95) / FRAME_BUDGET_MS) * 100).toFixed(2)}%`,
+  });
+}
+
+console.table(rows);
+console.log(`${EVENTS} pointer events per size. "frame budget used" is p95 snap + p95 dispatch against a 60 Hz frame.`);
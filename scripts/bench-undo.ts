@@ -0,0 +1,81 @@
+// ============================================================
+// Undo history benchmark
+// Drives the editor reducer (with its patch-based history) over carousels of
+// growing size and reports the cost of one recorded edit, one undo and one
+// redo, plus the bytes each history entry keeps alive. The structuredClone
+// column is what the old snapshot history paid per action, for comparison.
+//
+//   npm run bench:undo
+// ============================================================
+
+import { createInitialState, historyReducer } from '@/hooks/useEditorReducer';
+import type { EditorState } from '@/types/editor';
+import type { SlideElement } from '@/types/schema';
+import { formatBytes, formatMs, makeCarousel, measure, printHeader } from './bench-helpers';
+
+const SIZES = [10, 25, 50, 100, 200];
+const ITERATIONS = 500;
+
+const gc = (globalThis as unknown as { gc?: () => void }).gc;
+
+function heapUsed(): number {
+  gc?.();
+  return process.memoryUsage().heapUsed;
+}
+
+function editAction(state: EditorState, i: number) {
+  const { slides } = state.carousel;
+  const slideIndex = i % slides.length;
+  // Alternate between two elements so consecutive edits are never coalesced
+  const element = slides[slideIndex].elements[1 + (i % 2)] as SlideElement & { content: string };
+  return {
+    type: 'UPDATE_ELEMENT' as const,
+    payload: {
+      slideIndex,
+      elementId: element.id,
+      element: { ...element, content: `${element.content.slice(0, -4)} ${i}</p>` },
+    },
+  };
+}
+
+printHeader('Undo history — cost per action by carousel size');
+
+const rows: Record<string, string>[] = [];
+for (const size of SIZES) {
+  const carousel = makeCarousel(size, { contentLength: 2000 });
+  let state = createInitialState(carousel);
+
+  const heapBefore = heapUsed();
+  const edit = measure((i) => {
+    state = historyReducer(state, editAction(state, i));
+  }, ITERATIONS);
+  const heapAfter = heapUsed();
+
+  const entryBytes = state.undoStack.reduce((sum, entry) => sum + entry.bytes, 0) / state.undoStack.length;
+
+  const undo = measure(() => {
+    state = historyReducer(state, { type: 'UNDO' });
+  }, Math.min(ITERATIONS, state.undoStack.length), 0);
+  const redo = measure(() => {
+    state = historyReducer(state, { type: 'REDO' });
+  }, Math.min(ITERATIONS, state.redoStack.length), 0);
+
+  const snapshot = measure(() => {
+    structuredClone(state.carousel);
+  }, 50, 5);
+
+  rows.push({
+    slides: String(size),
+    'carousel JSON': formatBytes(JSON.stringify(carousel).length * 2),
+    'edit (median)': formatMs(edit.median),
+    'edit (p95)': formatMs(edit.p95),
+    undo: formatMs(undo.median),
+    redo: formatMs(redo.median),
+    'bytes/entry': formatBytes(Math.round(entryBytes)),
+    ...(gc && { 'heap growth': formatBytes(heapAfter - heapBefore) }),
+    'structuredClone': formatMs(snapshot.median),
+  });
+}
+
+console.table(rows);
+console.log(`${ITERATIONS} edits per size; undo/redo walk the history those edits produced.`);
@@ -0,0 +1,225 @@
+// ============================================================
+// Canvas windowing benchmark
+// Mounts the real EditorWorkspace (panels, canvas and useNearViewport) in
+// jsdom, in horizontal and grid view, and scrolls it with a scripted
+// IntersectionObserver standing in for the browser. Each size runs twice:
+// once with the observer reporting what a viewport would (windowed), and
+// once reporting every slide as near, which mounts them all. Reports the live
+// DOM node count, retained heap and the <Profiler> commit time of each scroll
+// step. Thumbnails are not generated (jsdom has no canvas), so off-screen
+// slides are empty frames. React's development build is used; compare the
+// columns.
+//
+//   npm run bench:viewport
+// ============================================================
+
+import './bench-dom';
+import './bench-idb';
+import { Profiler, act } from 'react';
+import type { ProfilerOnRenderCallback } from 'react';
+import { createRoot } from 'react-dom/client';
+import { EditorWorkspace, type EditorActions } from '@/components/editor/EditorWorkspace';
+import { AssetProvider } from '@/lib/asset-urls';
+import { createInitialState, historyReducer } from '@/hooks/useEditorReducer';
+import type { EditorAction, EditorState } from '@/types/editor';
+import type { CarouselSchema } from '@/types/schema';
+import { formatBytes, formatMs, makeCarousel, printHeader, summarize } from './bench-helpers';
+
+const SIZES = [10, 50, 100, 200];
+const STEPS = 20;
+// Horizontal view: one slide either side is on screen, the 100% root margin
+// adds two more
+const NEAR_SLIDES = 3;
+// Grid view: a screen shows four rows of four slides; one scroll step is a row
+const GRID_SCREEN = 16;
+const GRID_ROW = 4;
+
+const PROJECT_ID = 'bench-viewport';
+
+const gc = (globalThis as unknown as { gc?: () => void }).gc;
+
+// ─── Scripted IntersectionObserver ───────────────────────────
+
+const observers = new Set<FakeIntersectionObserver>();
+
+class FakeIntersectionObserver {
+  readonly targets = new Set<HTMLElement>();
+
+  constructor(readonly callback: IntersectionObserverCallback) {
+    observers.add(this);
+  }
+
+  observe(target: HTMLElement) {
+    this.targets.add(target);
+  }
+
+  unobserve(target: HTMLElement) {
+    this.targets.delete(target);
+  }
+
+  disconnect() {
+    this.targets.clear();
+    observers.delete(this);
+  }
+
+  takeRecords() {
+    return [];
+  }
+}
+
+(globalThis as unknown as { IntersectionObserver: unknown }).IntersectionObserver = FakeIntersectionObserver;
+
+/** Report every observed slide as near or far, by its index in the carousel */
+function reportViewport(indexOf: Map<string, number>, isNear: (index: number) => boolean) {
+  for (const observer of observers) {
+    const entries = [...observer.targets].map((target) => ({
+      target,
+      isIntersecting: isNear(indexOf.get(target.dataset.nearId ?? '') ?? -1),
+    }));
+    observer.callback(entries as unknown as IntersectionObserverEntry[], observer as unknown as IntersectionObserver);
+  }
+}
+
+// ─── Runs ────────────────────────────────────────────────────
+
+let commits: number[] = [];
+
+const onWorkspaceRender: ProfilerOnRenderCallback = (_id, _phase, actualDuration) => {
+  commits.push(actualDuration);
+};
+
+function retainedHeap(): number {
+  gc?.();
+  return process.memoryUsage().heapUsed;
+}
+
+interface RunResult {
+  firstPaint: number;
+  domNodes: number;
+  heap: number;
+  scroll: number[];
+}
+
+function run(carousel: CarouselSchema, viewMode: EditorState['viewMode'], windowed: boolean): RunResult {
+  const indexOf = new Map(carousel.slides.map((slide, i) => [slide.id, i]));
+  const container = document.createElement('div');
+  document.body.appendChild(container);
+  const root = createRoot(container);
+  let state: EditorState = { ...createInitialState(carousel), viewMode };
+
+  const dispatch = (action: EditorAction) => {
+    state = historyReducer(state, action);
+    render();
+  };
+  // Same wiring as the editor page, minus the reducer hook
+  const actions: EditorActions = {
+    selectSlide: (i) => dispatch({ type: 'SELECT_SLIDE', payload: i }),
+    selectElement: (id) => dispatch({ type: 'SELECT_ELEMENT', payload: id }),
+    addSlide: (afterIndex, slide) => dispatch({ type: 'ADD_SLIDE', payload: { afterIndex, slide } }),
+    deleteSlide: (index) => dispatch({ type: 'DELETE_SLIDE', payload: index }),
+    duplicateSlide: (index) => dispatch({ type: 'DUPLICATE_SLIDE', payload: index }),
+    moveSlide: (from, to) => dispatch({ type: 'MOVE_SLIDE', payload: { from, to } }),
+    updateElement: (slideIndex, elementId, element) =>
+      dispatch({ type: 'UPDATE_ELEMENT', payload: { slideIndex, elementId, element } }),
+    addElement: (slideIndex, afterElementId, element) =>
+      dispatch({ type: 'ADD_ELEMENT', payload: { slideIndex, afterElementId, element } }),
+    deleteElement: (slideIndex, elementId) => dispatch({ type: 'DELETE_ELEMENT', payload: { slideIndex, elementId } }),
+    duplicateElement: (slideIndex, elementId) => dispatch({ type: 'DUPLICATE_ELEMENT', payload: { slideIndex, elementId } }),
+    moveElement: (slideIndex, elementId, direction) =>
+      dispatch({ type: 'MOVE_ELEMENT', payload: { slideIndex, elementId, direction } }),
+    reorderElement: (slideIndex, elementId, newIndex) =>
+      dispatch({ type: 'REORDER_ELEMENT', payload: { slideIndex, elementId, newIndex } }),
+    setTheme: (theme) => dispatch({ type: 'SET_THEME', payload: theme }),
+    setSlideBg: (slideIndex, color) => dispatch({ type: 'SET_SLIDE_BG', payload: { slideIndex, color } }),
+    setSlideBgImage: (slideIndex, image) => dispatch({ type: 'SET_SLIDE_BG_IMAGE', payload: { slideIndex, image } }),
+    setSlideBgPosition: (slideIndex, position) =>
+      dispatch({ type: 'SET_SLIDE_BG_POSITION', payload: { slideIndex, position } }),
+    setSlideLayout: (slideIndex, layout, elementUpdates) =>
+      dispatch({ type: 'SET_SLIDE_LAYOUT', payload: { slideIndex, layout, elementUpdates } }),
+  };
+
+  function render() {
+    root.render(
+      <AssetProvider projectId={PROJECT_ID}>
+        <Profiler id="workspace" onRender={onWorkspaceRender}>
+          <EditorWorkspace state={state} actions={actions} projectId={PROJECT_ID} />
+        </Profiler>
+      </AssetProvider>,
+    );
+  }
+
+  // What the observer reports for a viewport starting at `top` (grid) or
+  // centred on `top` (horizontal)
+  const near = (top: number) => (index: number) => {
+    if (!windowed) return true;
+    return viewMode === 'grid'
+      ? index >= top - GRID_SCREEN && index < top + 2 * GRID_SCREEN
+      : Math.abs(index - top) <= NEAR_SLIDES;
+  };
+
+  const baseHeap = retainedHeap();
+
+  // First paint, before the observer has reported anything
+  commits = [];
+  act(render);
+  const firstPaint = commits.reduce((sum, ms) => sum + ms, 0);
+  act(() => reportViewport(indexOf, near(0)));
+  let domNodes = container.querySelectorAll('*').length;
+  const heap = retainedHeap() - baseHeap;
+
+  // Scroll: the horizontal strip moves by selecting the next slide, the grid
+  // by one row; each step ends with the observer catching up
+  const steps = viewMode === 'grid'
+    ? Math.min(STEPS, Math.ceil((carousel.slides.length - GRID_SCREEN) / GRID_ROW))
+    : Math.min(STEPS, carousel.slides.length - 1);
+  const scroll: number[] = [];
+  for (let step = 1; step <= steps; step++) {
+    commits = [];
+    if (viewMode === 'grid') {
+      act(() => reportViewport(indexOf, near(step * GRID_ROW)));
+    } else {
+      act(() => actions.selectSlide(step));
+      act(() => reportViewport(indexOf, near(step)));
+    }
+    scroll.push(commits.reduce((sum, ms) => sum + ms, 0));
+    domNodes = Math.max(domNodes, container.querySelectorAll('*').length);
+  }
+
+  act(() => root.unmount());
+  container.remove();
+  return { firstPaint, domNodes, heap, scroll };
+}
+
+function scrollMedian(result: RunResult): string {
+  return result.scroll.length > 0 ? formatMs(summarize(result.scroll).median) : '—';
+}
+
+printHeader('Canvas windowing — EditorWorkspace, windowed vs every slide live');
+
+for (const viewMode of ['horizontal', 'grid'] as const) {
+  const rows: Record<string, string>[] = [];
+  for (const size of SIZES) {
+    const carousel = makeCarousel(size, { contentLength: 400 });
+    const all = run(carousel, viewMode, false);
+    const windowed = run(carousel, viewMode, true);
+
+    rows.push({
+      slides: String(size),
+      'first paint': formatMs(windowed.firstPaint),
+      'DOM nodes': String(windowed.domNodes),
+      'DOM nodes, all live': String(all.domNodes),
+      heap: formatBytes(Math.max(0, windowed.heap)),
+      'heap, all live': formatBytes(Math.max(0, all.heap)),
+      'scroll step (median)': scrollMedian(windowed),
+      'scroll step, all live': scrollMedian(all),
+    });
+  }
+  console.log(`${viewMode} view`);
+  console.table(rows);
+}
+
+console.log(
+  `Commit times are the workspace <Profiler> actualDuration; a scroll step sums its commits (up to ${STEPS} steps). ` +
+  '"DOM nodes" is the peak element count under the workspace; "heap" is heapUsed retained by the mounted ' +
+  `workspace${gc ? '' : ' (run with --expose-gc for stable numbers)'}.`,
+);
@@ -0,0 +1,119 @@
+// ============================================================
+// ZIP import benchmark
+// Builds a seeded project bundle (100 assets, 200 MB by default), imports it
+// into a fake IndexedDB with importZipAsProject and reports wall time,
+// throughput and peak memory. The "JSZip, one by one" row replays the import
+// this repo shipped before the streaming reader, for comparison.
+// Previews are not generated (Node has no createImageBitmap), so only the
+// hashing part of asset description is measured.
+//
+// Needs fake-indexeddb: npm install --no-save fake-indexeddb
+//
+//   npm run bench:import
+//   npm run bench:import -- --assets 40 --size-mb 80
+// ============================================================
+
+import './bench-idb';
+import { existsSync, readFileSync, writeFileSync } from 'node:fs';
+import { tmpdir } from 'node:os';
+import { join } from 'node:path';
+import JSZip from 'jszip';
+import { importZipAsProject } from '@/lib/zip-import';
+import { createProject, deleteProject, saveAsset, saveProjectSchema } from '@/lib/projects';
+import type { ImageElement } from '@/types/schema';
+import { formatBytes, formatMs, makeCarousel, printHeader, seededRandom } from './bench-helpers';
+
+function option(name: string, fallback: number): number {
+  const index = process.argv.indexOf(`--${name}`);
+  return index === -1 ? fallback : Number(process.argv[index + 1]);
+}
+
+const ASSETS = option('assets', 100);
+const SIZE_MB = option('size-mb', 200);
+const RUNS = 3;
+
+const gc = (globalThis as unknown as { gc?: () => void }).gc;
+
+/** Seeded bundle, cached in the temp dir so every run reads identical bytes */
+async function bundle(): Promise<Buffer> {
+  const path = join(tmpdir(), `carousel-bench-${ASSETS}x${SIZE_MB}MB.zip`);
+  if (existsSync(path)) return readFileSync(path);
+
+  const random = seededRandom(42);
+  const assetBytes = Math.floor((SIZE_MB * 1024 * 1024) / ASSETS);
+  const carousel = makeCarousel(ASSETS, { elementsPerSlide: 3 });
+  const zip = new JSZip();
+  carousel.slides.forEach((slide, i) => {
+    const filename = `assets/img-${String(i).padStart(3, '0')}.jpg`;
+    // Random words are incompressible, like real JPEG data
+    const words = new Uint32Array(Math.ceil(assetBytes / 4));
+    for (let w = 0; w < words.length; w++) words[w] = random() * 4294967296;
+    zip.file(filename, new Uint8Array(words.buffer, 0, assetBytes), { compression: 'STORE' });
+    const image: ImageElement = { id: `${slide.id}-img`, type: 'image', src: filename, variant: 'area' };
+    slide.elements.push(image);
+  });
+  zip.file('schema.json', JSON.stringify(carousel), { compression: 'DEFLATE' });
+  const buffer = await zip.generateAsync({ type: 'nodebuffer' });
+  writeFileSync(path, buffer);
+  return buffer;
+}
+
+/** The pre-streaming import: whole file into JSZip, then each asset stored on its own */
+async function importWithJSZip(file: File): Promise<string> {
+  const zip = await JSZip.loadAsync(await file.arrayBuffer());
+  const schema = JSON.parse(await zip.file('schema.json')!.async('string'));
+  const project = await createProject(schema.title);
+  for (const entry of Object.values(zip.files)) {
+    if (entry.dir || !entry.name.startsWith('assets/')) continue;
+    const blob = await entry.async('blob');
+    await saveAsset(project.id, entry.name, new Blob([blob], { type: 'image/jpeg' }));
+  }
+  await saveProjectSchema(project.id, schema);
+  return project.id;
+}
+
+async function run(label: string, file: File, importFn: (file: File) => Promise<string>) {
+  const times: number[] = [];
+  let peak = 0;
+  for (let i = 0; i < RUNS; i++) {
+    gc?.();
+    const base = process.memoryUsage().rss;
+    let runPeak = base;
+    const sampler = setInterval(() => {
+      runPeak = Math.max(runPeak, process.memoryUsage().rss);
+    }, 10);
+    const start = performance.now();
+    const projectId = await importFn(file);
+    times.push(performance.now() - start);
+    clearInterval(sampler);
+    runPeak = Math.max(runPeak, process.memoryUsage().rss);
+    peak = Math.max(peak, runPeak - base);
+    await deleteProject(projectId);
+  }
+  times.sort((a, b) => a - b);
+  const median = times[Math.floor(times.length / 2)];
+  return {
+    import: label,
+    'wall time (median)': formatMs(median),
+    throughput: `${(file.size / 1024 / 1024 / (median / 1000)).toFixed(1)} MB/s`,
+    'peak RSS growth': formatBytes(peak),
+  };
+}
+
+async function main() {
+  printHeader(`ZIP import — ${ASSETS} assets, ${SIZE_MB} MB`);
+
+  const file = new File([await bundle()], 'bench.zip', { type: 'application/zip' });
+  const rows = [
+    await run('streaming (importZipAsProject)', file, importZipAsProject),
+    await run('JSZip, one by one', file, importWithJSZip),
+  ];
+
+  console.table(rows);
+  console.log(
+    `${RUNS} runs each. fake-indexeddb keeps stored blobs in memory, so peak RSS includes one copy ` +
+    'of the imported assets on top of what the import pipeline itself holds.',
+  );
+}
+
+main();
@@ -0,0 +1,19 @@
+// ============================================================
+// Script runner
+// Runs a TypeScript script from this folder with jiti (already in the
+// lockfile through the Tailwind toolchain), resolving the app's "@/" import
+// alias and JSX the same way the Next.js build does.
+//
+//   node scripts/run.mjs scripts/bench-undo.ts [args]
+// ============================================================
+
+import { resolve } from 'node:path';
+import { fileURLToPath } from 'node:url';
+import { createJiti } from 'jiti';
+
+const jiti = createJiti(import.meta.url, {
+  alias: { '@': fileURLToPath(new URL('../src', import.meta.url)) },
+  jsx: { runtime: 'automatic' },
+});
+
+await jiti.import(resolve(process.argv[2]));
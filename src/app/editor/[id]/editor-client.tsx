@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, useEffect, useCallback, useMemo } from 'react';
+import { useState, useEffect, useCallback, useMemo, useRef } from 'react';
 import { useParams } from 'next/navigation';
 import { ArrowLeft } from 'lucide-react';
 import Link from 'next/link';
@@ -10,15 +10,16 @@ import { EditorToolbar } from '@/components/editor/EditorToolbar';
 import { EditorWorkspace, type EditorActions } from '@/components/editor/EditorWorkspace';
 import { useEditorReducer } from '@/hooks/useEditorReducer';
 import { useAutoSave } from '@/hooks/useAutoSave';
-import { exportSlidePng, exportAllSlidesPng } from '@/lib/export-png';
-import { exportProjectAsZip, downloadBlob } from '@/lib/zip-export';
+import { exportSlidePng, exportAllSlidesPng, type ExportProgress } from '@/lib/export-png';
+import { saveProjectZip } from '@/lib/zip-export';
 import { schemaToMarkdown } from '@/lib/export-markdown';
 import { schemaToJson, slugify, downloadTextFile, copyToClipboard } from '@/lib/export-json';
 import { AssetProvider } from '@/lib/asset-urls';
 import { useToast } from '@/hooks/useToast';
 import { ToastContainer } from '@/components/ui/toast-container';
+import { ProfiledRegion, RenderProfilerPanel } from '@/components/editor/RenderProfiler';
 import type { CarouselSchema } from '@/types/schema';
-import { migrateSchema } from '@/lib/schema-validation';
+import { getProjectSchema } from '@/lib/projects';
 
 export default function EditorPageClient() {
   const params = useParams<{ id: string }>();
@@ -40,10 +41,10 @@ export default function EditorPageClient() {
         return;
       }
 
-      const data = await db.projectData.get(params.id);
+      const schema = await getProjectSchema(params.id);
       setProject(proj);
-      if (data?.schema) {
-        setInitialSchema(migrateSchema(data.schema as Record<string, unknown>));
+      if (schema) {
+        setInitialSchema(schema);
       }
       setStatus('ready');
     }
@@ -92,7 +93,13 @@ function EditorInner({
   initialSchema?: CarouselSchema;
 }) {
   const { state, actions } = useEditorReducer(initialSchema);
-  const { isSaving, saveNow } = useAutoSave(projectId, state.carousel, state.isDirty, actions.markSaved);
+  const { isSaving, saveNow } = useAutoSave(
+    projectId,
+    state.carousel,
+    state.isDirty,
+    actions.markSaved,
+    initialSchema,
+  );
   const { toasts, show: showToast, dismiss: dismissToast } = useToast();
 
   // Keyboard shortcuts
@@ -126,13 +133,42 @@ function EditorInner({
     actions.setZoom(Math.max(state.zoom - 0.1, 0.3));
   }, [state.zoom, actions]);
 
-  const handleExportSlide = useCallback(() => {
-    exportSlidePng(state.selectedSlideIndex);
-  }, [state.selectedSlideIndex]);
+  const [exportProgress, setExportProgress] = useState<ExportProgress | null>(null);
+  const exportAbortRef = useRef<AbortController | null>(null);
+
+  const handleExportSlide = useCallback(async () => {
+    try {
+      await exportSlidePng(state.carousel, projectId, state.selectedSlideIndex);
+    } catch {
+      showToast('Erro ao exportar slide', 'error');
+    }
+  }, [state.carousel, projectId, state.selectedSlideIndex, showToast]);
+
+  const handleExportAll = useCallback(async () => {
+    if (exportAbortRef.current) return;
+    const controller = new AbortController();
+    exportAbortRef.current = controller;
+    try {
+      await exportAllSlidesPng(state.carousel, projectId, {
+        signal: controller.signal,
+        onProgress: setExportProgress,
+      });
+    } catch (err) {
+      if (!(err instanceof DOMException && err.name === 'AbortError')) {
+        showToast('Erro ao exportar slides', 'error');
+      }
+    } finally {
+      exportAbortRef.current = null;
+      setExportProgress(null);
+    }
+  }, [state.carousel, projectId, showToast]);
+
+  const handleCancelExport = useCallback(() => {
+    exportAbortRef.current?.abort();
+  }, []);
 
-  const handleExportAll = useCallback(() => {
-    exportAllSlidesPng(state.carousel.slides.length);
-  }, [state.carousel.slides.length]);
+  // Abort a running export when leaving the editor
+  useEffect(() => () => exportAbortRef.current?.abort(), []);
 
   const handleExportMarkdown = useCallback(() => {
     const md = schemaToMarkdown(state.carousel);
@@ -168,9 +204,7 @@ function EditorInner({
 
   const handleExportProjectZip = useCallback(async () => {
     try {
-      const blob = await exportProjectAsZip(projectId);
-      const filename = `${slugify(state.carousel.title)}.zip`;
-      downloadBlob(blob, filename);
+      await saveProjectZip(projectId, `${slugify(state.carousel.title)}.zip`);
     } catch {
       showToast('Erro ao exportar projeto', 'error');
     }
@@ -202,39 +236,44 @@ function EditorInner({
   return (
     <AssetProvider projectId={projectId}>
     <div className="flex h-screen flex-col bg-background">
-      <EditorToolbar
-        title={projectTitle}
-        slideCount={slideCount}
-        isDirty={state.isDirty}
-        isSaving={isSaving}
-        footerText={state.carousel.footer.text}
-        handle={state.carousel.header.handle}
-        showCounter={state.carousel.header.showCounter}
-        isPreviewMode={state.isPreviewMode}
-        viewMode={state.viewMode}
-        zoom={state.zoom}
-        canUndo={state.undoStack.length > 0}
-        canRedo={state.redoStack.length > 0}
-        onUndo={actions.undo}
-        onRedo={actions.redo}
-        onTogglePreview={actions.togglePreview}
-        onSetViewMode={actions.setViewMode}
-        onZoomIn={handleZoomIn}
-        onZoomOut={handleZoomOut}
-        onSetFooter={actions.setFooter}
-        onSetHandle={actions.setHandle}
-        onSetShowCounter={actions.setShowCounter}
-        onExportSlide={handleExportSlide}
-        onExportAll={handleExportAll}
-        onExportMarkdown={handleExportMarkdown}
-        onCopyMarkdown={handleCopyMarkdown}
-        onExportJson={handleExportJson}
-        onCopyJson={handleCopyJson}
-        onExportProjectZip={handleExportProjectZip}
-        onSaveNow={saveNow}
-      />
-      <EditorWorkspace state={state} actions={workspaceActions} projectId={projectId} />
+      <ProfiledRegion id="editor" root>
+        <EditorToolbar
+          title={projectTitle}
+          slideCount={slideCount}
+          isDirty={state.isDirty}
+          isSaving={isSaving}
+          footerText={state.carousel.footer.text}
+          handle={state.carousel.header.handle}
+          showCounter={state.carousel.header.showCounter}
+          isPreviewMode={state.isPreviewMode}
+          viewMode={state.viewMode}
+          zoom={state.zoom}
+          canUndo={state.undoStack.length > 0}
+          canRedo={state.redoStack.length > 0}
+          onUndo={actions.undo}
+          onRedo={actions.redo}
+          onTogglePreview={actions.togglePreview}
+          onSetViewMode={actions.setViewMode}
+          onZoomIn={handleZoomIn}
+          onZoomOut={handleZoomOut}
+          onSetFooter={actions.setFooter}
+          onSetHandle={actions.setHandle}
+          onSetShowCounter={actions.setShowCounter}
+          onExportSlide={handleExportSlide}
+          onExportAll={handleExportAll}
+          exportProgress={exportProgress}
+          onCancelExport={handleCancelExport}
+          onExportMarkdown={handleExportMarkdown}
+          onCopyMarkdown={handleCopyMarkdown}
+          onExportJson={handleExportJson}
+          onCopyJson={handleCopyJson}
+          onExportProjectZip={handleExportProjectZip}
+          onSaveNow={saveNow}
+        />
+        <EditorWorkspace state={state} actions={workspaceActions} projectId={projectId} />
+      </ProfiledRegion>
       <ToastContainer toasts={toasts} onDismiss={dismissToast} />
+      <RenderProfilerPanel />
     </div>
     </AssetProvider>
   );
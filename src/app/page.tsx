@@ -3,11 +3,11 @@
 import { useState, useEffect, useCallback, useRef, useMemo } from 'react';
 import { useRouter } from 'next/navigation';
 import { Plus, Search } from 'lucide-react';
-import { db, type Project } from '@/lib/db';
-import { createEmptySchema, SCHEMA_VERSION } from '@/types/schema';
+import type { Project } from '@/lib/db';
+import { createProject, deleteProject, getAllProjects, searchProjectIds } from '@/lib/projects';
 import { Button } from '@/components/ui/button';
 import { Input } from '@/components/ui/input';
-import { ProjectCard } from '@/components/gallery/ProjectCard';
+import { VirtualProjectGrid } from '@/components/gallery/VirtualProjectGrid';
 import { EmptyState } from '@/components/gallery/EmptyState';
 import { CreateProjectDialog } from '@/components/gallery/CreateProjectDialog';
 import { ImportZipButton } from '@/components/gallery/ImportZipButton';
@@ -21,31 +21,23 @@ import {
   DialogFooter,
 } from '@/components/ui/dialog';
 
+const SEARCH_DEBOUNCE_MS = 150;
+
 export default function HomePage() {
   const router = useRouter();
   const [projects, setProjects] = useState<Project[]>([]);
-  const [slideCounts, setSlideCounts] = useState<Record<string, number>>({});
   const [loading, setLoading] = useState(true);
   const [search, setSearch] = useState('');
+  const [matchIds, setMatchIds] = useState<Set<string> | null>(null);
   const [createOpen, setCreateOpen] = useState(false);
   const [deleteTarget, setDeleteTarget] = useState<string | null>(null);
   const importInputRef = useRef<HTMLInputElement>(null);
 
   const loadProjects = useCallback(async () => {
     try {
-      const all = await db.projects.orderBy('updatedAt').reverse().toArray();
-      setProjects(all);
-
-      // Load slide counts from projectData
-      const counts: Record<string, number> = {};
-      for (const p of all) {
-        const data = await db.projectData.get(p.id);
-        if (data?.schema) {
-          const schema = data.schema as { slides?: unknown[] };
-          counts[p.id] = schema.slides?.length ?? 0;
-        }
-      }
-      setSlideCounts(counts);
+      // Summary fields (slide count, thumbnail) live on the project records,
+      // so a single indexed query is enough for the whole gallery
+      setProjects(await getAllProjects());
     } catch {
       // DB not ready yet
     } finally {
@@ -57,39 +49,37 @@ export default function HomePage() {
     loadProjects();
   }, [loadProjects]);
 
+  // Indexed search over title, tags and slide text tokens
+  useEffect(() => {
+    if (!search.trim()) {
+      setMatchIds(null);
+      return;
+    }
+    let cancelled = false;
+    const timer = setTimeout(() => {
+      searchProjectIds(search).then((ids) => {
+        if (!cancelled) setMatchIds(ids);
+      });
+    }, SEARCH_DEBOUNCE_MS);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [search, projects]);
+
   const filteredProjects = useMemo(() => {
-    if (!search.trim()) return projects;
-    const q = search.toLowerCase();
-    return projects.filter((p) => p.title.toLowerCase().includes(q));
-  }, [projects, search]);
+    if (!search.trim() || !matchIds) return projects;
+    return projects.filter((p) => matchIds.has(p.id));
+  }, [projects, search, matchIds]);
 
   const handleCreate = async (title: string) => {
-    const id = crypto.randomUUID();
-    const now = new Date();
-    const schema = createEmptySchema(id);
-    schema.title = title;
-
-    await db.projects.add({
-      id,
-      title,
-      format: 'carousel',
-      createdAt: now,
-      updatedAt: now,
-    });
-    await db.projectData.add({
-      projectId: id,
-      schema,
-      version: SCHEMA_VERSION,
-    });
-
-    router.push(`/editor/${id}`);
+    const project = await createProject(title);
+    router.push(`/editor/${project.id}`);
   };
 
   const handleDelete = async () => {
     if (!deleteTarget) return;
-    await db.projects.delete(deleteTarget);
-    await db.projectData.delete(deleteTarget);
-    await db.assets.where('projectId').equals(deleteTarget).delete();
+    await deleteProject(deleteTarget);
     setDeleteTarget(null);
     loadProjects();
   };
@@ -157,16 +147,7 @@ export default function HomePage() {
 
             {/* Grid */}
             {filteredProjects.length > 0 ? (
-              <div className="grid grid-cols-2 gap-4 sm:grid-cols-3 md:grid-cols-4 lg:grid-cols-5">
-                {filteredProjects.map((project) => (
-                  <ProjectCard
-                    key={project.id}
-                    project={project}
-                    slideCount={slideCounts[project.id] ?? 0}
-                    onDelete={setDeleteTarget}
-                  />
-                ))}
-              </div>
+              <VirtualProjectGrid projects={filteredProjects} onDelete={setDeleteTarget} />
             ) : (
               <div className="flex flex-col items-center justify-center py-16 text-muted-foreground">
                 <p className="text-sm">Nenhum projeto encontrado para "{search}"</p>
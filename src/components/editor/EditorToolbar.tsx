@@ -6,7 +6,7 @@ import {
   ArrowLeft, Undo2, Redo2, Eye, EyeOff,
   LayoutGrid, GalleryHorizontalEnd, ZoomIn, ZoomOut,
   Download, Image as ImageIcon, FileArchive,
-  FileText, FileJson, Package, Copy,
+  FileText, FileJson, Package, Copy, X,
 } from 'lucide-react';
 import { Button } from '@/components/ui/button';
 import { Badge } from '@/components/ui/badge';
@@ -46,6 +46,8 @@ export interface EditorToolbarProps {
   onSetShowCounter: (show: boolean) => void;
   onExportSlide: () => void;
   onExportAll: () => void;
+  exportProgress?: { done: number; total: number } | null;
+  onCancelExport?: () => void;
   onExportMarkdown: () => void;
   onCopyMarkdown: () => void;
   onExportJson: () => void;
@@ -78,6 +80,8 @@ export function EditorToolbar({
   onSetShowCounter,
   onExportSlide,
   onExportAll,
+  exportProgress,
+  onCancelExport,
   onExportMarkdown,
   onCopyMarkdown,
   onExportJson,
@@ -279,6 +283,19 @@ export function EditorToolbar({
           {isSaving ? 'Salvando...' : 'Salvar'}
         </Button>
 
+        {/* Export progress — click to cancel */}
+        {exportProgress && (
+          <Tooltip>
+            <TooltipTrigger asChild>
+              <Button variant="ghost" size="sm" className="h-7 gap-1.5 text-xs tabular-nums" onClick={onCancelExport}>
+                <X className="size-3.5" />
+                {exportProgress.done}/{exportProgress.total}
+              </Button>
+            </TooltipTrigger>
+            <TooltipContent>Cancelar exportação</TooltipContent>
+          </Tooltip>
+        )}
+
         {/* Export */}
         <DropdownMenu>
           <DropdownMenuTrigger asChild>
@@ -293,7 +310,7 @@ export function EditorToolbar({
               <ImageIcon className="mr-2 size-4" />
               Slide atual (PNG)
             </DropdownMenuItem>
-            <DropdownMenuItem onClick={onExportAll}>
+            <DropdownMenuItem onClick={onExportAll} disabled={!!exportProgress}>
               <FileArchive className="mr-2 size-4" />
               Todos os slides (ZIP)
             </DropdownMenuItem>
@@ -1,17 +1,23 @@
 'use client';
 
-import { useState, useRef, useCallback, useEffect } from 'react';
+import { useState, useRef, useCallback, useEffect, useMemo } from 'react';
 import { ChevronLeft, ChevronRight, PanelLeftClose, PanelLeft } from 'lucide-react';
 import { Button } from '@/components/ui/button';
 import { SlideRenderer } from './SlideRenderer';
 import { LeftPanel } from './LeftPanel';
 import { RightPanel, BG_PSEUDO_ID } from './RightPanel';
+import { ProfiledRegion } from './RenderProfiler';
 import type { Slide, SlideElement, SlideLayout, Theme, ElementType } from '@/types/schema';
 import type { EditorState } from '@/types/editor';
+import { useSlideThumbnails } from '@/hooks/useSlideThumbnails';
+import { useNearViewport } from '@/hooks/useNearViewport';
 import { cn } from '@/lib/utils';
 
 const NOOP = () => {};
 const NOOP_UPDATE = () => {};
+const GRID_SCALE = 0.18;
+// The grid opens scrolled to the top; this many slides fill its first screen
+const GRID_SEED_COUNT = 16;
 
 export interface EditorActions {
   selectSlide: (i: number) => void;
@@ -44,7 +50,18 @@ export function EditorWorkspace({ state, actions, projectId }: EditorWorkspacePr
   const { slides, theme, footer, header } = carousel;
 
   const [leftPanelOpen, setLeftPanelOpen] = useState(true);
+  const thumbnails = useSlideThumbnails(carousel, projectId);
   const canvasRef = useRef<HTMLDivElement>(null);
+  // Only slides in or near the visible part of the canvas mount a live
+  // renderer; the others show their cached thumbnail. The first paint of each
+  // view mounts the slides it opens on, before the observer reports.
+  const slideIds = useMemo(() => slides.map((slide) => slide.id), [slides]);
+  const { setRoot: setWindowRoot, observe: observeSlide, nearIds } = useNearViewport(
+    slideIds,
+    viewMode === 'grid'
+      ? { around: 0, radius: GRID_SEED_COUNT - 1, key: viewMode }
+      : { around: selectedSlideIndex, key: viewMode },
+  );
   const editingTextRef = useRef<string | null>(null);
 
   const currentSlide = slides[selectedSlideIndex];
@@ -69,39 +86,49 @@ export function EditorWorkspace({ state, actions, projectId }: EditorWorkspacePr
     if (canGoNext) actions.selectSlide(selectedSlideIndex + 1);
   }, [canGoNext, selectedSlideIndex, actions]);
 
+  // Latest selection, read by the element callbacks below so they keep a
+  // stable identity across selection changes and edits. Memoized slides and
+  // panels then only re-render when their own props change.
+  const selectedSlideIndexRef = useRef(selectedSlideIndex);
+  selectedSlideIndexRef.current = selectedSlideIndex;
+  const selectedElementIdRef = useRef(selectedElementId);
+  selectedElementIdRef.current = selectedElementId;
+  const currentSlideRef = useRef(currentSlide);
+  currentSlideRef.current = currentSlide;
+
   // Element callbacks scoped to current slide
   const handleUpdateElement = useCallback(
     (elementId: string, element: SlideElement) => {
-      actions.updateElement(selectedSlideIndex, elementId, element);
+      actions.updateElement(selectedSlideIndexRef.current, elementId, element);
     },
-    [selectedSlideIndex, actions]
+    [actions]
   );
 
   const handleDeleteElement = useCallback(
     (elementId: string) => {
-      actions.deleteElement(selectedSlideIndex, elementId);
+      actions.deleteElement(selectedSlideIndexRef.current, elementId);
     },
-    [selectedSlideIndex, actions]
+    [actions]
   );
 
   const handleDuplicateElement = useCallback(
     (elementId: string) => {
-      actions.duplicateElement(selectedSlideIndex, elementId);
+      actions.duplicateElement(selectedSlideIndexRef.current, elementId);
     },
-    [selectedSlideIndex, actions]
+    [actions]
   );
 
 
   const handleReorderElement = useCallback(
     (elementId: string, newIndex: number) => {
-      actions.reorderElement(selectedSlideIndex, elementId, newIndex);
+      actions.reorderElement(selectedSlideIndexRef.current, elementId, newIndex);
     },
-    [selectedSlideIndex, actions]
+    [actions]
   );
 
   const handleChangeElementType = useCallback(
     (elementId: string, newType: ElementType, newLevel?: number) => {
-      const element = currentSlide?.elements.find((el) => el.id === elementId);
+      const element = currentSlideRef.current?.elements.find((el) => el.id === elementId);
       if (!element) return;
 
       const content = 'content' in element ? (element as { content: string }).content : '';
@@ -140,44 +167,44 @@ export function EditorWorkspace({ state, actions, projectId }: EditorWorkspacePr
       if (element.rotation !== undefined) newElement.rotation = element.rotation;
       if (element.zIndex !== undefined) newElement.zIndex = element.zIndex;
 
-      actions.updateElement(selectedSlideIndex, elementId, newElement);
+      actions.updateElement(selectedSlideIndexRef.current, elementId, newElement);
     },
-    [currentSlide, selectedSlideIndex, actions]
+    [actions]
   );
 
   const handleAddElement = useCallback(
     (element: SlideElement) => {
-      actions.addElement(selectedSlideIndex, selectedElementId, element);
+      actions.addElement(selectedSlideIndexRef.current, selectedElementIdRef.current, element);
     },
-    [selectedSlideIndex, selectedElementId, actions]
+    [actions]
   );
 
   const handleSetSlideBg = useCallback(
     (color: string | undefined) => {
-      actions.setSlideBg(selectedSlideIndex, color);
+      actions.setSlideBg(selectedSlideIndexRef.current, color);
     },
-    [selectedSlideIndex, actions]
+    [actions]
   );
 
   const handleSetSlideBgImage = useCallback(
     (src: string | undefined) => {
-      actions.setSlideBgImage(selectedSlideIndex, src);
+      actions.setSlideBgImage(selectedSlideIndexRef.current, src);
     },
-    [selectedSlideIndex, actions]
+    [actions]
   );
 
   const handleSetSlideBgPosition = useCallback(
     (pos: string | undefined) => {
-      actions.setSlideBgPosition(selectedSlideIndex, pos);
+      actions.setSlideBgPosition(selectedSlideIndexRef.current, pos);
     },
-    [selectedSlideIndex, actions]
+    [actions]
   );
 
   const handleSetSlideLayout = useCallback(
     (layout: SlideLayout, elementUpdates?: Record<string, Partial<SlideElement>>) => {
-      actions.setSlideLayout(selectedSlideIndex, layout, elementUpdates);
+      actions.setSlideLayout(selectedSlideIndexRef.current, layout, elementUpdates);
     },
-    [selectedSlideIndex, actions]
+    [actions]
   );
 
   // Arrow key navigation between slides
@@ -252,33 +279,52 @@ export function EditorWorkspace({ state, actions, projectId }: EditorWorkspacePr
     return () => window.removeEventListener('keydown', handleKeyDown);
   }, [goPrev, goNext, selectedElementId, isPreviewMode, handleDeleteElement, handleDuplicateElement, handleUpdateElement, currentSlide, actions]);
 
-  // Grid view: render all slides
+  // Stand-in for an unmounted slide, same size as the live renderer
+  const renderSlidePlaceholder = (slide: Slide, scale: number) => (
+    <div
+      className="overflow-hidden"
+      style={{ width: 1080 * scale, height: 1440 * scale, background: slide.background ?? theme.colors.background }}
+    >
+      {thumbnails[slide.id] && (
+        <img src={thumbnails[slide.id]} alt="" draggable={false} className="size-full object-cover" />
+      )}
+    </div>
+  );
+
+  // Grid view: live renderers for slides near the viewport, thumbnails elsewhere
   const renderGridView = () => (
     <div className="flex flex-wrap gap-6 p-6">
       {slides.map((slide, idx) => (
         <div
           key={slide.id}
+          ref={observeSlide(slide.id)}
           className={cn(
             'cursor-pointer rounded-lg transition-all hover:ring-2 hover:ring-primary/40',
             idx === selectedSlideIndex && 'ring-2 ring-primary'
           )}
           onClick={() => actions.selectSlide(idx)}
         >
-          <SlideRenderer
-            slide={slide}
-            theme={theme}
-            footer={footer.text}
-            handle={header.handle}
-            showCounter={header.showCounter}
-            slideNumber={idx + 1}
-            totalSlides={totalSlides}
-            isEditing={false}
-            selectedElementId={null}
-            onSelectElement={NOOP}
-            onUpdateElement={NOOP_UPDATE}
-            scale={0.18}
-            projectId={projectId}
-          />
+          {nearIds.has(slide.id) ? (
+            <ProfiledRegion id={`slide:${idx + 1}`}>
+              <SlideRenderer
+                slide={slide}
+                theme={theme}
+                footer={footer.text}
+                handle={header.handle}
+                showCounter={header.showCounter}
+                slideNumber={idx + 1}
+                totalSlides={totalSlides}
+                isEditing={false}
+                selectedElementId={null}
+                onSelectElement={NOOP}
+                onUpdateElement={NOOP_UPDATE}
+                scale={GRID_SCALE}
+                projectId={projectId}
+              />
+            </ProfiledRegion>
+          ) : (
+            renderSlidePlaceholder(slide, GRID_SCALE)
+          )}
         </div>
       ))}
     </div>
@@ -301,7 +347,7 @@ export function EditorWorkspace({ state, actions, projectId }: EditorWorkspacePr
     const offsetX = selectedSlideIndex * (slideW + gap) + slideW / 2;
 
     return (
-      <div className="relative flex flex-1 items-center overflow-hidden">
+      <div ref={setWindowRoot} className="relative flex flex-1 items-center overflow-hidden">
         {/* Navigation arrows */}
         {canGoPrev && (
           <Button
@@ -341,6 +387,7 @@ export function EditorWorkspace({ state, actions, projectId }: EditorWorkspacePr
             return (
               <div
                 key={slide.id}
+                ref={observeSlide(slide.id)}
                 className={cn(
                   'flex-shrink-0 transition-all duration-200',
                   isActive
@@ -349,27 +396,33 @@ export function EditorWorkspace({ state, actions, projectId }: EditorWorkspacePr
                 )}
                 onClick={() => { if (!isActive) actions.selectSlide(idx); }}
               >
-                <SlideRenderer
-                  slide={slide}
-                  theme={theme}
-                  footer={footer.text}
-                  handle={header.handle}
-                  showCounter={header.showCounter}
-                  slideNumber={idx + 1}
-                  totalSlides={totalSlides}
-                  isEditing={isActive && !isPreviewMode}
-                  selectedElementId={isActive ? rendererElementId : null}
-                  onSelectElement={isActive ? actions.selectElement : NOOP}
-                  onUpdateElement={isActive ? handleUpdateElement : NOOP_UPDATE}
-                  onChangeElementType={isActive ? handleChangeElementType : undefined}
-                  onDeleteElement={isActive ? handleDeleteElement : undefined}
-                  onDuplicateElement={isActive ? handleDuplicateElement : undefined}
-                  onUpdateSlideBgPosition={isActive ? handleSetSlideBgPosition : undefined}
-                  onSetSlideLayout={isActive ? handleSetSlideLayout : undefined}
-                  onEditingTextChange={handleEditingTextChange}
-                  scale={slideScale}
-                  projectId={projectId}
-                />
+                {isActive || nearIds.has(slide.id) ? (
+                  <ProfiledRegion id={`slide:${idx + 1}`}>
+                    <SlideRenderer
+                      slide={slide}
+                      theme={theme}
+                      footer={footer.text}
+                      handle={header.handle}
+                      showCounter={header.showCounter}
+                      slideNumber={idx + 1}
+                      totalSlides={totalSlides}
+                      isEditing={isActive && !isPreviewMode}
+                      selectedElementId={isActive ? rendererElementId : null}
+                      onSelectElement={isActive ? actions.selectElement : NOOP}
+                      onUpdateElement={isActive ? handleUpdateElement : NOOP_UPDATE}
+                      onChangeElementType={isActive ? handleChangeElementType : undefined}
+                      onDeleteElement={isActive ? handleDeleteElement : undefined}
+                      onDuplicateElement={isActive ? handleDuplicateElement : undefined}
+                      onUpdateSlideBgPosition={isActive ? handleSetSlideBgPosition : undefined}
+                      onSetSlideLayout={isActive ? handleSetSlideLayout : undefined}
+                      onEditingTextChange={handleEditingTextChange}
+                      scale={slideScale}
+                      projectId={projectId}
+                    />
+                  </ProfiledRegion>
+                ) : (
+                  renderSlidePlaceholder(slide, slideScale)
+                )}
               </div>
             );
           })}
@@ -388,22 +441,25 @@ export function EditorWorkspace({ state, actions, projectId }: EditorWorkspacePr
         )}
       >
         {leftPanelOpen && (
-          <LeftPanel
-            slides={slides}
-            selectedSlideIndex={selectedSlideIndex}
-            selectedElementId={selectedElementId}
-            theme={theme}
-            footer={footer.text}
-            handle={header.handle}
-            showCounter={header.showCounter}
-            isPreviewMode={isPreviewMode}
-            onSelectSlide={actions.selectSlide}
-            onAddSlide={actions.addSlide}
-            onDeleteSlide={actions.deleteSlide}
-            onDuplicateSlide={actions.duplicateSlide}
-            onMoveSlide={actions.moveSlide}
-            onAddElement={handleAddElement}
-          />
+          <ProfiledRegion id="panel:left">
+            <LeftPanel
+              slides={slides}
+              selectedSlideIndex={selectedSlideIndex}
+              selectedElementId={selectedElementId}
+              theme={theme}
+              footer={footer.text}
+              handle={header.handle}
+              showCounter={header.showCounter}
+              isPreviewMode={isPreviewMode}
+              thumbnails={thumbnails}
+              onSelectSlide={actions.selectSlide}
+              onAddSlide={actions.addSlide}
+              onDeleteSlide={actions.deleteSlide}
+              onDuplicateSlide={actions.duplicateSlide}
+              onMoveSlide={actions.moveSlide}
+              onAddElement={handleAddElement}
+            />
+          </ProfiledRegion>
         )}
       </div>
 
@@ -420,7 +476,7 @@ export function EditorWorkspace({ state, actions, projectId }: EditorWorkspacePr
       </div>
 
       {/* Center canvas */}
-      <div className="editor-canvas flex flex-1 flex-col overflow-auto">
+      <div ref={viewMode === 'grid' ? setWindowRoot : undefined} className="editor-canvas flex flex-1 flex-col overflow-auto">
         {viewMode === 'grid' ? renderGridView() : renderHorizontalView()}
 
         {/* Slide counter */}
@@ -436,24 +492,26 @@ export function EditorWorkspace({ state, actions, projectId }: EditorWorkspacePr
       {/* Right Panel */}
       <div className="editor-panel hidden w-80 flex-shrink-0 border-l border-border/40 lg:block">
         {currentSlide && (
-          <RightPanel
-            slide={currentSlide}
-            slideIndex={selectedSlideIndex}
-            selectedElementId={selectedElementId}
-            theme={theme}
-            onSelectElement={actions.selectElement}
-            onUpdateElement={handleUpdateElement}
-            onDeleteElement={handleDeleteElement}
-            onReorderElement={handleReorderElement}
-            onChangeElementType={handleChangeElementType}
-            onSetTheme={actions.setTheme}
-            onSetSlideBg={handleSetSlideBg}
-            slideBgImage={currentSlide?.backgroundImage ?? undefined}
-            onSetSlideBgImage={handleSetSlideBgImage}
-            slideBgPosition={currentSlide?.backgroundPosition}
-            onSetSlideBgPosition={handleSetSlideBgPosition}
-            projectId={projectId}
-          />
+          <ProfiledRegion id="panel:right">
+            <RightPanel
+              slide={currentSlide}
+              slideIndex={selectedSlideIndex}
+              selectedElementId={selectedElementId}
+              theme={theme}
+              onSelectElement={actions.selectElement}
+              onUpdateElement={handleUpdateElement}
+              onDeleteElement={handleDeleteElement}
+              onReorderElement={handleReorderElement}
+              onChangeElementType={handleChangeElementType}
+              onSetTheme={actions.setTheme}
+              onSetSlideBg={handleSetSlideBg}
+              slideBgImage={currentSlide?.backgroundImage ?? undefined}
+              onSetSlideBgImage={handleSetSlideBgImage}
+              slideBgPosition={currentSlide?.backgroundPosition}
+              onSetSlideBgPosition={handleSetSlideBgPosition}
+              projectId={projectId}
+            />
+          </ProfiledRegion>
         )}
       </div>
     </div>
@@ -17,7 +17,8 @@ interface FreeformElementProps {
   onSelect: () => void;
   onEnterTextEdit?: () => void;
   onUpdate: (element: SlideElement) => void;
-  otherElements?: SlideElement[];
+  /** Returns the slide's elements; read once when a drag starts */
+  getOtherElements?: () => SlideElement[];
   onGuidesChange?: (guides: GuideLine[]) => void;
   children: React.ReactNode;
 }
@@ -32,7 +33,7 @@ export function FreeformElement({
   onSelect,
   onEnterTextEdit,
   onUpdate,
-  otherElements,
+  getOtherElements,
   onGuidesChange,
   children,
 }: FreeformElementProps) {
@@ -42,7 +43,7 @@ export function FreeformElement({
     element,
     scale,
     onUpdate,
-    otherElements,
+    getOtherElements,
     onGuidesChange,
   });
 
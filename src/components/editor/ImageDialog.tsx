@@ -2,8 +2,10 @@
 
 import { useState, useRef } from 'react';
 import { Upload, Link } from 'lucide-react';
-import { saveAsset } from '@/lib/projects';
-import { useAssetContext } from '@/lib/asset-urls';
+import { useLiveQuery } from 'dexie-react-hooks';
+import { ingestImage, KEEP_ORIGINAL_IMAGES_SETTING } from '@/lib/asset-ingest';
+import { getSetting, setSetting } from '@/lib/settings';
+import { useAssetContext, useResolvedUrl } from '@/lib/asset-urls';
 import {
   Dialog,
   DialogContent,
@@ -25,10 +27,11 @@ interface ImageDialogProps {
 export function ImageDialog({ open, onOpenChange, onImageSelected, currentSrc, projectId }: ImageDialogProps) {
   const [urlInput, setUrlInput] = useState('');
   const fileInputRef = useRef<HTMLInputElement>(null);
-  const { resolveUrl, registerAssetUrl } = useAssetContext();
+  const { registerAssetUrl } = useAssetContext();
+  const keepOriginal = useLiveQuery(() => getSetting(KEEP_ORIGINAL_IMAGES_SETTING, false), [], false);
 
   const rawPreviewSrc = urlInput.trim() || currentSrc;
-  const previewSrc = rawPreviewSrc ? resolveUrl(rawPreviewSrc) : undefined;
+  const previewSrc = useResolvedUrl(rawPreviewSrc);
 
   function handleUseUrl() {
     const trimmed = urlInput.trim();
@@ -42,10 +45,9 @@ export function ImageDialog({ open, onOpenChange, onImageSelected, currentSrc, p
   async function handleFileChange(e: React.ChangeEvent<HTMLInputElement>) {
     const file = e.target.files?.[0];
     if (file) {
-      const filename = `assets/${Date.now()}-${file.name.replace(/[^a-zA-Z0-9._-]/g, '_')}`;
-      await saveAsset(projectId, filename, file);
-      registerAssetUrl(filename, file);
-      onImageSelected(filename);
+      const asset = await ingestImage(projectId, file, { keepOriginal });
+      registerAssetUrl(asset.filename, asset.blob);
+      onImageSelected(asset.filename);
       setUrlInput('');
       onOpenChange(false);
     }
@@ -118,6 +120,15 @@ export function ImageDialog({ open, onOpenChange, onImageSelected, currentSrc, p
               <Upload className="size-4" />
               Escolher arquivo
             </Button>
+            <label className="mt-2 flex items-center gap-2 text-xs text-muted-foreground">
+              <input
+                type="checkbox"
+                checked={keepOriginal}
+                onChange={(e) => setSetting(KEEP_ORIGINAL_IMAGES_SETTING, e.target.checked)}
+                className="size-3.5 accent-primary"
+              />
+              Guardar também o arquivo original (imagens grandes são reduzidas)
+            </label>
           </div>
 
           {/* Image preview */}
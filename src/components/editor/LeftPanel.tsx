@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, useCallback, useRef } from 'react';
+import { useState, useCallback, useRef, memo } from 'react';
 import {
   Plus,
   Copy,
@@ -41,6 +41,8 @@ interface LeftPanelProps {
   handle: string;
   showCounter?: boolean;
   isPreviewMode: boolean;
+  /** Cached thumbnail URLs by slide id; slides without one render live */
+  thumbnails?: Record<string, string>;
   onSelectSlide: (index: number) => void;
   onAddSlide: (afterIndex: number, slide: Slide) => void;
   onDeleteSlide: (index: number) => void;
@@ -49,6 +51,8 @@ interface LeftPanelProps {
   onAddElement: (element: SlideElement) => void;
 }
 
+const THUMBNAIL_SCALE = 0.155;
+
 // ─── Element button definitions ─────────────────────────────
 
 interface ElementButtonDef {
@@ -144,7 +148,7 @@ function instantiateTemplate(template: Omit<Slide, 'id'>): Slide {
 
 // ─── Component ──────────────────────────────────────────────
 
-export function LeftPanel({
+function LeftPanelComponent({
   slides,
   selectedSlideIndex,
   selectedElementId,
@@ -153,6 +157,7 @@ export function LeftPanel({
   handle,
   showCounter,
   isPreviewMode,
+  thumbnails,
   onSelectSlide,
   onAddSlide,
   onDeleteSlide,
@@ -280,20 +285,30 @@ export function LeftPanel({
 
                   {/* Thumbnail preview */}
                   <div className="overflow-hidden rounded-md">
-                    <SlideRenderer
-                      slide={slide}
-                      theme={theme}
-                      footer={footer}
-                      handle={handle}
-                      showCounter={showCounter}
-                      slideNumber={idx + 1}
-                      totalSlides={totalSlides}
-                      isEditing={false}
-                      selectedElementId={null}
-                      onSelectElement={() => {}}
-                      onUpdateElement={() => {}}
-                      scale={0.155}
-                    />
+                    {thumbnails?.[slide.id] ? (
+                      <img
+                        src={thumbnails[slide.id]}
+                        alt={`Slide ${idx + 1}`}
+                        draggable={false}
+                        className="block"
+                        style={{ width: 1080 * THUMBNAIL_SCALE, height: 1440 * THUMBNAIL_SCALE }}
+                      />
+                    ) : (
+                      <SlideRenderer
+                        slide={slide}
+                        theme={theme}
+                        footer={footer}
+                        handle={handle}
+                        showCounter={showCounter}
+                        slideNumber={idx + 1}
+                        totalSlides={totalSlides}
+                        isEditing={false}
+                        selectedElementId={null}
+                        onSelectElement={() => {}}
+                        onUpdateElement={() => {}}
+                        scale={THUMBNAIL_SCALE}
+                      />
+                    )}
                   </div>
 
                   {/* Slide number badge */}
@@ -430,3 +445,5 @@ export function LeftPanel({
     </TooltipProvider>
   );
 }
+
+export const LeftPanel = memo(LeftPanelComponent);
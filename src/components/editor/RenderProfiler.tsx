@@ -0,0 +1,138 @@
+'use client';
+
+import { Profiler, useEffect, useSyncExternalStore } from 'react';
+import type { ProfilerOnRenderCallback, ReactNode } from 'react';
+import { X } from 'lucide-react';
+import {
+  PROFILER_AVAILABLE,
+  getActionStats,
+  getProfilerSnapshot,
+  getRegionStats,
+  measureElementRender,
+  recordCommit,
+  recordRender,
+  resetProfiler,
+  setProfilerEnabled,
+  subscribeProfiler,
+} from '@/lib/render-profiler';
+
+const MAX_ROWS = 12;
+
+const onRegionRender: ProfilerOnRenderCallback = (id, _phase, actualDuration) => {
+  recordRender(id, actualDuration);
+};
+
+const onRootRender: ProfilerOnRenderCallback = (id, _phase, actualDuration) => {
+  recordRender(id, actualDuration);
+  recordCommit(actualDuration);
+};
+
+/**
+ * Measures its subtree with React's <Profiler> in development builds; renders
+ * the children directly in production. The `root` region also counts commits
+ * per dispatched action.
+ */
+export function ProfiledRegion({ id, root, children }: { id: string; root?: boolean; children: ReactNode }) {
+  if (!PROFILER_AVAILABLE) return <>{children}</>;
+  return (
+    <Profiler id={id} onRender={root ? onRootRender : onRegionRender}>
+      {children}
+    </Profiler>
+  );
+}
+
+/**
+ * Rendered as the last child of an element view, after the view called
+ * markElementRender: closes the element's render span. Elements are timed
+ * this way because a <Profiler> around each one would cost more than the
+ * elements themselves.
+ */
+export function ElementRenderEnd({ id }: { id: string }) {
+  measureElementRender(id);
+  return null;
+}
+
+const getServerSnapshot = () => getProfilerSnapshot();
+
+/**
+ * Development overlay with commits per action and render time per region.
+ * Toggle with Alt+Shift+P.
+ */
+export function RenderProfilerPanel() {
+  const { enabled } = useSyncExternalStore(subscribeProfiler, getProfilerSnapshot, getServerSnapshot);
+
+  useEffect(() => {
+    if (!PROFILER_AVAILABLE) return;
+    function handleKeyDown(e: KeyboardEvent) {
+      if (e.altKey && e.shiftKey && e.code === 'KeyP') {
+        e.preventDefault();
+        setProfilerEnabled(!getProfilerSnapshot().enabled);
+      }
+    }
+    window.addEventListener('keydown', handleKeyDown);
+    return () => window.removeEventListener('keydown', handleKeyDown);
+  }, []);
+
+  if (!PROFILER_AVAILABLE || !enabled) return null;
+
+  const actions = getActionStats().sort((a, b) => b[1].commits - a[1].commits).slice(0, MAX_ROWS);
+  const regions = getRegionStats().sort((a, b) => b[1].totalMs - a[1].totalMs).slice(0, MAX_ROWS);
+
+  return (
+    <div className="fixed bottom-4 left-4 z-[9999] w-96 rounded-lg border border-border/60 bg-popover/95 p-3 font-mono text-[11px] text-popover-foreground shadow-lg backdrop-blur-sm">
+      <div className="mb-2 flex items-center justify-between">
+        <span className="font-sans text-xs font-semibold">Render profiler</span>
+        <div className="flex items-center gap-2">
+          <button type="button" className="text-muted-foreground hover:text-foreground" onClick={resetProfiler}>
+            Limpar
+          </button>
+          <button type="button" className="text-muted-foreground hover:text-foreground" onClick={() => setProfilerEnabled(false)}>
+            <X className="size-3.5" />
+          </button>
+        </div>
+      </div>
+
+      <table className="mb-3 w-full">
+        <thead className="text-muted-foreground">
+          <tr>
+            <th className="text-left font-normal">Ação</th>
+            <th className="text-right font-normal">disp.</th>
+            <th className="text-right font-normal">commits</th>
+            <th className="text-right font-normal">ms</th>
+          </tr>
+        </thead>
+        <tbody>
+          {actions.map(([type, stats]) => (
+            <tr key={type}>
+              <td className="truncate">{type}</td>
+              <td className="text-right tabular-nums">{stats.dispatches}</td>
+              <td className="text-right tabular-nums">{stats.commits}</td>
+              <td className="text-right tabular-nums">{stats.commitMs.toFixed(1)}</td>
+            </tr>
+          ))}
+        </tbody>
+      </table>
+
+      <table className="w-full">
+        <thead className="text-muted-foreground">
+          <tr>
+            <th className="text-left font-normal">Região</th>
+            <th className="text-right font-normal">renders</th>
+            <th className="text-right font-normal">total ms</th>
+            <th className="text-right font-normal">máx</th>
+          </tr>
+        </thead>
+        <tbody>
+          {regions.map(([id, stats]) => (
+            <tr key={id}>
+              <td className="max-w-40 truncate">{id}</td>
+              <td className="text-right tabular-nums">{stats.renders}</td>
+              <td className="text-right tabular-nums">{stats.totalMs.toFixed(1)}</td>
+              <td className="text-right tabular-nums">{stats.maxMs.toFixed(1)}</td>
+            </tr>
+          ))}
+        </tbody>
+      </table>
+    </div>
+  );
+}
@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, useMemo, useCallback, useRef } from 'react';
+import { useState, useMemo, useCallback, useRef, memo } from 'react';
 import {
   Type,
   Heading1,
@@ -60,8 +60,8 @@ import type {
   DividerElement,
 } from '@/types/schema';
 import { cn } from '@/lib/utils';
-import { useAssetContext } from '@/lib/asset-urls';
-import { saveAsset } from '@/lib/projects';
+import { useAssetContext, useResolvedUrl } from '@/lib/asset-urls';
+import { ingestImage } from '@/lib/asset-ingest';
 
 export const BG_PSEUDO_ID = '__bg__';
 
@@ -374,19 +374,18 @@ function ImageProperties({
   projectId: string;
 }) {
   const fileInputRef = useRef<HTMLInputElement>(null);
-  const { resolveUrl, registerAssetUrl } = useAssetContext();
+  const { registerAssetUrl } = useAssetContext();
 
   const handleFileUpload = useCallback(async (e: React.ChangeEvent<HTMLInputElement>) => {
     const file = e.target.files?.[0];
     if (!file) return;
-    const filename = `assets/${Date.now()}-${file.name.replace(/[^a-zA-Z0-9._-]/g, '_')}`;
-    await saveAsset(projectId, filename, file);
-    registerAssetUrl(filename, file);
-    onUpdate({ ...element, src: filename } as SlideElement);
+    const asset = await ingestImage(projectId, file);
+    registerAssetUrl(asset.filename, asset.blob);
+    onUpdate({ ...element, src: asset.filename } as SlideElement);
     if (fileInputRef.current) fileInputRef.current.value = '';
   }, [element, onUpdate, registerAssetUrl]);
 
-  const previewSrc = element.src ? resolveUrl(element.src) : undefined;
+  const previewSrc = useResolvedUrl(element.src);
 
   return (
     <>
@@ -512,7 +511,7 @@ function SlideBackgroundSection({
   onSetSlideBgPosition: (pos: string | undefined) => void;
   projectId: string;
 }) {
-  const { resolveUrl, registerAssetUrl } = useAssetContext();
+  const { registerAssetUrl } = useAssetContext();
   const bgFileRef = useRef<HTMLInputElement>(null);
   const detectedMode = detectBgMode(slideBg, slideBgImage);
   const [userMode, setUserMode] = useState<BgMode | null>(null);
@@ -546,14 +545,13 @@ function SlideBackgroundSection({
   const handleBgFileUpload = useCallback(async (e: React.ChangeEvent<HTMLInputElement>) => {
     const file = e.target.files?.[0];
     if (!file) return;
-    const filename = `assets/${Date.now()}-${file.name.replace(/[^a-zA-Z0-9._-]/g, '_')}`;
-    await saveAsset(projectId, filename, file);
-    registerAssetUrl(filename, file);
-    onSetSlideBgImage(filename);
+    const asset = await ingestImage(projectId, file);
+    registerAssetUrl(asset.filename, asset.blob);
+    onSetSlideBgImage(asset.filename);
     if (bgFileRef.current) bgFileRef.current.value = '';
   }, [projectId, registerAssetUrl, onSetSlideBgImage]);
 
-  const resolvedBgSrc = slideBgImage ? resolveUrl(slideBgImage) : null;
+  const resolvedBgSrc = useResolvedUrl(slideBgImage) ?? null;
 
   // Determine the visual preview swatch
   const previewBg = mode === 'theme' ? theme.colors.background
@@ -1242,7 +1240,7 @@ function ElementProperties({
 
 // ─── Main Component ─────────────────────────────────────────
 
-export function RightPanel({
+function RightPanelComponent({
   slide,
   slideIndex: _slideIndex,
   selectedElementId,
@@ -1447,3 +1445,5 @@ export function RightPanel({
     </Tabs>
   );
 }
+
+export const RightPanel = memo(RightPanelComponent);
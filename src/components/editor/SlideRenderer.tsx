@@ -2,16 +2,18 @@
 
 import React, { useState, useCallback, useRef, useEffect, useMemo, memo } from 'react';
 import { Copy, Trash2, Image, LayoutGrid, Move } from 'lucide-react';
-import type { Slide, SlideElement, SlideLayout, Theme, ElementType, OverlayElement, HighlightElement, QuoteElement, ListItemElement, DividerElement, ImageElement } from '@/types/schema';
+import type { Slide, SlideElement, SlideLayout, Theme, ElementType, OverlayElement, HighlightElement, QuoteElement, ListItemElement, DividerElement, ImageElement, EmojiElement } from '@/types/schema';
 import type { GuideLine } from '@/hooks/useSmartGuides';
 import { themeToCSVars } from '@/lib/theme-utils';
-import { useAssetContext } from '@/lib/asset-urls';
+import { useAssetContext, useResolvedUrl } from '@/lib/asset-urls';
 import { ImageDialog } from './ImageDialog';
 import { EmojiPicker } from './EmojiPicker';
 import { IconPicker } from './IconPicker';
 import { SelectionToolbar } from './SelectionToolbar';
 import { FreeformElement } from './FreeformElement';
 import { SmartGuideOverlay } from './SmartGuideOverlay';
+import { ElementRenderEnd } from './RenderProfiler';
+import { PROFILER_AVAILABLE, markElementRender } from '@/lib/render-profiler';
 import { cn } from '@/lib/utils';
 
 // ─── EditableText ────────────────────────────────────────────
@@ -123,13 +125,20 @@ function themeToStyle(vars: Record<string, string>): React.CSSProperties {
 // Style overrides that must be applied DIRECTLY on inner elements (h1, h2, p, .tag, .sub, etc.)
 // because slide.css rules like `.slide h2 { font-size: 56px }` have higher specificity than
 // inherited values from a parent wrapper div.
+// Cached per element object: elements are replaced, never mutated, so an
+// unchanged element keeps handing out the same style object.
+const inlineStyleCache = new WeakMap<SlideElement, React.CSSProperties>();
+
 function getElementInlineStyle(element: SlideElement): React.CSSProperties {
+  const cached = inlineStyleCache.get(element);
+  if (cached) return cached;
   const style: React.CSSProperties = {};
   if (element.fontSize !== undefined) style.fontSize = `${element.fontSize}px`;
   if (element.fontFamily) style.fontFamily = `'${element.fontFamily}', sans-serif`;
   if (element.fontWeight !== undefined) style.fontWeight = element.fontWeight;
   if (element.color) style.color = element.color;
   if (element.textAlign) style.textAlign = element.textAlign;
+  inlineStyleCache.set(element, style);
   return style;
 }
 
@@ -234,6 +243,496 @@ function ElementWrapper({
   );
 }
 
+// ─── Element Views ───────────────────────────────────────────
+// Each element renders through its own memoized component that receives only
+// its own slice of state (the element object plus a few derived booleans) and
+// a handlers object that stays the same for the renderer's lifetime. Editing
+// one element re-renders that element, not every element on the slide.
+
+interface ElementHandlers {
+  select: (elementId: string) => void;
+  enterTextEdit: (elementId: string) => void;
+  textBlur: (elementId: string, e: React.FocusEvent<HTMLElement>) => void;
+  keyDown: (e: React.KeyboardEvent<HTMLElement>) => void;
+  update: (elementId: string, element: SlideElement) => void;
+  duplicate: (elementId: string) => void;
+  remove: (elementId: string) => void;
+  imageClick: (elementId: string) => void;
+  imageDoubleClick: (elementId: string) => void;
+  imageDragStart: (elementId: string, e: React.MouseEvent) => void;
+  fileDrop: (elementId: string, e: React.DragEvent) => void;
+  guidesChange: (guides: GuideLine[]) => void;
+  getElements: () => SlideElement[];
+}
+
+interface ElementViewProps {
+  element: SlideElement;
+  isEditing: boolean;
+  isSelected: boolean;
+  isTextEditing: boolean;
+  isCropping: boolean;
+  isDraggingImage: boolean;
+  canDuplicate: boolean;
+  canDelete: boolean;
+  handlers: ElementHandlers;
+}
+
+interface ElementContentProps extends ElementViewProps {
+  /** Resolved URL of an image element's src */
+  imageUrl?: string;
+}
+
+/** Resolved URL of an image element; each view subscribes to its own asset */
+function useElementImageUrl(element: SlideElement): string | undefined {
+  return useResolvedUrl(element.type === 'image' ? element.src : null);
+}
+
+const TEXT_TYPES = new Set<ElementType>(['tag', 'heading', 'paragraph', 'subtitle', 'quote', 'list-item', 'highlight']);
+
+function ImagePlaceholder({ element, isEditing, handlers }: Pick<ElementViewProps, 'element' | 'isEditing' | 'handlers'>) {
+  return (
+    <div
+      className="flex flex-col items-center justify-center gap-3 text-muted-foreground cursor-pointer"
+      style={{ width: '100%', height: '100%', background: 'rgba(255,255,255,0.05)', border: '2px dashed rgba(255,255,255,0.15)' }}
+      onClick={() => handlers.imageClick(element.id)}
+      onDragOver={(e) => { e.preventDefault(); e.stopPropagation(); }}
+      onDrop={(e) => handlers.fileDrop(element.id, e)}
+    >
+      {isEditing && (
+        <>
+          <Image className="size-8 opacity-40" />
+          <span style={{ fontSize: 24 }}>Clique ou arraste uma imagem</span>
+        </>
+      )}
+    </div>
+  );
+}
+
+function ReplaceImageButton({ element, handlers }: Pick<ElementViewProps, 'element' | 'handlers'>) {
+  return (
+    <button
+      type="button"
+      className="absolute bottom-2 right-2 rounded bg-card/80 px-2 py-1 text-xs text-muted-foreground opacity-0 shadow backdrop-blur transition-opacity group-hover/el:opacity-100"
+      onClick={(e) => {
+        e.stopPropagation();
+        handlers.imageClick(element.id);
+      }}
+      data-editor-control
+    >
+      Trocar
+    </button>
+  );
+}
+
+function ListItemIcon({ element, isEditing, handlers }: Pick<ElementViewProps, 'isEditing' | 'handlers'> & { element: ListItemElement }) {
+  const size = element.iconSize ?? 48;
+  if (isEditing) {
+    return (
+      <IconPicker
+        trigger={
+          element.icon?.startsWith('http') ? (
+            <img className="icon cursor-pointer" src={element.icon} alt="Icone" title="Trocar icone" draggable={false} style={{ width: size, height: size }} />
+          ) : (
+            <span className="list-icon cursor-pointer" title="Trocar icone" style={{ width: size, height: size, ...(element.iconColor ? { color: element.iconColor } : {}) }}>
+              {element.icon || '\u25CF'}
+            </span>
+          )
+        }
+        onIconSelected={(icon) => handlers.update(element.id, { ...element, icon })}
+      />
+    );
+  }
+  return element.icon?.startsWith('http') ? (
+    <img className="icon" src={element.icon} alt="Icone" draggable={false} style={{ width: size, height: size }} />
+  ) : (
+    <span className="list-icon" style={{ width: size, height: size, ...(element.iconColor ? { color: element.iconColor } : {}) }}>{element.icon || '\u25CF'}</span>
+  );
+}
+
+function EmojiContent({ element, isEditing, handlers }: Pick<ElementViewProps, 'isEditing' | 'handlers'> & { element: EmojiElement }) {
+  return isEditing ? (
+    <EmojiPicker
+      trigger={
+        <div className="cover-emoji cursor-pointer" style={{ fontSize: element.size ?? 96 }}>
+          {element.content}
+        </div>
+      }
+      onEmojiSelected={(emoji) => handlers.update(element.id, { ...element, content: emoji })}
+    />
+  ) : (
+    <div className="cover-emoji" style={{ fontSize: element.size ?? 96 }}>
+      {element.content}
+    </div>
+  );
+}
+
+function quoteMarkStyle(element: QuoteElement): React.CSSProperties {
+  return {
+    ...(element.quoteMarkColor ? { color: element.quoteMarkColor } : {}),
+    ...(element.quoteMarkSize !== undefined ? { fontSize: `${element.quoteMarkSize}px` } : {}),
+    ...(element.quoteMarkOpacity !== undefined ? { opacity: element.quoteMarkOpacity } : {}),
+  };
+}
+
+function highlightStyle(element: HighlightElement): React.CSSProperties {
+  return {
+    ...(element.backgroundColor ? { background: element.backgroundColor } : {}),
+    ...(element.borderColor ? { borderColor: element.borderColor } : {}),
+    ...(element.borderRadius !== undefined ? { borderRadius: `${element.borderRadius}px` } : {}),
+    ...(element.padding !== undefined ? { padding: `${element.padding}px` } : {}),
+  };
+}
+
+function dividerStyle(element: DividerElement): React.CSSProperties {
+  return {
+    ...(element.dividerColor ? { background: element.dividerColor } : {}),
+    ...(element.dividerWidth !== undefined ? { width: `${element.dividerWidth}px` } : {}),
+    ...(element.dividerHeight !== undefined ? { height: `${element.dividerHeight}px` } : {}),
+    ...(element.borderRadius !== undefined ? { borderRadius: `${element.borderRadius}px` } : {}),
+    ...(element.dividerOpacity !== undefined ? { opacity: element.dividerOpacity } : {}),
+  };
+}
+
+function FlowElementContent({
+  element,
+  isEditing,
+  isSelected,
+  isTextEditing,
+  isCropping,
+  isDraggingImage,
+  imageUrl,
+  canDuplicate,
+  canDelete,
+  handlers,
+}: ElementContentProps) {
+  const isText = TEXT_TYPES.has(element.type);
+  const wrapperProps = {
+    element,
+    isEditing,
+    isSelected,
+    isTextEditing: isText ? isTextEditing : undefined,
+    onSelect: () => handlers.select(element.id),
+    onEnterTextEdit: isText ? () => handlers.enterTextEdit(element.id) : undefined,
+    onDuplicate: canDuplicate ? () => handlers.duplicate(element.id) : undefined,
+    onDelete: canDelete ? () => handlers.remove(element.id) : undefined,
+  };
+  const textProps = {
+    isEditing: isTextEditing,
+    onBlur: (e: React.FocusEvent<HTMLElement>) => handlers.textBlur(element.id, e),
+    onKeyDown: handlers.keyDown,
+  };
+
+  switch (element.type) {
+    case 'tag':
+      return (
+        <ElementWrapper {...wrapperProps}>
+          <EditableText as="div" className="tag" style={getElementInlineStyle(element)} html={element.content} {...textProps} />
+        </ElementWrapper>
+      );
+
+    case 'heading': {
+      const HTag = `h${element.level}` as 'h1' | 'h2' | 'h3';
+      return (
+        <ElementWrapper {...wrapperProps}>
+          <EditableText as={HTag} style={getElementInlineStyle(element)} html={element.content} {...textProps} />
+        </ElementWrapper>
+      );
+    }
+
+    case 'paragraph':
+      return (
+        <ElementWrapper {...wrapperProps}>
+          <EditableText as="p" style={getElementInlineStyle(element)} html={element.content} {...textProps} />
+        </ElementWrapper>
+      );
+
+    case 'subtitle':
+      return (
+        <ElementWrapper {...wrapperProps}>
+          <EditableText as="p" className="sub" style={getElementInlineStyle(element)} html={element.content} {...textProps} />
+        </ElementWrapper>
+      );
+
+    case 'emoji':
+      return (
+        <ElementWrapper {...wrapperProps}>
+          <EmojiContent element={element} isEditing={isEditing} handlers={handlers} />
+        </ElementWrapper>
+      );
+
+    case 'image': {
+      const img = element as ImageElement;
+      return (
+        <ElementWrapper {...wrapperProps}>
+          <div
+            className={element.variant === 'background' ? 'img-bg' : 'img-area'}
+            style={{
+              ...(img.borderRadius !== undefined ? { borderRadius: `${img.borderRadius}px` } : {}),
+              ...(img.imageHeight !== undefined ? { height: `${img.imageHeight}px` } : {}),
+              ...(isCropping ? { outline: '2px dashed var(--editor-accent)', outlineOffset: -2 } : {}),
+            }}
+          >
+            {element.src ? (
+              <img
+                src={imageUrl}
+                alt={element.alt ?? ''}
+                style={{
+                  objectPosition: element.objectPosition,
+                  cursor: isCropping ? (isDraggingImage ? 'grabbing' : 'grab') : undefined,
+                }}
+                draggable={false}
+                onMouseDown={(e) => {
+                  if (isCropping) {
+                    handlers.imageDragStart(element.id, e);
+                  }
+                }}
+                onDoubleClick={() => handlers.imageDoubleClick(element.id)}
+              />
+            ) : (
+              <ImagePlaceholder element={element} isEditing={isEditing} handlers={handlers} />
+            )}
+            {isEditing && element.src && <ReplaceImageButton element={element} handlers={handlers} />}
+          </div>
+        </ElementWrapper>
+      );
+    }
+
+    case 'quote':
+      return (
+        <ElementWrapper {...wrapperProps}>
+          <div className="quote-mark" style={quoteMarkStyle(element)}>&ldquo;</div>
+          <EditableText as="div" className="quote-text" style={getElementInlineStyle(element)} html={element.content} {...textProps} />
+          {element.attribution && (
+            <p className="mt-2 text-sm" style={{ color: 'var(--slide-text-muted)', textAlign: 'center' }}>
+              &mdash; {element.attribution}
+            </p>
+          )}
+        </ElementWrapper>
+      );
+
+    case 'list-item':
+      return (
+        <ElementWrapper {...wrapperProps}>
+          <div className="list-item" style={getElementInlineStyle(element)}>
+            <ListItemIcon element={element} isEditing={isEditing} handlers={handlers} />
+            <EditableText as="span" html={element.content} {...textProps} />
+          </div>
+        </ElementWrapper>
+      );
+
+    case 'highlight':
+      return (
+        <ElementWrapper {...wrapperProps}>
+          <div className="highlight-block" style={highlightStyle(element)}>
+            <EditableText as="p" style={getElementInlineStyle(element)} html={element.content} {...textProps} />
+          </div>
+        </ElementWrapper>
+      );
+
+    case 'divider':
+      return (
+        <ElementWrapper {...wrapperProps}>
+          <div className="divider-line" style={dividerStyle(element)} />
+        </ElementWrapper>
+      );
+
+    case 'spacer':
+      return (
+        <ElementWrapper {...wrapperProps}>
+          <div style={{ height: element.height }} />
+        </ElementWrapper>
+      );
+
+    case 'overlay':
+      // Fallback for freeform layout; flow overlays are rendered separately as full-slide covers
+      return (
+        <ElementWrapper {...wrapperProps}>
+          <div
+            className="overlay-element"
+            style={{
+              background: element.fill,
+              width: '100%',
+              height: element.h ?? 200,
+              borderRadius: 4,
+              position: 'relative',
+            }}
+          />
+        </ElementWrapper>
+      );
+
+    default:
+      return null;
+  }
+}
+
+const FlowElementView = memo(function FlowElementView(props: ElementViewProps) {
+  const imageUrl = useElementImageUrl(props.element);
+  if (PROFILER_AVAILABLE) markElementRender(props.element.id);
+  return (
+    <>
+      <FlowElementContent {...props} imageUrl={imageUrl} />
+      {PROFILER_AVAILABLE && <ElementRenderEnd id={props.element.id} />}
+    </>
+  );
+});
+
+/** Plain render function (no hooks) so the view can skip unknown element types */
+function renderFreeformContent({
+  element,
+  isEditing,
+  isTextEditing,
+  isCropping,
+  isDraggingImage,
+  imageUrl,
+  handlers,
+}: ElementContentProps): React.ReactNode {
+  const inlineStyle = getElementInlineStyle(element);
+  const textProps = {
+    isEditing: isTextEditing,
+    onBlur: (e: React.FocusEvent<HTMLElement>) => handlers.textBlur(element.id, e),
+    onKeyDown: handlers.keyDown,
+  };
+
+  switch (element.type) {
+    case 'tag':
+      return <EditableText as="div" className="tag" style={inlineStyle} html={element.content} {...textProps} />;
+
+    case 'heading': {
+      const HTag = `h${element.level}` as 'h1' | 'h2' | 'h3';
+      return <EditableText as={HTag} style={inlineStyle} html={element.content} {...textProps} />;
+    }
+
+    case 'paragraph':
+      return <EditableText as="p" style={inlineStyle} html={element.content} {...textProps} />;
+
+    case 'subtitle':
+      return <EditableText as="p" className="sub" style={inlineStyle} html={element.content} {...textProps} />;
+
+    case 'emoji':
+      return <EmojiContent element={element} isEditing={isEditing} handlers={handlers} />;
+
+    case 'image':
+      return (
+        <div style={{
+          width: '100%',
+          height: '100%',
+          position: 'relative',
+          borderRadius: element.borderRadius !== undefined ? `${element.borderRadius}px` : '16px',
+          overflow: 'hidden',
+          ...(isCropping ? { outline: '2px dashed var(--editor-accent)', outlineOffset: -2 } : {}),
+        }}>
+          {element.src ? (
+            <img
+              src={imageUrl}
+              alt={element.alt ?? ''}
+              style={{
+                width: '100%',
+                height: '100%',
+                objectFit: 'cover',
+                objectPosition: element.objectPosition ?? 'center',
+                cursor: isCropping ? (isDraggingImage ? 'grabbing' : 'grab') : undefined,
+              }}
+              draggable={false}
+              onMouseDown={(e) => {
+                if (isCropping) {
+                  handlers.imageDragStart(element.id, e);
+                }
+              }}
+              onDoubleClick={() => handlers.imageDoubleClick(element.id)}
+            />
+          ) : (
+            <ImagePlaceholder element={element} isEditing={isEditing} handlers={handlers} />
+          )}
+          {isEditing && element.src && <ReplaceImageButton element={element} handlers={handlers} />}
+        </div>
+      );
+
+    case 'quote':
+      return (
+        <div>
+          <div className="quote-mark" style={quoteMarkStyle(element)}>&ldquo;</div>
+          <EditableText as="div" className="quote-text" style={inlineStyle} html={element.content} {...textProps} />
+          {element.attribution && (
+            <p className="mt-2 text-sm" style={{ color: 'var(--slide-text-muted)', textAlign: 'center' }}>
+              &mdash; {element.attribution}
+            </p>
+          )}
+        </div>
+      );
+
+    case 'list-item':
+      return (
+        <div className="list-item" style={inlineStyle}>
+          <ListItemIcon element={element} isEditing={isEditing} handlers={handlers} />
+          <EditableText as="span" html={element.content} {...textProps} />
+        </div>
+      );
+
+    case 'highlight':
+      return (
+        <div className="highlight-block" style={highlightStyle(element)}>
+          <EditableText as="p" style={inlineStyle} html={element.content} {...textProps} />
+        </div>
+      );
+
+    case 'divider':
+      return <div className="divider-line" style={dividerStyle(element)} />;
+
+    case 'spacer':
+      return <div style={{ height: element.height }} />;
+
+    case 'overlay':
+      return (
+        <div
+          className="overlay-element"
+          style={{
+            background: element.fill,
+            width: '100%',
+            height: '100%',
+            position: 'relative',
+          }}
+        />
+      );
+
+    default:
+      return null;
+  }
+}
+
+const FreeformElementView = memo(function FreeformElementView({
+  layerIndex,
+  scale,
+  ...props
+}: ElementViewProps & { layerIndex: number; scale: number }) {
+  const { element, isEditing, isSelected, isTextEditing, handlers } = props;
+  const imageUrl = useElementImageUrl(element);
+  const content = renderFreeformContent({ ...props, imageUrl });
+  if (!content) return null;
+  if (PROFILER_AVAILABLE) markElementRender(element.id);
+
+  return (
+    <>
+      <FreeformElement
+        element={element}
+        layerIndex={layerIndex}
+        scale={scale}
+        isEditing={isEditing}
+        isSelected={isSelected}
+        isTextEditing={isTextEditing}
+        onSelect={() => handlers.select(element.id)}
+        onEnterTextEdit={TEXT_TYPES.has(element.type) ? () => handlers.enterTextEdit(element.id) : undefined}
+        onUpdate={(updatedElement) => handlers.update(element.id, updatedElement)}
+        getOtherElements={handlers.getElements}
+        onGuidesChange={handlers.guidesChange}
+      >
+        {/* Opacity is applied on the FreeformElement wrapper (not inner element) */}
+        {element.opacity !== undefined ? <div style={{ opacity: element.opacity }}>{content}</div> : content}
+      </FreeformElement>
+      {PROFILER_AVAILABLE && <ElementRenderEnd id={element.id} />}
+    </>
+  );
+});
+
 function SlideRendererComponent({
   slide,
   theme,
@@ -255,7 +754,8 @@ function SlideRendererComponent({
   scale,
   projectId,
 }: SlideRendererProps) {
-  const { resolveUrl, registerAssetUrl } = useAssetContext();
+  const { registerAssetUrl } = useAssetContext();
+  const backgroundUrl = useResolvedUrl(slide.backgroundImage);
   const [imageDialogOpen, setImageDialogOpen] = useState(false);
   const [imageDialogTarget, setImageDialogTarget] = useState<string | null>(null);
   const [guides, setGuides] = useState<GuideLine[]>([]);
@@ -282,7 +782,7 @@ function SlideRendererComponent({
   const onUpdateElementRef = useRef(onUpdateElement);
   onUpdateElementRef.current = onUpdateElement;
 
-  const themeVars = useMemo(() => themeToCSVars(theme), [theme]);
+  const themeStyle = useMemo(() => themeToStyle(themeToCSVars(theme)), [theme]);
 
   const handleImageClick = useCallback(
     (elementId: string) => {
@@ -527,13 +1027,12 @@ function SlideRendererComponent({
       e.stopPropagation();
       const file = e.dataTransfer.files?.[0];
       if (file && file.type.startsWith('image/')) {
-        const { saveAsset } = await import('@/lib/projects');
-        const filename = `assets/${Date.now()}-${file.name.replace(/[^a-zA-Z0-9._-]/g, '_')}`;
-        await saveAsset(projectId ?? '', filename, file);
-        registerAssetUrl(filename, file);
+        const { ingestImage } = await import('@/lib/asset-ingest');
+        const asset = await ingestImage(projectId ?? '', file);
+        registerAssetUrl(asset.filename, asset.blob);
         const element = slide.elements.find((el) => el.id === elementId);
         if (element && element.type === 'image') {
-          onUpdateElement(elementId, { ...element, src: filename });
+          onUpdateElement(elementId, { ...element, src: asset.filename });
         }
       }
     },
@@ -573,6 +1072,62 @@ function SlideRendererComponent({
     onSetSlideLayout(targetLayout);
   }, [onSetSlideLayout]);
 
+  // Latest values for the stable element handlers below
+  const latestRef = useRef({
+    isEditing,
+    onSelectElement,
+    onUpdateElement,
+    onDuplicateElement,
+    onDeleteElement,
+    handleEnterTextEdit,
+    handleTextBlur,
+    handleImageClick,
+    handleImageDoubleClick,
+    handleImageDragStart,
+    handleFileDrop,
+  });
+  latestRef.current = {
+    isEditing,
+    onSelectElement,
+    onUpdateElement,
+    onDuplicateElement,
+    onDeleteElement,
+    handleEnterTextEdit,
+    handleTextBlur,
+    handleImageClick,
+    handleImageDoubleClick,
+    handleImageDragStart,
+    handleFileDrop,
+  };
+
+  const handlers = useMemo<ElementHandlers>(() => ({
+    select: (id) => latestRef.current.onSelectElement(id),
+    enterTextEdit: (id) => latestRef.current.handleEnterTextEdit(id),
+    textBlur: (id, e) => latestRef.current.handleTextBlur(id, e),
+    keyDown: handleKeyDown,
+    update: (id, element) => latestRef.current.onUpdateElement(id, element),
+    duplicate: (id) => latestRef.current.onDuplicateElement?.(id),
+    remove: (id) => latestRef.current.onDeleteElement?.(id),
+    imageClick: (id) => latestRef.current.handleImageClick(id),
+    imageDoubleClick: (id) => latestRef.current.handleImageDoubleClick(id),
+    imageDragStart: (id, e) => latestRef.current.handleImageDragStart(id, e),
+    fileDrop: (id, e) => latestRef.current.handleFileDrop(id, e),
+    guidesChange: setGuides,
+    getElements: () => slideElementsRef.current,
+  }), [handleKeyDown]);
+
+  const elementViewProps = (element: SlideElement): ElementViewProps => ({
+    element,
+    isEditing,
+    isSelected: selectedElementId === element.id,
+    isTextEditing: editingTextId === element.id,
+    isCropping: cropModeId === element.id,
+    isDraggingImage: draggingImageId === element.id,
+    canDuplicate: !!onDuplicateElement,
+    canDelete: !!onDeleteElement,
+    handlers,
+  });
+
   // Group consecutive list-items into a .list-items container
   const renderElementsGrouped = (elements: SlideElement[]) => {
     const groups: React.ReactNode[] = [];
@@ -582,7 +1137,7 @@ function SlideRendererComponent({
       if (listBatch.length > 0) {
         groups.push(
           <div className="list-items" key={`list-group-${listBatch[0].id}`}>
-            {listBatch.map(renderElement)}
+            {listBatch.map((el) => <FlowElementView key={el.id} {...elementViewProps(el)} />)}
           </div>
         );
         listBatch = [];
@@ -594,476 +1149,17 @@ function SlideRendererComponent({
         listBatch.push(el);
       } else {
         flushList();
-        groups.push(renderElement(el));
+        groups.push(<FlowElementView key={el.id} {...elementViewProps(el)} />);
       }
     }
     flushList();
     return groups;
   };
 
-  const renderElement = (element: SlideElement) => {
-    const isSelected = selectedElementId === element.id;
-
-    switch (element.type) {
-      case 'tag':
-        return (
-          <ElementWrapper key={element.id} element={element} isEditing={isEditing} isSelected={isSelected} isTextEditing={editingTextId === element.id} onSelect={() => onSelectElement(element.id)} onEnterTextEdit={() => handleEnterTextEdit(element.id)} onDuplicate={onDuplicateElement ? () => onDuplicateElement(element.id) : undefined} onDelete={onDeleteElement ? () => onDeleteElement(element.id) : undefined}>
-            <EditableText as="div" className="tag" style={getElementInlineStyle(element)} html={element.content} isEditing={editingTextId === element.id} onBlur={(e) => handleTextBlur(element.id, e)} onKeyDown={handleKeyDown} />
-          </ElementWrapper>
-        );
-
-      case 'heading': {
-        const HTag = `h${element.level}` as 'h1' | 'h2' | 'h3';
-        return (
-          <ElementWrapper key={element.id} element={element} isEditing={isEditing} isSelected={isSelected} isTextEditing={editingTextId === element.id} onSelect={() => onSelectElement(element.id)} onEnterTextEdit={() => handleEnterTextEdit(element.id)} onDuplicate={onDuplicateElement ? () => onDuplicateElement(element.id) : undefined} onDelete={onDeleteElement ? () => onDeleteElement(element.id) : undefined}>
-            <EditableText as={HTag} style={getElementInlineStyle(element)} html={element.content} isEditing={editingTextId === element.id} onBlur={(e) => handleTextBlur(element.id, e)} onKeyDown={handleKeyDown} />
-          </ElementWrapper>
-        );
-      }
-
-      case 'paragraph':
-        return (
-          <ElementWrapper key={element.id} element={element} isEditing={isEditing} isSelected={isSelected} isTextEditing={editingTextId === element.id} onSelect={() => onSelectElement(element.id)} onEnterTextEdit={() => handleEnterTextEdit(element.id)} onDuplicate={onDuplicateElement ? () => onDuplicateElement(element.id) : undefined} onDelete={onDeleteElement ? () => onDeleteElement(element.id) : undefined}>
-            <EditableText as="p" style={getElementInlineStyle(element)} html={element.content} isEditing={editingTextId === element.id} onBlur={(e) => handleTextBlur(element.id, e)} onKeyDown={handleKeyDown} />
-          </ElementWrapper>
-        );
-
-      case 'subtitle':
-        return (
-          <ElementWrapper key={element.id} element={element} isEditing={isEditing} isSelected={isSelected} isTextEditing={editingTextId === element.id} onSelect={() => onSelectElement(element.id)} onEnterTextEdit={() => handleEnterTextEdit(element.id)} onDuplicate={onDuplicateElement ? () => onDuplicateElement(element.id) : undefined} onDelete={onDeleteElement ? () => onDeleteElement(element.id) : undefined}>
-            <EditableText as="p" className="sub" style={getElementInlineStyle(element)} html={element.content} isEditing={editingTextId === element.id} onBlur={(e) => handleTextBlur(element.id, e)} onKeyDown={handleKeyDown} />
-          </ElementWrapper>
-        );
-
-      case 'emoji':
-        return (
-          <ElementWrapper key={element.id} element={element} isEditing={isEditing} isSelected={isSelected} onSelect={() => onSelectElement(element.id)} onDuplicate={onDuplicateElement ? () => onDuplicateElement(element.id) : undefined} onDelete={onDeleteElement ? () => onDeleteElement(element.id) : undefined}>
-            {isEditing ? (
-              <EmojiPicker
-                trigger={
-                  <div className="cover-emoji cursor-pointer" style={{ fontSize: element.size ?? 96 }}>
-                    {element.content}
-                  </div>
-                }
-                onEmojiSelected={(emoji) => onUpdateElement(element.id, { ...element, content: emoji })}
-              />
-            ) : (
-              <div className="cover-emoji" style={{ fontSize: element.size ?? 96 }}>
-                {element.content}
-              </div>
-            )}
-          </ElementWrapper>
-        );
-
-      case 'image': {
-        const isCropping = cropModeId === element.id;
-        const img = element as ImageElement;
-        return (
-          <ElementWrapper key={element.id} element={element} isEditing={isEditing} isSelected={isSelected} onSelect={() => onSelectElement(element.id)} onDuplicate={onDuplicateElement ? () => onDuplicateElement(element.id) : undefined} onDelete={onDeleteElement ? () => onDeleteElement(element.id) : undefined}>
-            <div
-              className={element.variant === 'background' ? 'img-bg' : 'img-area'}
-              style={{
-                ...(img.borderRadius !== undefined ? { borderRadius: `${img.borderRadius}px` } : {}),
-                ...(img.imageHeight !== undefined ? { height: `${img.imageHeight}px` } : {}),
-                ...(isCropping ? { outline: '2px dashed var(--editor-accent)', outlineOffset: -2 } : {}),
-              }}
-            >
-              {element.src ? (
-                <img
-                  src={resolveUrl(element.src)}
-                  alt={element.alt ?? ''}
-                  style={{
-                    objectPosition: element.objectPosition,
-                    cursor: isCropping ? (draggingImageId === element.id ? 'grabbing' : 'grab') : undefined,
-                  }}
-                  draggable={false}
-                  onMouseDown={(e) => {
-                    if (isCropping) {
-                      handleImageDragStart(element.id, e);
-                    }
-                  }}
-                  onDoubleClick={() => handleImageDoubleClick(element.id)}
-                />
-              ) : (
-                <div
-                  className="flex flex-col items-center justify-center gap-3 text-muted-foreground cursor-pointer"
-                  style={{ width: '100%', height: '100%', background: 'rgba(255,255,255,0.05)', border: '2px dashed rgba(255,255,255,0.15)' }}
-                  onClick={() => handleImageClick(element.id)}
-                  onDragOver={(e) => { e.preventDefault(); e.stopPropagation(); }}
-                  onDrop={(e) => handleFileDrop(element.id, e)}
-                >
-                  {isEditing && (
-                    <>
-                      <Image className="size-8 opacity-40" />
-                      <span style={{ fontSize: 24 }}>Clique ou arraste uma imagem</span>
-                    </>
-                  )}
-                </div>
-              )}
-              {isEditing && element.src && (
-                <button
-                  type="button"
-                  className="absolute bottom-2 right-2 rounded bg-card/80 px-2 py-1 text-xs text-muted-foreground opacity-0 shadow backdrop-blur transition-opacity group-hover/el:opacity-100"
-                  onClick={(e) => {
-                    e.stopPropagation();
-                    handleImageClick(element.id);
-                  }}
-                  data-editor-control
-                >
-                  Trocar
-                </button>
-              )}
-            </div>
-          </ElementWrapper>
-        );
-      }
-
-      case 'quote': {
-        const qt = element as QuoteElement;
-        return (
-          <ElementWrapper key={element.id} element={element} isEditing={isEditing} isSelected={isSelected} isTextEditing={editingTextId === element.id} onSelect={() => onSelectElement(element.id)} onEnterTextEdit={() => handleEnterTextEdit(element.id)} onDuplicate={onDuplicateElement ? () => onDuplicateElement(element.id) : undefined} onDelete={onDeleteElement ? () => onDeleteElement(element.id) : undefined}>
-            <div className="quote-mark" style={{
-              ...(qt.quoteMarkColor ? { color: qt.quoteMarkColor } : {}),
-              ...(qt.quoteMarkSize !== undefined ? { fontSize: `${qt.quoteMarkSize}px` } : {}),
-              ...(qt.quoteMarkOpacity !== undefined ? { opacity: qt.quoteMarkOpacity } : {}),
-            }}>&ldquo;</div>
-            <EditableText as="div" className="quote-text" style={getElementInlineStyle(element)} html={element.content} isEditing={editingTextId === element.id} onBlur={(e) => handleTextBlur(element.id, e)} onKeyDown={handleKeyDown} />
-            {element.attribution && (
-              <p className="mt-2 text-sm" style={{ color: 'var(--slide-text-muted)', textAlign: 'center' }}>
-                &mdash; {element.attribution}
-              </p>
-            )}
-          </ElementWrapper>
-        );
-      }
-
-      case 'list-item': {
-        const li = element as ListItemElement;
-        return (
-          <ElementWrapper key={element.id} element={element} isEditing={isEditing} isSelected={isSelected} isTextEditing={editingTextId === element.id} onSelect={() => onSelectElement(element.id)} onEnterTextEdit={() => handleEnterTextEdit(element.id)} onDuplicate={onDuplicateElement ? () => onDuplicateElement(element.id) : undefined} onDelete={onDeleteElement ? () => onDeleteElement(element.id) : undefined}>
-            <div className="list-item" style={getElementInlineStyle(element)}>
-              {isEditing ? (
-                <IconPicker
-                  trigger={
-                    element.icon?.startsWith('http') ? (
-                      <img className="icon cursor-pointer" src={element.icon} alt="Icone" title="Trocar icone" draggable={false} style={{ width: li.iconSize ?? 48, height: li.iconSize ?? 48 }} />
-                    ) : (
-                      <span className="list-icon cursor-pointer" title="Trocar icone" style={{ width: li.iconSize ?? 48, height: li.iconSize ?? 48, ...(li.iconColor ? { color: li.iconColor } : {}) }}>
-                        {element.icon || '\u25CF'}
-                      </span>
-                    )
-                  }
-                  onIconSelected={(icon) => onUpdateElement(element.id, { ...element, icon })}
-                />
-              ) : (
-                element.icon?.startsWith('http') ? (
-                  <img className="icon" src={element.icon} alt="Icone" draggable={false} style={{ width: li.iconSize ?? 48, height: li.iconSize ?? 48 }} />
-                ) : (
-                  <span className="list-icon" style={{ width: li.iconSize ?? 48, height: li.iconSize ?? 48, ...(li.iconColor ? { color: li.iconColor } : {}) }}>{element.icon || '\u25CF'}</span>
-                )
-              )}
-              <EditableText as="span" html={element.content} isEditing={editingTextId === element.id} onBlur={(e) => handleTextBlur(element.id, e)} onKeyDown={handleKeyDown} />
-            </div>
-          </ElementWrapper>
-        );
-      }
-
-      case 'highlight': {
-        const hl = element as HighlightElement;
-        return (
-          <ElementWrapper key={element.id} element={element} isEditing={isEditing} isSelected={isSelected} isTextEditing={editingTextId === element.id} onSelect={() => onSelectElement(element.id)} onEnterTextEdit={() => handleEnterTextEdit(element.id)} onDuplicate={onDuplicateElement ? () => onDuplicateElement(element.id) : undefined} onDelete={onDeleteElement ? () => onDeleteElement(element.id) : undefined}>
-            <div className="highlight-block" style={{
-              ...(hl.backgroundColor ? { background: hl.backgroundColor } : {}),
-              ...(hl.borderColor ? { borderColor: hl.borderColor } : {}),
-              ...(hl.borderRadius !== undefined ? { borderRadius: `${hl.borderRadius}px` } : {}),
-              ...(hl.padding !== undefined ? { padding: `${hl.padding}px` } : {}),
-            }}>
-              <EditableText as="p" style={getElementInlineStyle(element)} html={element.content} isEditing={editingTextId === element.id} onBlur={(e) => handleTextBlur(element.id, e)} onKeyDown={handleKeyDown} />
-            </div>
-          </ElementWrapper>
-        );
-      }
-
-      case 'divider': {
-        const div = element as DividerElement;
-        return (
-          <ElementWrapper key={element.id} element={element} isEditing={isEditing} isSelected={isSelected} onSelect={() => onSelectElement(element.id)} onDuplicate={onDuplicateElement ? () => onDuplicateElement(element.id) : undefined} onDelete={onDeleteElement ? () => onDeleteElement(element.id) : undefined}>
-            <div className="divider-line" style={{
-              ...(div.dividerColor ? { background: div.dividerColor } : {}),
-              ...(div.dividerWidth !== undefined ? { width: `${div.dividerWidth}px` } : {}),
-              ...(div.dividerHeight !== undefined ? { height: `${div.dividerHeight}px` } : {}),
-              ...(div.borderRadius !== undefined ? { borderRadius: `${div.borderRadius}px` } : {}),
-              ...(div.dividerOpacity !== undefined ? { opacity: div.dividerOpacity } : {}),
-            }} />
-          </ElementWrapper>
-        );
-      }
-
-      case 'spacer':
-        return (
-          <ElementWrapper key={element.id} element={element} isEditing={isEditing} isSelected={isSelected} onSelect={() => onSelectElement(element.id)} onDuplicate={onDuplicateElement ? () => onDuplicateElement(element.id) : undefined} onDelete={onDeleteElement ? () => onDeleteElement(element.id) : undefined}>
-            <div style={{ height: element.height }} />
-          </ElementWrapper>
-        );
-
-      case 'overlay':
-        // Fallback for freeform layout; flow overlays are rendered separately as full-slide covers
-        return (
-          <ElementWrapper key={element.id} element={element} isEditing={isEditing} isSelected={isSelected} onSelect={() => onSelectElement(element.id)} onDuplicate={onDuplicateElement ? () => onDuplicateElement(element.id) : undefined} onDelete={onDeleteElement ? () => onDeleteElement(element.id) : undefined}>
-            <div
-              className="overlay-element"
-              style={{
-                background: element.fill,
-                width: '100%',
-                height: element.h ?? 200,
-                borderRadius: 4,
-                position: 'relative',
-              }}
-            />
-          </ElementWrapper>
-        );
-
-      default:
-        return null;
-    }
-  };
-
   const currentImageElement = imageDialogTarget
     ? slide.elements.find((el) => el.id === imageDialogTarget)
     : null;
 
-  // Render freeform elements
-  const renderFreeformElement = (element: SlideElement, arrayIndex: number) => {
-    const isSelected = selectedElementId === element.id;
-
-    const baseElement = (() => {
-      const inlineStyle = getElementInlineStyle(element);
-
-      switch (element.type) {
-        case 'tag':
-          return (
-            <EditableText as="div" className="tag" style={inlineStyle} html={element.content} isEditing={editingTextId === element.id} onBlur={(e) => handleTextBlur(element.id, e)} onKeyDown={handleKeyDown} />
-          );
-
-        case 'heading': {
-          const HTag = `h${element.level}` as 'h1' | 'h2' | 'h3';
-          return (
-            <EditableText as={HTag} style={inlineStyle} html={element.content} isEditing={editingTextId === element.id} onBlur={(e) => handleTextBlur(element.id, e)} onKeyDown={handleKeyDown} />
-          );
-        }
-
-        case 'paragraph':
-          return (
-            <EditableText as="p" style={inlineStyle} html={element.content} isEditing={editingTextId === element.id} onBlur={(e) => handleTextBlur(element.id, e)} onKeyDown={handleKeyDown} />
-          );
-
-        case 'subtitle':
-          return (
-            <EditableText as="p" className="sub" style={inlineStyle} html={element.content} isEditing={editingTextId === element.id} onBlur={(e) => handleTextBlur(element.id, e)} onKeyDown={handleKeyDown} />
-          );
-
-        case 'emoji':
-          return isEditing ? (
-            <EmojiPicker
-              trigger={
-                <div className="cover-emoji cursor-pointer" style={{ fontSize: element.size ?? 96 }}>
-                  {element.content}
-                </div>
-              }
-              onEmojiSelected={(emoji) => onUpdateElement(element.id, { ...element, content: emoji })}
-            />
-          ) : (
-            <div className="cover-emoji" style={{ fontSize: element.size ?? 96 }}>
-              {element.content}
-            </div>
-          );
-
-        case 'image': {
-          const isCroppingFreeform = cropModeId === element.id;
-          return (
-            <div style={{
-              width: '100%',
-              height: '100%',
-              position: 'relative',
-              borderRadius: element.borderRadius !== undefined ? `${element.borderRadius}px` : '16px',
-              overflow: 'hidden',
-              ...(isCroppingFreeform ? { outline: '2px dashed var(--editor-accent)', outlineOffset: -2 } : {}),
-            }}>
-              {element.src ? (
-                <img
-                  src={resolveUrl(element.src)}
-                  alt={element.alt ?? ''}
-                  style={{
-                    width: '100%',
-                    height: '100%',
-                    objectFit: 'cover',
-                    objectPosition: element.objectPosition ?? 'center',
-                    cursor: isCroppingFreeform ? (draggingImageId === element.id ? 'grabbing' : 'grab') : undefined,
-                  }}
-                  draggable={false}
-                  onMouseDown={(e) => {
-                    if (isCroppingFreeform) {
-                      handleImageDragStart(element.id, e);
-                    }
-                  }}
-                  onDoubleClick={() => handleImageDoubleClick(element.id)}
-                />
-              ) : (
-                <div
-                  className="flex flex-col items-center justify-center gap-3 text-muted-foreground cursor-pointer"
-                  style={{ width: '100%', height: '100%', background: 'rgba(255,255,255,0.05)', border: '2px dashed rgba(255,255,255,0.15)' }}
-                  onClick={() => handleImageClick(element.id)}
-                  onDragOver={(e) => { e.preventDefault(); e.stopPropagation(); }}
-                  onDrop={(e) => handleFileDrop(element.id, e)}
-                >
-                  {isEditing && (
-                    <>
-                      <Image className="size-8 opacity-40" />
-                      <span style={{ fontSize: 24 }}>Clique ou arraste uma imagem</span>
-                    </>
-                  )}
-                </div>
-              )}
-              {isEditing && element.src && (
-                <button
-                  type="button"
-                  className="absolute bottom-2 right-2 rounded bg-card/80 px-2 py-1 text-xs text-muted-foreground opacity-0 shadow backdrop-blur transition-opacity group-hover/el:opacity-100"
-                  onClick={(e) => {
-                    e.stopPropagation();
-                    handleImageClick(element.id);
-                  }}
-                  data-editor-control
-                >
-                  Trocar
-                </button>
-              )}
-            </div>
-          );
-        }
-
-        case 'quote': {
-          const fqt = element as QuoteElement;
-          return (
-            <div>
-              <div className="quote-mark" style={{
-                ...(fqt.quoteMarkColor ? { color: fqt.quoteMarkColor } : {}),
-                ...(fqt.quoteMarkSize !== undefined ? { fontSize: `${fqt.quoteMarkSize}px` } : {}),
-                ...(fqt.quoteMarkOpacity !== undefined ? { opacity: fqt.quoteMarkOpacity } : {}),
-              }}>&ldquo;</div>
-              <EditableText as="div" className="quote-text" style={getElementInlineStyle(element)} html={element.content} isEditing={editingTextId === element.id} onBlur={(e) => handleTextBlur(element.id, e)} onKeyDown={handleKeyDown} />
-              {element.attribution && (
-                <p className="mt-2 text-sm" style={{ color: 'var(--slide-text-muted)', textAlign: 'center' }}>
-                  &mdash; {element.attribution}
-                </p>
-              )}
-            </div>
-          );
-        }
-
-        case 'list-item': {
-          const fli = element as ListItemElement;
-          return (
-            <div className="list-item" style={getElementInlineStyle(element)}>
-              {isEditing ? (
-                <IconPicker
-                  trigger={
-                    element.icon?.startsWith('http') ? (
-                      <img className="icon cursor-pointer" src={element.icon} alt="Icone" title="Trocar icone" draggable={false} style={{ width: fli.iconSize ?? 48, height: fli.iconSize ?? 48 }} />
-                    ) : (
-                      <span className="list-icon cursor-pointer" title="Trocar icone" style={{ width: fli.iconSize ?? 48, height: fli.iconSize ?? 48, ...(fli.iconColor ? { color: fli.iconColor } : {}) }}>
-                        {element.icon || '\u25CF'}
-                      </span>
-                    )
-                  }
-                  onIconSelected={(icon) => onUpdateElement(element.id, { ...element, icon })}
-                />
-              ) : (
-                element.icon?.startsWith('http') ? (
-                  <img className="icon" src={element.icon} alt="Icone" draggable={false} style={{ width: fli.iconSize ?? 48, height: fli.iconSize ?? 48 }} />
-                ) : (
-                  <span className="list-icon" style={{ width: fli.iconSize ?? 48, height: fli.iconSize ?? 48, ...(fli.iconColor ? { color: fli.iconColor } : {}) }}>{element.icon || '\u25CF'}</span>
-                )
-              )}
-              <EditableText as="span" html={element.content} isEditing={editingTextId === element.id} onBlur={(e) => handleTextBlur(element.id, e)} onKeyDown={handleKeyDown} />
-            </div>
-          );
-        }
-
-        case 'highlight': {
-          const fhl = element as HighlightElement;
-          return (
-            <div className="highlight-block" style={{
-              ...(fhl.backgroundColor ? { background: fhl.backgroundColor } : {}),
-              ...(fhl.borderColor ? { borderColor: fhl.borderColor } : {}),
-              ...(fhl.borderRadius !== undefined ? { borderRadius: `${fhl.borderRadius}px` } : {}),
-              ...(fhl.padding !== undefined ? { padding: `${fhl.padding}px` } : {}),
-            }}>
-              <EditableText as="p" style={inlineStyle} html={element.content} isEditing={editingTextId === element.id} onBlur={(e) => handleTextBlur(element.id, e)} onKeyDown={handleKeyDown} />
-            </div>
-          );
-        }
-
-        case 'divider': {
-          const fdiv = element as DividerElement;
-          return <div className="divider-line" style={{
-            ...(fdiv.dividerColor ? { background: fdiv.dividerColor } : {}),
-            ...(fdiv.dividerWidth !== undefined ? { width: `${fdiv.dividerWidth}px` } : {}),
-            ...(fdiv.dividerHeight !== undefined ? { height: `${fdiv.dividerHeight}px` } : {}),
-            ...(fdiv.borderRadius !== undefined ? { borderRadius: `${fdiv.borderRadius}px` } : {}),
-            ...(fdiv.dividerOpacity !== undefined ? { opacity: fdiv.dividerOpacity } : {}),
-          }} />;
-        }
-
-        case 'spacer':
-          return <div style={{ height: element.height }} />;
-
-        case 'overlay':
-          return (
-            <div
-              className="overlay-element"
-              style={{
-                background: element.fill,
-                width: '100%',
-                height: '100%',
-                position: 'relative',
-              }}
-            />
-          );
-
-        default:
-          return null;
-      }
-    })();
-
-    if (!baseElement) return null;
-
-    // Opacity is applied on the FreeformElement wrapper (not inner element)
-    const freeformWrapperStyle: React.CSSProperties = {};
-    if (element.opacity !== undefined) freeformWrapperStyle.opacity = element.opacity;
-    const hasWrapperStyle = Object.keys(freeformWrapperStyle).length > 0;
-
-    const isTextType = ['tag', 'heading', 'paragraph', 'subtitle', 'quote', 'list-item', 'highlight'].includes(element.type);
-
-    return (
-      <FreeformElement
-        key={element.id}
-        element={element}
-        layerIndex={arrayIndex}
-        scale={displayScale}
-        isEditing={isEditing}
-        isSelected={isSelected}
-        isTextEditing={editingTextId === element.id}
-        onSelect={() => onSelectElement(element.id)}
-        onEnterTextEdit={isTextType ? () => handleEnterTextEdit(element.id) : undefined}
-        onUpdate={(updatedElement) => onUpdateElement(element.id, updatedElement)}
-        otherElements={slide.elements}
-        onGuidesChange={setGuides}
-      >
-        {hasWrapperStyle ? <div style={freeformWrapperStyle}>{baseElement}</div> : baseElement}
-      </FreeformElement>
-    );
-  };
-
   const isFreeform = slide.layout === 'freeform';
 
   return (
@@ -1112,9 +1208,9 @@ function SlideRendererComponent({
             slide.layout === 'freeform' && "slide-freeform"
           )}
           style={{
-            ...themeToStyle(themeVars),
+            ...themeStyle,
             ...(slide.background ? { background: slide.background } : {}),
-            ...(slide.backgroundImage ? { backgroundImage: `url(${resolveUrl(slide.backgroundImage)})`, backgroundSize: 'cover', backgroundPosition: slide.backgroundPosition ?? 'center' } : {}),
+            ...(backgroundUrl ? { backgroundImage: `url(${backgroundUrl})`, backgroundSize: 'cover', backgroundPosition: slide.backgroundPosition ?? 'center' } : {}),
             ...(isBgCropping ? { outline: '2px dashed var(--editor-accent)', outlineOffset: -2 } : {}),
             width: 1080,
             height: 1440,
@@ -1148,7 +1244,9 @@ function SlideRendererComponent({
             <>
               {/* Freeform layout: absolute positioning, covers entire slide */}
               <div style={{ position: 'absolute', inset: 0 }}>
-                {slide.elements.map(renderFreeformElement)}
+                {slide.elements.map((element, index) => (
+                  <FreeformElementView key={element.id} {...elementViewProps(element)} layerIndex={index} scale={displayScale} />
+                ))}
               </div>
               {/* Smart guides overlay */}
               {isEditing && <SmartGuideOverlay guides={guides} />}
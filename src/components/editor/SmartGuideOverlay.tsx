@@ -1,6 +1,6 @@
 'use client';
 
-import type { GuideLine } from '@/hooks/useSmartGuides';
+import type { GuideLine, SpacingSegment } from '@/hooks/useSmartGuides';
 
 interface SmartGuideOverlayProps {
   guides: GuideLine[];
@@ -8,6 +8,25 @@ interface SmartGuideOverlayProps {
 
 const SLIDE_WIDTH = 1080;
 const SLIDE_HEIGHT = 1440;
+const TICK_SIZE = 12;
+
+function SpacingMarker({ axis, segment }: { axis: 'x' | 'y'; segment: SpacingSegment }) {
+  const { start, end, cross } = segment;
+  const half = TICK_SIZE / 2;
+  const line = axis === 'x'
+    ? { x1: start, y1: cross, x2: end, y2: cross }
+    : { x1: cross, y1: start, x2: cross, y2: end };
+  const ticks = axis === 'x'
+    ? [{ x1: start, y1: cross - half, x2: start, y2: cross + half }, { x1: end, y1: cross - half, x2: end, y2: cross + half }]
+    : [{ x1: cross - half, y1: start, x2: cross + half, y2: start }, { x1: cross - half, y1: end, x2: cross + half, y2: end }];
+
+  return (
+    <g stroke="var(--editor-accent)" strokeWidth={2}>
+      <line {...line} />
+      {ticks.map((tick, i) => <line key={i} {...tick} />)}
+    </g>
+  );
+}
 
 export function SmartGuideOverlay({ guides }: SmartGuideOverlayProps) {
   if (guides.length === 0) return null;
@@ -25,7 +44,11 @@ export function SmartGuideOverlay({ guides }: SmartGuideOverlayProps) {
       }}
     >
       {guides.map((guide, i) =>
-        guide.type === 'v' ? (
+        guide.type === 'spacing' ? (
+          guide.segments.map((segment, j) => (
+            <SpacingMarker key={`s-${i}-${j}`} axis={guide.axis} segment={segment} />
+          ))
+        ) : guide.type === 'v' ? (
           <line
             key={`v-${i}`}
             x1={guide.position}
@@ -1,5 +1,6 @@
 'use client';
 
+import { useEffect, useState } from 'react';
 import Link from 'next/link';
 import { Trash2, Layers } from 'lucide-react';
 import { Badge } from '@/components/ui/badge';
@@ -28,6 +29,18 @@ interface ProjectCardProps {
 }
 
 export function ProjectCard({ project, slideCount = 0, onDelete }: ProjectCardProps) {
+  const [thumbnailUrl, setThumbnailUrl] = useState<string | null>(null);
+
+  useEffect(() => {
+    if (!project.thumbnail) {
+      setThumbnailUrl(null);
+      return;
+    }
+    const url = URL.createObjectURL(project.thumbnail);
+    setThumbnailUrl(url);
+    return () => URL.revokeObjectURL(url);
+  }, [project.thumbnail]);
+
   return (
     <Link
       href={`/editor/${project.id}`}
@@ -35,9 +48,13 @@ export function ProjectCard({ project, slideCount = 0, onDelete }: ProjectCardPr
     >
       {/* Thumbnail area */}
       <div className="relative aspect-[3/4] w-full overflow-hidden bg-gradient-to-br from-primary/10 via-card to-primary/5">
-        <div className="absolute inset-0 flex items-center justify-center">
-          <Layers className="size-10 text-primary/20" />
-        </div>
+        {thumbnailUrl ? (
+          <img src={thumbnailUrl} alt="" className="absolute inset-0 size-full object-cover" />
+        ) : (
+          <div className="absolute inset-0 flex items-center justify-center">
+            <Layers className="size-10 text-primary/20" />
+          </div>
+        )}
         {slideCount > 0 && (
           <div className="absolute bottom-3 left-3">
             <Badge variant="secondary" className="bg-card/80 text-card-foreground backdrop-blur-sm border-0 text-xs">
@@ -0,0 +1,109 @@
+'use client';
+
+import { useEffect, useLayoutEffect, useRef, useState } from 'react';
+import type { Project } from '@/lib/db';
+import { ProjectCard } from './ProjectCard';
+
+const GAP = 16;
+const OVERSCAN_ROWS = 2;
+// Initial guess for the card's info area below the 3:4 thumbnail; replaced by
+// the measured card height after the first render
+const ESTIMATED_INFO_HEIGHT = 76;
+
+/** Mirrors `grid-cols-2 sm:grid-cols-3 md:grid-cols-4 lg:grid-cols-5` */
+function columnsForViewport(width: number): number {
+  if (width >= 1024) return 5;
+  if (width >= 768) return 4;
+  if (width >= 640) return 3;
+  return 2;
+}
+
+interface VirtualProjectGridProps {
+  projects: Project[];
+  onDelete: (id: string) => void;
+}
+
+/**
+ * Project grid that only mounts the rows inside (or near) the viewport.
+ * Rows are absolutely positioned inside a container sized for all of them,
+ * so the page keeps its normal window scrolling.
+ */
+export function VirtualProjectGrid({ projects, onDelete }: VirtualProjectGridProps) {
+  const containerRef = useRef<HTMLDivElement>(null);
+  const [layout, setLayout] = useState({ width: 0, columns: 2 });
+  // Measured card height, valid only for the card width it was measured at
+  const [measured, setMeasured] = useState<{ cardWidth: number; height: number } | null>(null);
+  const [rows, setRows] = useState({ start: 0, end: 0 });
+
+  useLayoutEffect(() => {
+    const el = containerRef.current;
+    if (!el) return;
+    const update = () => setLayout({ width: el.clientWidth, columns: columnsForViewport(window.innerWidth) });
+    update();
+    const observer = new ResizeObserver(update);
+    observer.observe(el);
+    return () => observer.disconnect();
+  }, []);
+
+  const { width, columns } = layout;
+  const cardWidth = width > 0 ? (width - GAP * (columns - 1)) / columns : 0;
+  // Card height changes with width, so a new width re-measures
+  const cardHeight = measured?.cardWidth === cardWidth ? measured.height : null;
+  const rowHeight = (cardHeight ?? cardWidth * (4 / 3) + ESTIMATED_INFO_HEIGHT) + GAP;
+  const rowCount = Math.ceil(projects.length / columns);
+
+  useEffect(() => {
+    const el = containerRef.current;
+    if (!el || cardWidth === 0) return;
+    const update = () => {
+      const top = el.getBoundingClientRect().top;
+      const start = Math.max(0, Math.floor(-top / rowHeight) - OVERSCAN_ROWS);
+      const end = Math.min(rowCount, Math.ceil((window.innerHeight - top) / rowHeight) + OVERSCAN_ROWS);
+      setRows((prev) => (prev.start === start && prev.end === end ? prev : { start, end }));
+    };
+    update();
+    window.addEventListener('scroll', update, { passive: true });
+    window.addEventListener('resize', update);
+    return () => {
+      window.removeEventListener('scroll', update);
+      window.removeEventListener('resize', update);
+    };
+  }, [cardWidth, rowHeight, rowCount]);
+
+  const measureCard = (node: HTMLDivElement | null) => {
+    if (node && cardHeight === null && node.offsetHeight > 0) setMeasured({ cardWidth, height: node.offsetHeight });
+  };
+
+  const cards: React.ReactNode[] = [];
+  for (let row = rows.start; row < rows.end; row++) {
+    for (let col = 0; col < columns; col++) {
+      const index = row * columns + col;
+      const project = projects[index];
+      if (!project) break;
+      cards.push(
+        <div
+          key={project.id}
+          ref={cards.length === 0 ? measureCard : undefined}
+          style={{
+            position: 'absolute',
+            top: row * rowHeight,
+            left: col * (cardWidth + GAP),
+            width: cardWidth,
+          }}
+        >
+          <ProjectCard project={project} slideCount={project.slideCount ?? 0} onDelete={onDelete} />
+        </div>,
+      );
+    }
+  }
+
+  return (
+    <div
+      ref={containerRef}
+      className="relative"
+      style={{ height: Math.max(0, rowCount * rowHeight - GAP) }}
+    >
+      {cards}
+    </div>
+  );
+}
@@ -1,20 +1,44 @@
 'use client';
 import { useEffect, useRef, useState, useCallback } from 'react';
-import { saveProjectSchema } from '@/lib/projects';
+import {
+  saveProjectSchema,
+  appendProjectJournal,
+  compactProjectJournal,
+  JOURNAL_COMPACT_THRESHOLD,
+} from '@/lib/projects';
 import type { CarouselSchema } from '@/types/schema';
 
 const DEBOUNCE_MS = 2000;
 
+function runWhenIdle(callback: () => void) {
+  if (typeof window.requestIdleCallback === 'function') {
+    window.requestIdleCallback(callback);
+  } else {
+    setTimeout(callback, 0);
+  }
+}
+
+/**
+ * Debounced auto-save. Each save appends only the delta since the last
+ * persisted schema to the project journal; the journal is compacted into the
+ * per-slide records in the background.
+ *
+ * `persistedSchema` is the schema as loaded from storage. Without it, the
+ * first save rewrites the whole project to establish a baseline.
+ */
 export function useAutoSave(
   projectId: string | null,
   schema: CarouselSchema | null,
   isDirty: boolean,
   onSaved?: () => void,
+  persistedSchema?: CarouselSchema,
 ) {
   const [isSaving, setIsSaving] = useState(false);
   const [lastSaved, setLastSaved] = useState<Date | null>(null);
   const timerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
   const schemaRef = useRef(schema);
+  const persistedRef = useRef<CarouselSchema | null>(persistedSchema ?? null);
+  const journalCountRef = useRef(0);
   const onSavedRef = useRef(onSaved);
   onSavedRef.current = onSaved;
 
@@ -35,9 +59,22 @@ export function useAutoSave(
 
     setIsSaving(true);
     try {
-      await saveProjectSchema(projectId, schemaAtSave);
+      if (persistedRef.current) {
+        const written = await appendProjectJournal(projectId, persistedRef.current, schemaAtSave);
+        if (written) journalCountRef.current++;
+      } else {
+        await saveProjectSchema(projectId, schemaAtSave);
+      }
+      persistedRef.current = schemaAtSave;
       setLastSaved(new Date());
 
+      if (journalCountRef.current >= JOURNAL_COMPACT_THRESHOLD) {
+        journalCountRef.current = 0;
+        runWhenIdle(() => {
+          compactProjectJournal(projectId).catch((err) => console.warn('[autosave] Compactação falhou', err));
+        });
+      }
+
       // Only mark as saved if the schema hasn't changed during the async save.
       // If user made changes while saving, isDirty stays true and we schedule another save.
       if (schemaRef.current === schemaAtSave) {
@@ -89,5 +126,14 @@ export function useAutoSave(
     return () => document.removeEventListener('visibilitychange', handleVisibilityChange);
   }, [isDirty, projectId, saveNow]);
 
+  // Fold any remaining journal entries when leaving the editor.
+  // Best-effort: entries left behind are replayed on the next load.
+  useEffect(() => {
+    if (!projectId) return;
+    return () => {
+      compactProjectJournal(projectId).catch(() => {});
+    };
+  }, [projectId]);
+
   return { isSaving, lastSaved, saveNow };
 }
@@ -5,11 +5,17 @@ import type { CarouselSchema, Slide, SlideElement, SlideLayout, Theme } from '@/
 import type { EditorState, EditorAction } from '@/types/editor';
 import { DEFAULT_THEME_DARK, createEmptySchema } from '@/types/schema';
 import { nanoid } from '@/lib/nanoid';
+import { applyCarouselPatch, createHistoryEntry, trimHistory } from '@/lib/undo-history';
+import { markAction } from '@/lib/render-profiler';
 
-const MAX_UNDO = 50;
+// Undo history is bounded by the estimated size of its patches, not by entry count
+const MAX_UNDO_BYTES = 16 * 1024 * 1024;
 
 const COALESCE_WINDOW_MS = 500;
 
+// Actions that never create an undo entry (they replace or walk the history)
+const HISTORY_EXEMPT_ACTIONS = new Set(['SET_CAROUSEL', 'UNDO', 'REDO']);
+
 // Action types that should coalesce when repeated rapidly (e.g. slider drags)
 const COALESCEABLE_ACTIONS = new Set([
   'UPDATE_ELEMENT',
@@ -32,7 +38,7 @@ function getActionElementId(action: EditorAction): string | undefined {
   }
 }
 
-function createInitialState(carousel?: CarouselSchema): EditorState {
+export function createInitialState(carousel?: CarouselSchema): EditorState {
   const defaultCarousel = carousel ?? createEmptySchema(nanoid());
 
   return {
@@ -49,13 +55,14 @@ function createInitialState(carousel?: CarouselSchema): EditorState {
   };
 }
 
-function pushUndo(state: EditorState, action: EditorAction): EditorState {
+function recordUndo(prev: EditorState, next: EditorState, action: EditorAction): EditorState {
   const now = Date.now();
-  const last = state.lastUndoAction;
+  const last = prev.lastUndoAction;
   const actionElementId = getActionElementId(action);
 
   // Coalesce: if the same coalesceable action type + element within the time window,
-  // replace the last undo entry instead of adding a new one
+  // keep extending the last undo entry instead of adding a new one. The entry's
+  // patch already covers the paths these actions touch.
   if (
     COALESCEABLE_ACTIONS.has(action.type) &&
     last &&
@@ -64,15 +71,16 @@ function pushUndo(state: EditorState, action: EditorAction): EditorState {
     now - last.timestamp < COALESCE_WINDOW_MS
   ) {
     return {
-      ...state,
+      ...next,
       lastUndoAction: { ...last, timestamp: now },
       isDirty: true,
     };
   }
 
-  const undoStack = [...state.undoStack, structuredClone(state.carousel)].slice(-MAX_UNDO);
+  const entry = createHistoryEntry(next.carousel, prev.carousel);
+  const undoStack = trimHistory([...prev.undoStack, entry], MAX_UNDO_BYTES);
   return {
-    ...state,
+    ...next,
     undoStack,
     redoStack: [],
     lastUndoAction: COALESCEABLE_ACTIONS.has(action.type)
@@ -94,67 +102,60 @@ function editorReducer(state: EditorState, action: EditorAction): EditorState {
       return { ...state, selectedElementId: action.payload };
 
     case 'UPDATE_SLIDE': {
-      const s = pushUndo(state, action);
-      const slides = [...s.carousel.slides];
+      const slides = [...state.carousel.slides];
       slides[action.payload.index] = action.payload.slide;
-      return { ...s, carousel: { ...s.carousel, slides } };
+      return { ...state, carousel: { ...state.carousel, slides } };
     }
 
     case 'ADD_SLIDE': {
-      const s = pushUndo(state, action);
-      const slides = [...s.carousel.slides];
+      const slides = [...state.carousel.slides];
       slides.splice(action.payload.afterIndex + 1, 0, action.payload.slide);
       return {
-        ...s,
-        carousel: { ...s.carousel, slides },
+        ...state,
+        carousel: { ...state.carousel, slides },
         selectedSlideIndex: action.payload.afterIndex + 1,
       };
     }
 
     case 'DELETE_SLIDE': {
       if (state.carousel.slides.length <= 1) return state;
-      const s = pushUndo(state, action);
-      const slides = s.carousel.slides.filter((_, i) => i !== action.payload);
-      const newIndex = Math.min(s.selectedSlideIndex, slides.length - 1);
-      return { ...s, carousel: { ...s.carousel, slides }, selectedSlideIndex: newIndex };
+      const slides = state.carousel.slides.filter((_, i) => i !== action.payload);
+      const newIndex = Math.min(state.selectedSlideIndex, slides.length - 1);
+      return { ...state, carousel: { ...state.carousel, slides }, selectedSlideIndex: newIndex };
     }
 
     case 'MOVE_SLIDE': {
       const { from, to } = action.payload;
       if (from === to) return state;
-      const s = pushUndo(state, action);
-      const slides = [...s.carousel.slides];
+      const slides = [...state.carousel.slides];
       const [moved] = slides.splice(from, 1);
       slides.splice(to, 0, moved);
-      return { ...s, carousel: { ...s.carousel, slides }, selectedSlideIndex: to };
+      return { ...state, carousel: { ...state.carousel, slides }, selectedSlideIndex: to };
     }
 
     case 'DUPLICATE_SLIDE': {
-      const s = pushUndo(state, action);
-      const original = s.carousel.slides[action.payload];
+      const original = state.carousel.slides[action.payload];
       if (!original) return state;
       const clone: Slide = structuredClone(original);
       clone.id = nanoid();
       clone.elements = clone.elements.map((el) => ({ ...el, id: nanoid() }));
-      const slides = [...s.carousel.slides];
+      const slides = [...state.carousel.slides];
       slides.splice(action.payload + 1, 0, clone);
-      return { ...s, carousel: { ...s.carousel, slides }, selectedSlideIndex: action.payload + 1 };
+      return { ...state, carousel: { ...state.carousel, slides }, selectedSlideIndex: action.payload + 1 };
     }
 
     case 'UPDATE_ELEMENT': {
-      const s = pushUndo(state, action);
-      const slides = [...s.carousel.slides];
+      const slides = [...state.carousel.slides];
       const slide = { ...slides[action.payload.slideIndex] };
       slide.elements = slide.elements.map((el) =>
         el.id === action.payload.elementId ? action.payload.element : el,
       );
       slides[action.payload.slideIndex] = slide;
-      return { ...s, carousel: { ...s.carousel, slides } };
+      return { ...state, carousel: { ...state.carousel, slides } };
     }
 
     case 'ADD_ELEMENT': {
-      const s = pushUndo(state, action);
-      const slides = [...s.carousel.slides];
+      const slides = [...state.carousel.slides];
       const slide = { ...slides[action.payload.slideIndex] };
       const elements = [...slide.elements];
       if (action.payload.element.type === 'overlay') {
@@ -168,21 +169,19 @@ function editorReducer(state: EditorState, action: EditorAction): EditorState {
       }
       slide.elements = elements;
       slides[action.payload.slideIndex] = slide;
-      return { ...s, carousel: { ...s.carousel, slides }, selectedElementId: action.payload.element.id };
+      return { ...state, carousel: { ...state.carousel, slides }, selectedElementId: action.payload.element.id };
     }
 
     case 'DELETE_ELEMENT': {
-      const s = pushUndo(state, action);
-      const slides = [...s.carousel.slides];
+      const slides = [...state.carousel.slides];
       const slide = { ...slides[action.payload.slideIndex] };
       slide.elements = slide.elements.filter((el) => el.id !== action.payload.elementId);
       slides[action.payload.slideIndex] = slide;
-      return { ...s, carousel: { ...s.carousel, slides }, selectedElementId: null };
+      return { ...state, carousel: { ...state.carousel, slides }, selectedElementId: null };
     }
 
     case 'DUPLICATE_ELEMENT': {
-      const s = pushUndo(state, action);
-      const slides = [...s.carousel.slides];
+      const slides = [...state.carousel.slides];
       const slide = { ...slides[action.payload.slideIndex] };
       const elements = [...slide.elements];
       const idx = elements.findIndex((el) => el.id === action.payload.elementId);
@@ -192,12 +191,11 @@ function editorReducer(state: EditorState, action: EditorAction): EditorState {
       elements.splice(idx + 1, 0, clone);
       slide.elements = elements;
       slides[action.payload.slideIndex] = slide;
-      return { ...s, carousel: { ...s.carousel, slides }, selectedElementId: clone.id };
+      return { ...state, carousel: { ...state.carousel, slides }, selectedElementId: clone.id };
     }
 
     case 'MOVE_ELEMENT': {
-      const s = pushUndo(state, action);
-      const slides = [...s.carousel.slides];
+      const slides = [...state.carousel.slides];
       const slide = { ...slides[action.payload.slideIndex] };
       const elements = [...slide.elements];
       const idx = elements.findIndex((el) => el.id === action.payload.elementId);
@@ -207,12 +205,11 @@ function editorReducer(state: EditorState, action: EditorAction): EditorState {
       [elements[idx], elements[newIdx]] = [elements[newIdx], elements[idx]];
       slide.elements = elements;
       slides[action.payload.slideIndex] = slide;
-      return { ...s, carousel: { ...s.carousel, slides } };
+      return { ...state, carousel: { ...state.carousel, slides } };
     }
 
     case 'REORDER_ELEMENT': {
-      const s = pushUndo(state, action);
-      const slides = [...s.carousel.slides];
+      const slides = [...state.carousel.slides];
       const slide = { ...slides[action.payload.slideIndex] };
       const elements = [...slide.elements];
       const fromIdx = elements.findIndex((el) => el.id === action.payload.elementId);
@@ -221,62 +218,54 @@ function editorReducer(state: EditorState, action: EditorAction): EditorState {
       elements.splice(action.payload.newIndex, 0, moved);
       slide.elements = elements;
       slides[action.payload.slideIndex] = slide;
-      return { ...s, carousel: { ...s.carousel, slides } };
+      return { ...state, carousel: { ...state.carousel, slides } };
     }
 
     case 'SET_THEME': {
-      const s = pushUndo(state, action);
-      return { ...s, carousel: { ...s.carousel, theme: action.payload } };
+      return { ...state, carousel: { ...state.carousel, theme: action.payload } };
     }
 
     case 'SET_FOOTER': {
-      const s = pushUndo(state, action);
-      return { ...s, carousel: { ...s.carousel, footer: { ...s.carousel.footer, text: action.payload } } };
+      return { ...state, carousel: { ...state.carousel, footer: { ...state.carousel.footer, text: action.payload } } };
     }
 
     case 'SET_HANDLE': {
-      const s = pushUndo(state, action);
-      return { ...s, carousel: { ...s.carousel, header: { ...s.carousel.header, handle: action.handle } } };
+      return { ...state, carousel: { ...state.carousel, header: { ...state.carousel.header, handle: action.handle } } };
     }
 
     case 'SET_SHOW_COUNTER': {
-      const s = pushUndo(state, action);
-      return { ...s, carousel: { ...s.carousel, header: { ...s.carousel.header, showCounter: action.show } } };
+      return { ...state, carousel: { ...state.carousel, header: { ...state.carousel.header, showCounter: action.show } } };
     }
 
     case 'SET_SLIDE_BG': {
-      const s = pushUndo(state, action);
-      const slides = [...s.carousel.slides];
+      const slides = [...state.carousel.slides];
       slides[action.payload.slideIndex] = {
         ...slides[action.payload.slideIndex],
         background: action.payload.color ?? null,
       };
-      return { ...s, carousel: { ...s.carousel, slides } };
+      return { ...state, carousel: { ...state.carousel, slides } };
     }
 
     case 'SET_SLIDE_BG_IMAGE': {
-      const s = pushUndo(state, action);
-      const slides = [...s.carousel.slides];
+      const slides = [...state.carousel.slides];
       slides[action.payload.slideIndex] = {
         ...slides[action.payload.slideIndex],
         backgroundImage: action.payload.image ?? null,
       };
-      return { ...s, carousel: { ...s.carousel, slides } };
+      return { ...state, carousel: { ...state.carousel, slides } };
     }
 
     case 'SET_SLIDE_BG_POSITION': {
-      const s = pushUndo(state, action);
-      const slides = [...s.carousel.slides];
+      const slides = [...state.carousel.slides];
       slides[action.payload.slideIndex] = {
         ...slides[action.payload.slideIndex],
         backgroundPosition: action.payload.position ?? undefined,
       };
-      return { ...s, carousel: { ...s.carousel, slides } };
+      return { ...state, carousel: { ...state.carousel, slides } };
     }
 
     case 'SET_SLIDE_LAYOUT': {
-      const s = pushUndo(state, action);
-      const slides = [...s.carousel.slides];
+      const slides = [...state.carousel.slides];
       const slide = { ...slides[action.payload.slideIndex] };
       const toFreeform = action.payload.layout === 'freeform';
 
@@ -316,7 +305,7 @@ function editorReducer(state: EditorState, action: EditorAction): EditorState {
       }
 
       slides[action.payload.slideIndex] = slide;
-      return { ...s, carousel: { ...s.carousel, slides }, selectedElementId: null };
+      return { ...state, carousel: { ...state.carousel, slides }, selectedElementId: null };
     }
 
     case 'TOGGLE_PREVIEW':
@@ -331,16 +320,18 @@ function editorReducer(state: EditorState, action: EditorAction): EditorState {
     case 'UNDO': {
       if (state.undoStack.length === 0) return state;
       const undoStack = [...state.undoStack];
-      const previous = undoStack.pop()!;
-      const redoStack = [...state.redoStack, structuredClone(state.carousel)];
+      const entry = undoStack.pop()!;
+      const previous = applyCarouselPatch(state.carousel, entry.patch);
+      const redoStack = [...state.redoStack, createHistoryEntry(previous, state.carousel)];
       return { ...state, carousel: previous, undoStack, redoStack, isDirty: true, lastUndoAction: null };
     }
 
     case 'REDO': {
       if (state.redoStack.length === 0) return state;
       const redoStack = [...state.redoStack];
-      const next = redoStack.pop()!;
-      const undoStack = [...state.undoStack, structuredClone(state.carousel)];
+      const entry = redoStack.pop()!;
+      const next = applyCarouselPatch(state.carousel, entry.patch);
+      const undoStack = trimHistory([...state.undoStack, createHistoryEntry(next, state.carousel)], MAX_UNDO_BYTES);
       return { ...state, carousel: next, undoStack, redoStack, isDirty: true, lastUndoAction: null };
     }
 
@@ -352,47 +343,59 @@ function editorReducer(state: EditorState, action: EditorAction): EditorState {
   }
 }
 
+/** The editor reducer with undo history; also driven directly by scripts/bench-undo.ts */
+export function historyReducer(state: EditorState, action: EditorAction): EditorState {
+  const next = editorReducer(state, action);
+  if (next.carousel === state.carousel || HISTORY_EXEMPT_ACTIONS.has(action.type)) return next;
+  return recordUndo(state, next, action);
+}
+
 export function useEditorReducer(initialCarousel?: CarouselSchema) {
-  const [state, dispatch] = useReducer(editorReducer, initialCarousel, createInitialState);
-
-  const setCarousel = useCallback((c: CarouselSchema) => dispatch({ type: 'SET_CAROUSEL', payload: c }), []);
-  const selectSlide = useCallback((i: number) => dispatch({ type: 'SELECT_SLIDE', payload: i }), []);
-  const selectElement = useCallback((id: string | null) => dispatch({ type: 'SELECT_ELEMENT', payload: id }), []);
-  const updateSlide = useCallback((index: number, slide: Slide) => dispatch({ type: 'UPDATE_SLIDE', payload: { index, slide } }), []);
-  const addSlide = useCallback((afterIndex: number, slide: Slide) => dispatch({ type: 'ADD_SLIDE', payload: { afterIndex, slide } }), []);
-  const deleteSlide = useCallback((index: number) => dispatch({ type: 'DELETE_SLIDE', payload: index }), []);
-  const moveSlide = useCallback((from: number, to: number) => dispatch({ type: 'MOVE_SLIDE', payload: { from, to } }), []);
-  const duplicateSlide = useCallback((index: number) => dispatch({ type: 'DUPLICATE_SLIDE', payload: index }), []);
+  const [state, rawDispatch] = useReducer(historyReducer, initialCarousel, createInitialState);
+  // Tags the commit that follows with the action type for the render profiler
+  const dispatch = useCallback((action: EditorAction) => {
+    markAction(action.type);
+    rawDispatch(action);
+  }, []);
+
+  const setCarousel = useCallback((c: CarouselSchema) => dispatch({ type: 'SET_CAROUSEL', payload: c }), [dispatch]);
+  const selectSlide = useCallback((i: number) => dispatch({ type: 'SELECT_SLIDE', payload: i }), [dispatch]);
+  const selectElement = useCallback((id: string | null) => dispatch({ type: 'SELECT_ELEMENT', payload: id }), [dispatch]);
+  const updateSlide = useCallback((index: number, slide: Slide) => dispatch({ type: 'UPDATE_SLIDE', payload: { index, slide } }), [dispatch]);
+  const addSlide = useCallback((afterIndex: number, slide: Slide) => dispatch({ type: 'ADD_SLIDE', payload: { afterIndex, slide } }), [dispatch]);
+  const deleteSlide = useCallback((index: number) => dispatch({ type: 'DELETE_SLIDE', payload: index }), [dispatch]);
+  const moveSlide = useCallback((from: number, to: number) => dispatch({ type: 'MOVE_SLIDE', payload: { from, to } }), [dispatch]);
+  const duplicateSlide = useCallback((index: number) => dispatch({ type: 'DUPLICATE_SLIDE', payload: index }), [dispatch]);
   const updateElement = useCallback((slideIndex: number, elementId: string, element: SlideElement) =>
-    dispatch({ type: 'UPDATE_ELEMENT', payload: { slideIndex, elementId, element } }), []);
+    dispatch({ type: 'UPDATE_ELEMENT', payload: { slideIndex, elementId, element } }), [dispatch]);
   const addElement = useCallback((slideIndex: number, afterElementId: string | null, element: SlideElement) =>
-    dispatch({ type: 'ADD_ELEMENT', payload: { slideIndex, afterElementId, element } }), []);
+    dispatch({ type: 'ADD_ELEMENT', payload: { slideIndex, afterElementId, element } }), [dispatch]);
   const deleteElement = useCallback((slideIndex: number, elementId: string) =>
-    dispatch({ type: 'DELETE_ELEMENT', payload: { slideIndex, elementId } }), []);
+    dispatch({ type: 'DELETE_ELEMENT', payload: { slideIndex, elementId } }), [dispatch]);
   const duplicateElement = useCallback((slideIndex: number, elementId: string) =>
-    dispatch({ type: 'DUPLICATE_ELEMENT', payload: { slideIndex, elementId } }), []);
+    dispatch({ type: 'DUPLICATE_ELEMENT', payload: { slideIndex, elementId } }), [dispatch]);
   const moveElement = useCallback((slideIndex: number, elementId: string, direction: 'up' | 'down') =>
-    dispatch({ type: 'MOVE_ELEMENT', payload: { slideIndex, elementId, direction } }), []);
+    dispatch({ type: 'MOVE_ELEMENT', payload: { slideIndex, elementId, direction } }), [dispatch]);
   const reorderElement = useCallback((slideIndex: number, elementId: string, newIndex: number) =>
-    dispatch({ type: 'REORDER_ELEMENT', payload: { slideIndex, elementId, newIndex } }), []);
-  const setTheme = useCallback((theme: Theme) => dispatch({ type: 'SET_THEME', payload: theme }), []);
-  const setFooter = useCallback((footer: string) => dispatch({ type: 'SET_FOOTER', payload: footer }), []);
-  const setHandle = useCallback((handle: string) => dispatch({ type: 'SET_HANDLE', handle }), []);
-  const setShowCounter = useCallback((show: boolean) => dispatch({ type: 'SET_SHOW_COUNTER', show }), []);
+    dispatch({ type: 'REORDER_ELEMENT', payload: { slideIndex, elementId, newIndex } }), [dispatch]);
+  const setTheme = useCallback((theme: Theme) => dispatch({ type: 'SET_THEME', payload: theme }), [dispatch]);
+  const setFooter = useCallback((footer: string) => dispatch({ type: 'SET_FOOTER', payload: footer }), [dispatch]);
+  const setHandle = useCallback((handle: string) => dispatch({ type: 'SET_HANDLE', handle }), [dispatch]);
+  const setShowCounter = useCallback((show: boolean) => dispatch({ type: 'SET_SHOW_COUNTER', show }), [dispatch]);
   const setSlideBg = useCallback((slideIndex: number, color: string | undefined) =>
-    dispatch({ type: 'SET_SLIDE_BG', payload: { slideIndex, color } }), []);
+    dispatch({ type: 'SET_SLIDE_BG', payload: { slideIndex, color } }), [dispatch]);
   const setSlideBgImage = useCallback((slideIndex: number, image: string | undefined) =>
-    dispatch({ type: 'SET_SLIDE_BG_IMAGE', payload: { slideIndex, image } }), []);
+    dispatch({ type: 'SET_SLIDE_BG_IMAGE', payload: { slideIndex, image } }), [dispatch]);
   const setSlideBgPosition = useCallback((slideIndex: number, position: string | undefined) =>
-    dispatch({ type: 'SET_SLIDE_BG_POSITION', payload: { slideIndex, position } }), []);
+    dispatch({ type: 'SET_SLIDE_BG_POSITION', payload: { slideIndex, position } }), [dispatch]);
   const setSlideLayout = useCallback((slideIndex: number, layout: SlideLayout, elementUpdates?: Record<string, Partial<SlideElement>>) =>
-    dispatch({ type: 'SET_SLIDE_LAYOUT', payload: { slideIndex, layout, elementUpdates } }), []);
-  const togglePreview = useCallback(() => dispatch({ type: 'TOGGLE_PREVIEW' }), []);
-  const setViewMode = useCallback((mode: 'horizontal' | 'grid') => dispatch({ type: 'SET_VIEW_MODE', payload: mode }), []);
-  const setZoom = useCallback((zoom: number) => dispatch({ type: 'SET_ZOOM', payload: zoom }), []);
-  const undo = useCallback(() => dispatch({ type: 'UNDO' }), []);
-  const redo = useCallback(() => dispatch({ type: 'REDO' }), []);
-  const markSaved = useCallback(() => dispatch({ type: 'MARK_SAVED' }), []);
+    dispatch({ type: 'SET_SLIDE_LAYOUT', payload: { slideIndex, layout, elementUpdates } }), [dispatch]);
+  const togglePreview = useCallback(() => dispatch({ type: 'TOGGLE_PREVIEW' }), [dispatch]);
+  const setViewMode = useCallback((mode: 'horizontal' | 'grid') => dispatch({ type: 'SET_VIEW_MODE', payload: mode }), [dispatch]);
+  const setZoom = useCallback((zoom: number) => dispatch({ type: 'SET_ZOOM', payload: zoom }), [dispatch]);
+  const undo = useCallback(() => dispatch({ type: 'UNDO' }), [dispatch]);
+  const redo = useCallback(() => dispatch({ type: 'REDO' }), [dispatch]);
+  const markSaved = useCallback(() => dispatch({ type: 'MARK_SAVED' }), [dispatch]);
 
   const actions = useMemo(() => ({
     setCarousel, selectSlide, selectElement, updateSlide, addSlide, deleteSlide,
@@ -1,14 +1,14 @@
 'use client';
 
-import { useCallback, useRef } from 'react';
+import { useCallback, useEffect, useRef } from 'react';
 import type { SlideElement } from '@/types/schema';
-import { calculateSmartGuides, type GuideLine } from '@/hooks/useSmartGuides';
+import { createSnapIndex, sameGuides, snapToIndex, type GuideLine, type SnapIndex } from '@/hooks/useSmartGuides';
 
 interface UseFreeformDragProps {
   element: SlideElement;
   scale: number;
   onUpdate: (element: SlideElement) => void;
-  otherElements?: SlideElement[];
+  getOtherElements?: () => SlideElement[];
   onGuidesChange?: (guides: GuideLine[]) => void;
 }
 
@@ -23,7 +23,7 @@ interface DragState {
   startElementH: number;
 }
 
-export function useFreeformDrag({ element, scale, onUpdate, otherElements, onGuidesChange }: UseFreeformDragProps) {
+export function useFreeformDrag({ element, scale, onUpdate, getOtherElements, onGuidesChange }: UseFreeformDragProps) {
   const dragState = useRef<DragState>({
     isDragging: false,
     isResizing: false,
@@ -40,19 +40,24 @@ export function useFreeformDrag({ element, scale, onUpdate, otherElements, onGui
   elementRef.current = element;
   const onUpdateRef = useRef(onUpdate);
   onUpdateRef.current = onUpdate;
-  const otherElementsRef = useRef(otherElements);
-  otherElementsRef.current = otherElements;
+  const getOtherElementsRef = useRef(getOtherElements);
+  getOtherElementsRef.current = getOtherElements;
   const onGuidesChangeRef = useRef(onGuidesChange);
   onGuidesChangeRef.current = onGuidesChange;
   const scaleRef = useRef(scale);
   scaleRef.current = scale;
 
-  // Cleanup ref to remove stale listeners from previous drag sessions
-  const cleanupRef = useRef<(() => void) | null>(null);
+  // Ends the current drag session: removes its listeners and either commits
+  // or drops the pending frame
+  const cleanupRef = useRef<((commit: boolean) => void) | null>(null);
+
+  // If the element unmounts mid-drag (slide deleted, view switched), drop the
+  // pending update instead of dispatching it for an element that is gone
+  useEffect(() => () => cleanupRef.current?.(false), []);
 
   const handleDragStart = useCallback((e: React.MouseEvent, mode: 'drag' | 'resize') => {
     // Clean up any stale listeners from a previous session that didn't get a mouseup
-    cleanupRef.current?.();
+    cleanupRef.current?.(true);
     cleanupRef.current = null;
 
     e.stopPropagation();
@@ -71,6 +76,37 @@ export function useFreeformDrag({ element, scale, onUpdate, otherElements, onGui
 
     const THRESHOLD = 4; // px before drag is considered real
 
+    // Other elements stay put during a drag, so their snap targets are
+    // indexed once when the drag activates rather than on every mousemove
+    let snapIndex: SnapIndex | null = null;
+
+    // Pointer events can fire several times per frame; only the latest
+    // result is dispatched, once per animation frame
+    let frame = 0;
+    let pendingElement: SlideElement | null = null;
+    let pendingGuides: GuideLine[] | null = null;
+    let lastGuides: GuideLine[] = [];
+
+    const flush = () => {
+      frame = 0;
+      if (pendingGuides && !sameGuides(pendingGuides, lastGuides)) {
+        lastGuides = pendingGuides;
+        onGuidesChangeRef.current?.(pendingGuides);
+      }
+      if (pendingElement) onUpdateRef.current(pendingElement);
+      pendingElement = null;
+      pendingGuides = null;
+    };
+
+    const schedule = (next: SlideElement, guides?: GuideLine[]) => {
+      const current = elementRef.current;
+      pendingElement = next.x === current.x && next.y === current.y && next.w === current.w && next.h === current.h
+        ? null
+        : next;
+      if (guides) pendingGuides = guides;
+      if (!frame) frame = requestAnimationFrame(flush);
+    };
+
     const handleMouseMove = (ev: MouseEvent) => {
       const state = dragState.current;
       const dx = ev.clientX - state.startX;
@@ -102,36 +138,35 @@ export function useFreeformDrag({ element, scale, onUpdate, otherElements, onGui
         const elH = currentElement.h ?? 50;
 
         // Smart guide snapping
-        const others = (otherElementsRef.current ?? [])
-          .filter((el) => el.id !== currentElement.id)
-          .map((el) => ({
-            x: el.x ?? 0,
-            y: el.y ?? 0,
-            w: el.w ?? 200,
-            h: el.h ?? 50,
-          }));
-
-        const guideResult = calculateSmartGuides(
-          { x: rawX, y: rawY, w: elW, h: elH },
-          others,
-        );
+        if (!snapIndex) {
+          snapIndex = createSnapIndex(
+            (getOtherElementsRef.current?.() ?? [])
+              .filter((el) => el.id !== currentElement.id)
+              .map((el) => ({
+                x: el.x ?? 0,
+                y: el.y ?? 0,
+                w: el.w ?? 200,
+                h: el.h ?? 50,
+              })),
+          );
+        }
+
+        const guideResult = snapToIndex(snapIndex, { x: rawX, y: rawY, w: elW, h: elH });
 
         const newX = Math.max(0, Math.min(1080 - elW, guideResult.snappedX));
         const newY = Math.max(0, Math.min(1440 - elH, guideResult.snappedY));
 
-        onGuidesChangeRef.current?.(guideResult.guides);
-
-        onUpdateRef.current({
+        schedule({
           ...currentElement,
           x: Math.round(newX),
           y: Math.round(newY),
-        });
+        }, guideResult.guides);
       } else if (state.isResizing) {
         // Resize: update width and height
         const newW = Math.max(100, state.startElementW + deltaX);
         const newH = Math.max(50, state.startElementH + deltaY);
 
-        onUpdateRef.current({
+        schedule({
           ...currentElement,
           w: Math.round(newW),
           h: Math.round(newH),
@@ -139,23 +174,31 @@ export function useFreeformDrag({ element, scale, onUpdate, otherElements, onGui
       }
     };
 
-    const cleanup = () => {
+    const cleanup = (commit: boolean) => {
       const state = dragState.current;
       const wasActive = state.isDragging || state.isResizing;
       state.isDragging = false;
       state.isResizing = false;
 
+      if (frame) {
+        cancelAnimationFrame(frame);
+        // Commit the final position synchronously so the drop is never lost
+        if (commit) flush();
+        frame = 0;
+      }
       onGuidesChangeRef.current?.([]);
 
       document.removeEventListener('mousemove', handleMouseMove);
-      document.removeEventListener('mouseup', cleanup);
+      document.removeEventListener('mouseup', handleMouseUp);
       if (wasActive) document.body.style.cursor = '';
       cleanupRef.current = null;
     };
 
+    const handleMouseUp = () => cleanup(true);
+
     cleanupRef.current = cleanup;
     document.addEventListener('mousemove', handleMouseMove);
-    document.addEventListener('mouseup', cleanup);
+    document.addEventListener('mouseup', handleMouseUp);
   }, []);
 
   const startDrag = useCallback((e: React.MouseEvent) => {
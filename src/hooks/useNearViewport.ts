@@ -0,0 +1,100 @@
+'use client';
+import { useCallback, useEffect, useMemo, useRef, useState } from 'react';
+
+// Items within one root-size of the visible area count as near, so slides are
+// mounted before they scroll into view and unmounted once well out of it
+const NEAR_MARGIN = '100%';
+
+// Lists this short are always fully mounted; windowing them saves nothing
+const SMALL_LIST = 12;
+
+// Items this far from `around` count as near until the observer reports
+const DEFAULT_SEED_RADIUS = 2;
+
+export interface NearViewportSeed {
+  /** Index the visible area is expected to start from (e.g. the active slide) */
+  around: number;
+  radius?: number;
+  /** Re-seed when this changes, e.g. when the list moves to another container */
+  key?: unknown;
+}
+
+function seedIds(ids: readonly string[], { around, radius = DEFAULT_SEED_RADIUS }: NearViewportSeed): ReadonlySet<string> {
+  return new Set(ids.slice(Math.max(0, around - radius), around + radius + 1));
+}
+
+/**
+ * Tracks which items of a scroll container are in or near its visible area,
+ * using a single IntersectionObserver for all of them.
+ *
+ * Attach `setRoot` as the scroll container's ref and `observe(id)` as each
+ * item's ref; `nearIds` holds the ids currently near the viewport. Until the
+ * observer first reports, the items within `seed.radius` of `seed.around`
+ * count as near, so the first paint (and the first paint after `seed.key`
+ * changes) already shows them. Short lists are always fully near.
+ */
+export function useNearViewport(ids: readonly string[], seed: NearViewportSeed) {
+  const [root, setRoot] = useState<HTMLElement | null>(null);
+  const [nearIds, setNearIds] = useState(() => seedIds(ids, seed));
+  const [seedKey, setSeedKey] = useState(seed.key);
+  if (seedKey !== seed.key) {
+    setSeedKey(seed.key);
+    setNearIds(seedIds(ids, seed));
+  }
+  const observerRef = useRef<IntersectionObserver | null>(null);
+  const nodesRef = useRef(new Map<string, HTMLElement>());
+  const refCallbacksRef = useRef(new Map<string, (node: HTMLElement | null) => void>());
+
+  useEffect(() => {
+    if (!root) return;
+    const observer = new IntersectionObserver(
+      (entries) => {
+        setNearIds((prev) => {
+          let next: Set<string> | null = null;
+          for (const entry of entries) {
+            const id = (entry.target as HTMLElement).dataset.nearId;
+            if (!id || entry.isIntersecting === prev.has(id)) continue;
+            next ??= new Set(prev);
+            if (entry.isIntersecting) next.add(id);
+            else next.delete(id);
+          }
+          return next ?? prev;
+        });
+      },
+      { root, rootMargin: NEAR_MARGIN },
+    );
+    observerRef.current = observer;
+    for (const node of nodesRef.current.values()) observer.observe(node);
+    return () => {
+      observer.disconnect();
+      observerRef.current = null;
+    };
+  }, [root]);
+
+  // One ref callback per id, so React doesn't detach and re-attach it on
+  // every render
+  const observe = useCallback((id: string) => {
+    let callback = refCallbacksRef.current.get(id);
+    if (!callback) {
+      callback = (node: HTMLElement | null) => {
+        const nodes = nodesRef.current;
+        const previous = nodes.get(id);
+        if (previous) observerRef.current?.unobserve(previous);
+        if (node) {
+          node.dataset.nearId = id;
+          nodes.set(id, node);
+          observerRef.current?.observe(node);
+        } else {
+          nodes.delete(id);
+          refCallbacksRef.current.delete(id);
+        }
+      };
+      refCallbacksRef.current.set(id, callback);
+    }
+    return callback;
+  }, []);
+
+  const allIds = useMemo(() => (ids.length <= SMALL_LIST ? new Set(ids) : null), [ids]);
+
+  return { setRoot, observe, nearIds: allIds ?? nearIds };
+}
@@ -0,0 +1,127 @@
+'use client';
+import { useEffect, useMemo, useRef, useState } from 'react';
+import { useLiveQuery } from 'dexie-react-hooks';
+import { createSlideImageRenderer, type SlideImageRenderer } from '@/lib/export-png';
+import {
+  generateThumbnails,
+  getAssetVersions,
+  getCachedThumbnails,
+  setProjectThumbnail,
+  slideThumbnailKey,
+} from '@/lib/thumbnails';
+import type { CarouselSchema } from '@/types/schema';
+
+const REFRESH_DELAY_MS = 800;
+
+/**
+ * Thumbnail object URLs by slide id, backed by the persistent thumbnail cache.
+ *
+ * Only slides whose content key changed are re-rendered, in idle time after
+ * edits settle. Until then the slide keeps showing its previous thumbnail;
+ * slides without any thumbnail yet are simply absent from the result.
+ * The first slide's thumbnail also becomes the project's gallery cover.
+ * Renders share one offscreen stage and encoder for the lifetime of the hook.
+ */
+export function useSlideThumbnails(carousel: CarouselSchema, projectId: string): Record<string, string> {
+  const [thumbnails, setThumbnails] = useState<Record<string, string>>({});
+  const thumbnailsRef = useRef(thumbnails);
+  const urlsRef = useRef(new Map<string, string>());
+  const rendererRef = useRef<SlideImageRenderer | null>(null);
+  const carouselRef = useRef(carousel);
+  carouselRef.current = carousel;
+
+  // Re-queried whenever the project's assets change, so replacing an image
+  // under the same filename invalidates the slides that show it
+  const assetVersions = useLiveQuery(() => getAssetVersions(projectId), [projectId]);
+  const assetVersionsRef = useRef(assetVersions);
+  assetVersionsRef.current = assetVersions;
+
+  const keySignature = useMemo(
+    () => (assetVersions
+      ? carousel.slides.map((_, i) => slideThumbnailKey(carousel, i, assetVersions)).join('|')
+      : null),
+    [carousel, assetVersions],
+  );
+
+  useEffect(() => {
+    if (keySignature === null) return;
+    const controller = new AbortController();
+    const urls = urlsRef.current;
+
+    const refresh = async () => {
+      const snapshot = carouselRef.current;
+      const versions = assetVersionsRef.current!;
+      const keys = snapshot.slides.map((_, i) => slideThumbnailKey(snapshot, i, versions));
+      const blobs = new Map<string, Blob>();
+
+      const publish = () => {
+        if (controller.signal.aborted) return;
+        const prev = thumbnailsRef.current;
+        const next: Record<string, string> = {};
+        snapshot.slides.forEach((slide, i) => {
+          const url = urls.get(keys[i]) ?? prev[slide.id];
+          if (url) next[slide.id] = url;
+        });
+        thumbnailsRef.current = next;
+        setThumbnails(next);
+      };
+
+      const cached = await getCachedThumbnails(keys.filter((key) => !urls.has(key)));
+      for (const [key, blob] of cached) {
+        blobs.set(key, blob);
+        urls.set(key, URL.createObjectURL(blob));
+      }
+      publish();
+
+      const missing = new Map<number, string>();
+      keys.forEach((key, i) => {
+        if (!urls.has(key)) missing.set(i, key);
+      });
+      rendererRef.current ??= createSlideImageRenderer();
+      await generateThumbnails(rendererRef.current, snapshot, projectId, missing, (_, key, blob) => {
+        blobs.set(key, blob);
+        if (!urls.has(key)) urls.set(key, URL.createObjectURL(blob));
+        publish();
+      }, controller.signal);
+      if (controller.signal.aborted) return;
+
+      const cover = keys[0] !== undefined ? blobs.get(keys[0]) : undefined;
+      if (cover) await setProjectThumbnail(projectId, keys[0], cover);
+
+      // Every slide is now up to date — free URLs of superseded thumbnails
+      const visible = new Set(Object.values(thumbnailsRef.current));
+      for (const [key, url] of urls) {
+        if (!visible.has(url)) {
+          URL.revokeObjectURL(url);
+          urls.delete(key);
+        }
+      }
+    };
+
+    const timer = setTimeout(() => {
+      refresh().catch((err) => {
+        if (!(err instanceof DOMException && err.name === 'AbortError')) {
+          console.warn('[thumbnails] Falha ao gerar miniaturas', err);
+        }
+      });
+    }, urls.size === 0 ? 0 : REFRESH_DELAY_MS);
+
+    return () => {
+      clearTimeout(timer);
+      controller.abort();
+    };
+  }, [keySignature, projectId]);
+
+  // Revoke every URL and release the offscreen stage on unmount
+  useEffect(() => {
+    const urls = urlsRef.current;
+    return () => {
+      rendererRef.current?.dispose();
+      rendererRef.current = null;
+      for (const url of urls.values()) URL.revokeObjectURL(url);
+      urls.clear();
+    };
+  }, []);
+
+  return thumbnails;
+}
@@ -1,123 +1,341 @@
-export interface GuideLine {
-  type: 'h' | 'v';
-  position: number;
+export interface SpacingSegment {
+  /** Start/end of the gap along the guide's axis */
+  start: number;
+  end: number;
+  /** Position on the other axis where the gap is drawn */
+  cross: number;
 }
 
+export type GuideLine =
+  | { type: 'h' | 'v'; position: number }
+  /** Equal-distance guide: every segment has the same length */
+  | { type: 'spacing'; axis: 'x' | 'y'; segments: SpacingSegment[] };
+
 export interface GuideResult {
   snappedX: number;
   snappedY: number;
   guides: GuideLine[];
 }
 
-interface Rect {
+export interface Rect {
   x: number;
   y: number;
   w: number;
   h: number;
 }
 
+/**
+ * Snap targets for one axis, built once per drag session.
+ * `lines` holds every edge/center (plus the slide's own) in ascending order;
+ * `byEnd`/`byStart` index the other elements' extents on this axis so the
+ * nearest neighbours of the dragged element are found by binary search.
+ */
+interface AxisIndex {
+  lines: Float64Array;
+  /** Rects sorted by far edge (x + w, or y + h) */
+  byEnd: Rect[];
+  ends: Float64Array;
+  /** Rects sorted by near edge (x, or y) */
+  byStart: Rect[];
+  starts: Float64Array;
+  /** Nearest neighbour before/after each rect on this axis (cross-axis overlapping) */
+  neighbourBefore: Map<Rect, Rect>;
+  neighbourAfter: Map<Rect, Rect>;
+}
+
+export interface SnapIndex {
+  x: AxisIndex;
+  y: AxisIndex;
+}
+
 const SLIDE_WIDTH = 1080;
 const SLIDE_HEIGHT = 1440;
 const DEFAULT_THRESHOLD = 5;
 
+type Axis = 'x' | 'y';
+
+const start = (r: Rect, axis: Axis) => (axis === 'x' ? r.x : r.y);
+const size = (r: Rect, axis: Axis) => (axis === 'x' ? r.w : r.h);
+const end = (r: Rect, axis: Axis) => start(r, axis) + size(r, axis);
+const other = (axis: Axis): Axis => (axis === 'x' ? 'y' : 'x');
+
+/** True when two rects share some extent on the given axis */
+function overlaps(a: Rect, b: Rect, axis: Axis): boolean {
+  return start(a, axis) < end(b, axis) && start(b, axis) < end(a, axis);
+}
+
+/** Index of the first value >= target */
+function lowerBound(values: Float64Array, target: number): number {
+  let lo = 0;
+  let hi = values.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (values[mid] < target) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+/** Index of the first value > target */
+function upperBound(values: Float64Array, target: number): number {
+  let lo = 0;
+  let hi = values.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (values[mid] <= target) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+/** Closest rect that ends at or before `limit` and overlaps `rect` on the cross axis */
+function findBefore(index: AxisIndex, rect: Rect, limit: number, axis: Axis): Rect | null {
+  for (let i = upperBound(index.ends, limit) - 1; i >= 0; i--) {
+    const candidate = index.byEnd[i];
+    if (candidate !== rect && overlaps(candidate, rect, other(axis))) return candidate;
+  }
+  return null;
+}
+
+/** Closest rect that starts at or after `limit` and overlaps `rect` on the cross axis */
+function findAfter(index: AxisIndex, rect: Rect, limit: number, axis: Axis): Rect | null {
+  for (let i = lowerBound(index.starts, limit); i < index.byStart.length; i++) {
+    const candidate = index.byStart[i];
+    if (candidate !== rect && overlaps(candidate, rect, other(axis))) return candidate;
+  }
+  return null;
+}
+
 /**
- * Calculate smart guides for a dragging element.
- * Snaps to slide center/edges and other element edges/centers.
+ * Records, for every rect, the closest rect before it on `axis` that overlaps
+ * it on the cross axis (and the reverse link).
+ *
+ * Sweeps the rects in near-edge order while feeding in, in far-edge order,
+ * every rect that has already ended. Candidates are painted over the cells of
+ * their cross-axis extent in a segment tree; since they arrive in far-edge
+ * order, the latest candidate painted over any overlapping cell is the
+ * closest one. O(n log n) instead of a pairwise scan.
  */
-export function calculateSmartGuides(
-  dragging: Rect,
-  others: Rect[],
-  threshold = DEFAULT_THRESHOLD,
-): GuideResult {
-  const guides: GuideLine[] = [];
-  let snappedX = dragging.x;
-  let snappedY = dragging.y;
-
-  // Dragging element edges
-  const dLeft = dragging.x;
-  const dCenterX = dragging.x + dragging.w / 2;
-  const dRight = dragging.x + dragging.w;
-  const dTop = dragging.y;
-  const dCenterY = dragging.y + dragging.h / 2;
-  const dBottom = dragging.y + dragging.h;
-
-  // Vertical snap targets (x-axis lines)
-  const vTargets: number[] = [
-    0,                      // left edge
-    SLIDE_WIDTH / 2,        // center (540)
-    SLIDE_WIDTH,            // right edge
-  ];
-
-  // Horizontal snap targets (y-axis lines)
-  const hTargets: number[] = [
-    0,                      // top edge
-    SLIDE_HEIGHT / 2,       // center (720)
-    SLIDE_HEIGHT,           // bottom edge
-  ];
-
-  // Add targets from other elements
-  for (const other of others) {
-    const oLeft = other.x;
-    const oCenterX = other.x + other.w / 2;
-    const oRight = other.x + other.w;
-    const oTop = other.y;
-    const oCenterY = other.y + other.h / 2;
-    const oBottom = other.y + other.h;
-
-    vTargets.push(oLeft, oCenterX, oRight);
-    hTargets.push(oTop, oCenterY, oBottom);
+function linkNeighbours(index: AxisIndex, axis: Axis): void {
+  const cross = other(axis);
+  const { byStart, byEnd, ends } = index;
+  const coords = [...new Set(byStart.flatMap((r) => [start(r, cross), end(r, cross)]))].sort((a, b) => a - b);
+  const cells = coords.length - 1;
+  if (cells < 1) return;
+  const cellIndex = new Map(coords.map((value, i) => [value, i]));
+
+  // latest[n]: latest rect painted over any cell below node n
+  // cover[n]: latest rect painted over every cell below node n
+  const latest: (Rect | undefined)[] = [];
+  const cover: (Rect | undefined)[] = [];
+  const order = new Map<Rect, number>();
+
+  const newer = (a: Rect | undefined, b: Rect | undefined) =>
+    (!a ? b : !b ? a : order.get(a)! > order.get(b)! ? a : b);
+
+  const paint = (n: number, lo: number, hi: number, from: number, to: number, rect: Rect) => {
+    if (to <= lo || hi <= from) return;
+    latest[n] = rect;
+    if (from <= lo && hi <= to) {
+      cover[n] = rect;
+      return;
+    }
+    const mid = (lo + hi) >>> 1;
+    paint(n * 2, lo, mid, from, to, rect);
+    paint(n * 2 + 1, mid, hi, from, to, rect);
+  };
+
+  const query = (n: number, lo: number, hi: number, from: number, to: number): Rect | undefined => {
+    if (to <= lo || hi <= from) return undefined;
+    if (from <= lo && hi <= to) return latest[n];
+    const mid = (lo + hi) >>> 1;
+    return newer(cover[n], newer(query(n * 2, lo, mid, from, to), query(n * 2 + 1, mid, hi, from, to)));
+  };
+
+  const cellRange = (r: Rect): [number, number] => [cellIndex.get(start(r, cross))!, cellIndex.get(end(r, cross))!];
+
+  let ended = 0;
+  for (const rect of byStart) {
+    const near = start(rect, axis);
+    while (ended < byEnd.length && ends[ended] <= near) {
+      const candidate = byEnd[ended++];
+      order.set(candidate, ended);
+      const [from, to] = cellRange(candidate);
+      paint(1, 0, cells, from, to, candidate);
+    }
+
+    const [from, to] = cellRange(rect);
+    const before = query(1, 0, cells, from, to);
+    if (before && before !== rect) {
+      index.neighbourBefore.set(rect, before);
+      // The first rect (in near-edge order) to claim a neighbour is the closest
+      if (!index.neighbourAfter.has(before)) index.neighbourAfter.set(before, rect);
+    }
   }
+}
+
+function buildAxisIndex(others: Rect[], axis: Axis, slideSize: number): AxisIndex {
+  const lines = new Float64Array(3 + others.length * 3);
+  lines[0] = 0;
+  lines[1] = slideSize / 2;
+  lines[2] = slideSize;
+  others.forEach((r, i) => {
+    lines[3 + i * 3] = start(r, axis);
+    lines[4 + i * 3] = start(r, axis) + size(r, axis) / 2;
+    lines[5 + i * 3] = end(r, axis);
+  });
+  lines.sort();
 
-  // Find best vertical snap (x-axis)
-  let bestVDist = threshold + 1;
-  let bestVSnap: { offset: number; target: number } | null = null;
-
-  for (const target of vTargets) {
-    // Check dragging element's left, center, right against target
-    const checks = [
-      { edge: dLeft, offset: 0 },
-      { edge: dCenterX, offset: dragging.w / 2 },
-      { edge: dRight, offset: dragging.w },
-    ];
-
-    for (const { edge, offset } of checks) {
-      const dist = Math.abs(edge - target);
-      if (dist < bestVDist) {
-        bestVDist = dist;
-        bestVSnap = { offset, target };
+  const byEnd = [...others].sort((a, b) => end(a, axis) - end(b, axis));
+  const byStart = [...others].sort((a, b) => start(a, axis) - start(b, axis));
+  const index: AxisIndex = {
+    lines,
+    byEnd,
+    ends: Float64Array.from(byEnd, (r) => end(r, axis)),
+    byStart,
+    starts: Float64Array.from(byStart, (r) => start(r, axis)),
+    neighbourBefore: new Map(),
+    neighbourAfter: new Map(),
+  };
+
+  // Existing gaps between neighbouring elements, for "same spacing as" snaps
+  linkNeighbours(index, axis);
+  return index;
+}
+
+/**
+ * Precompute snap targets for a drag session. The other elements do not move
+ * while one is dragged, so this runs once on drag start instead of per event.
+ */
+export function createSnapIndex(others: Rect[]): SnapIndex {
+  return {
+    x: buildAxisIndex(others, 'x', SLIDE_WIDTH),
+    y: buildAxisIndex(others, 'y', SLIDE_HEIGHT),
+  };
+}
+
+interface AxisSnap {
+  position: number;
+  distance: number;
+  guide: GuideLine | null;
+}
+
+/** Best alignment of the dragged element's near edge, center or far edge */
+function snapAlign(index: AxisIndex, pos: number, length: number, threshold: number, axis: Axis): AxisSnap {
+  let best: AxisSnap = { position: pos, distance: threshold + 1, guide: null };
+  const { lines } = index;
+
+  for (const offset of [0, length / 2, length]) {
+    const edge = pos + offset;
+    const i = lowerBound(lines, edge);
+    for (const j of [i - 1, i]) {
+      if (j < 0 || j >= lines.length) continue;
+      const distance = Math.abs(edge - lines[j]);
+      if (distance < best.distance) {
+        best = {
+          position: lines[j] - offset,
+          distance,
+          guide: { type: axis === 'x' ? 'v' : 'h', position: lines[j] },
+        };
       }
     }
   }
+  return best;
+}
+
+function crossCenter(a: Rect, b: Rect, axis: Axis): number {
+  const c = other(axis);
+  return (Math.max(start(a, c), start(b, c)) + Math.min(end(a, c), end(b, c))) / 2;
+}
 
-  if (bestVSnap) {
-    snappedX = bestVSnap.target - bestVSnap.offset;
-    guides.push({ type: 'v', position: bestVSnap.target });
+function segment(from: Rect, to: Rect, axis: Axis): SpacingSegment {
+  return { start: end(from, axis), end: start(to, axis), cross: crossCenter(from, to, axis) };
+}
+
+/**
+ * Best equal-spacing position: centered between the nearest neighbours, or
+ * continuing a gap that already exists between a neighbour and the element
+ * next to it.
+ */
+function snapSpacing(index: AxisIndex, dragging: Rect, threshold: number, axis: Axis): AxisSnap {
+  let best: AxisSnap = { position: start(dragging, axis), distance: threshold + 1, guide: null };
+  const pos = start(dragging, axis);
+  const length = size(dragging, axis);
+  const before = findBefore(index, dragging, pos + threshold, axis);
+  const after = findAfter(index, dragging, pos + length - threshold, axis);
+
+  const consider = (position: number, segments: (target: Rect) => SpacingSegment[]) => {
+    const distance = Math.abs(position - pos);
+    if (distance >= best.distance) return;
+    const target = { ...dragging, [axis]: position };
+    best = { position, distance, guide: { type: 'spacing', axis, segments: segments(target) } };
+  };
+
+  if (before && after && start(after, axis) - end(before, axis) >= length) {
+    consider((end(before, axis) + start(after, axis) - length) / 2, (target) => [
+      segment(before, target, axis),
+      segment(target, after, axis),
+    ]);
   }
 
-  // Find best horizontal snap (y-axis)
-  let bestHDist = threshold + 1;
-  let bestHSnap: { offset: number; target: number } | null = null;
-
-  for (const target of hTargets) {
-    const checks = [
-      { edge: dTop, offset: 0 },
-      { edge: dCenterY, offset: dragging.h / 2 },
-      { edge: dBottom, offset: dragging.h },
-    ];
-
-    for (const { edge, offset } of checks) {
-      const dist = Math.abs(edge - target);
-      if (dist < bestHDist) {
-        bestHDist = dist;
-        bestHSnap = { offset, target };
-      }
-    }
+  const beforeNeighbour = before && index.neighbourBefore.get(before);
+  if (before && beforeNeighbour) {
+    const gap = start(before, axis) - end(beforeNeighbour, axis);
+    consider(end(before, axis) + gap, (target) => [
+      segment(beforeNeighbour, before, axis),
+      segment(before, target, axis),
+    ]);
   }
 
-  if (bestHSnap) {
-    snappedY = bestHSnap.target - bestHSnap.offset;
-    guides.push({ type: 'h', position: bestHSnap.target });
+  const afterNeighbour = after && index.neighbourAfter.get(after);
+  if (after && afterNeighbour) {
+    const gap = start(afterNeighbour, axis) - end(after, axis);
+    consider(start(after, axis) - gap - length, (target) => [
+      segment(target, after, axis),
+      segment(after, afterNeighbour, axis),
+    ]);
   }
 
-  return { snappedX, snappedY, guides };
+  return best;
+}
+
+function snapAxis(index: SnapIndex, dragging: Rect, threshold: number, axis: Axis): AxisSnap {
+  const align = snapAlign(index[axis], start(dragging, axis), size(dragging, axis), threshold, axis);
+  const spacing = snapSpacing(index[axis], dragging, threshold, axis);
+  // Alignment wins ties — it is the more common intent
+  return spacing.distance < align.distance ? spacing : align;
+}
+
+/**
+ * Snap a dragging element against a prebuilt index: slide center/edges,
+ * other element edges/centers, and equal spacing between neighbours.
+ */
+export function snapToIndex(index: SnapIndex, dragging: Rect, threshold = DEFAULT_THRESHOLD): GuideResult {
+  const x = snapAxis(index, dragging, threshold, 'x');
+  // Resolve y against the snapped x so spacing guides use the final position
+  const y = snapAxis(index, { ...dragging, x: x.position }, threshold, 'y');
+
+  const guides: GuideLine[] = [];
+  if (x.guide) guides.push(x.guide);
+  if (y.guide) guides.push(y.guide);
+  return { snappedX: x.position, snappedY: y.position, guides };
+}
+
+/**
+ * Calculate smart guides for a dragging element.
+ * Snaps to slide center/edges and other element edges/centers.
+ * For repeated queries against the same elements, build the index once with
+ * `createSnapIndex` and call `snapToIndex` instead.
+ */
+export function calculateSmartGuides(
+  dragging: Rect,
+  others: Rect[],
+  threshold = DEFAULT_THRESHOLD,
+): GuideResult {
+  return snapToIndex(createSnapIndex(others), dragging, threshold);
+}
+
+/** Structural equality, to skip re-rendering unchanged guides */
+export function sameGuides(a: GuideLine[], b: GuideLine[]): boolean {
+  return a.length === b.length && JSON.stringify(a) === JSON.stringify(b);
 }
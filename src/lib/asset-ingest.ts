@@ -0,0 +1,144 @@
+// ============================================================
+// Asset Ingestion
+// Uploaded images are hashed and deduplicated per project, downscaled to the
+// resolution a slide can actually show (in a worker, via
+// browser-image-compression) and stored with a small preview for thumbnails.
+// ============================================================
+
+import { db, type Asset } from './db';
+import { nanoid } from './nanoid';
+import { getSetting } from './settings';
+
+const SLIDE_WIDTH = 1080;
+const SLIDE_HEIGHT = 1440;
+
+/** Preview bounds, matching the slide thumbnails they are rendered into */
+export const PREVIEW_WIDTH = 270;
+export const PREVIEW_HEIGHT = 360;
+
+/** Setting: keep the untouched upload next to the downscaled copy (off by default) */
+export const KEEP_ORIGINAL_IMAGES_SETTING = 'keepOriginalImages';
+
+// Formats that can be re-encoded without losing anything a slide shows
+// (GIF animation and SVG vectors are stored as uploaded)
+const RESIZABLE_TYPES = new Set(['image/jpeg', 'image/png', 'image/webp']);
+
+export interface IngestOptions {
+  /** Overrides the `keepOriginalImages` setting */
+  keepOriginal?: boolean;
+}
+
+export function assetFilename(name: string): string {
+  return `assets/${Date.now()}-${name.replace(/[^a-zA-Z0-9._-]/g, '_')}`;
+}
+
+export async function hashBlob(blob: Blob): Promise<string> {
+  const digest = await crypto.subtle.digest('SHA-256', await blob.arrayBuffer());
+  return Array.from(new Uint8Array(digest), (b) => b.toString(16).padStart(2, '0')).join('');
+}
+
+/**
+ * Longest side of the image once scaled down until it just covers
+ * width×height. Covering (rather than fitting) keeps full-bleed backgrounds
+ * and cropped images sharp; images are never scaled up.
+ */
+function coverSide(imageWidth: number, imageHeight: number, width: number, height: number): number {
+  const scale = Math.min(1, Math.max(width / imageWidth, height / imageHeight));
+  return Math.round(Math.max(imageWidth, imageHeight) * scale);
+}
+
+async function resizeImage(blob: Blob, maxWidthOrHeight: number, fileType: string, quality: number): Promise<Blob> {
+  const { default: imageCompression } = await import('browser-image-compression');
+  return imageCompression(blob as File, {
+    maxWidthOrHeight,
+    fileType,
+    initialQuality: quality,
+    useWebWorker: true,
+  });
+}
+
+async function imageSize(blob: Blob): Promise<{ width: number; height: number }> {
+  const bitmap = await createImageBitmap(blob);
+  const { width, height } = bitmap;
+  bitmap.close();
+  return { width, height };
+}
+
+async function createPreview(blob: Blob, width: number, height: number): Promise<Blob | undefined> {
+  const previewSide = coverSide(width, height, PREVIEW_WIDTH, PREVIEW_HEIGHT);
+  if (previewSide >= Math.max(width, height)) return undefined;
+  return resizeImage(blob, previewSide, 'image/webp', 0.7);
+}
+
+/**
+ * Hash and thumbnail preview for an image stored as is (e.g. from an
+ * imported ZIP), so it dedupes and renders thumbnails like an upload.
+ */
+export async function describeAsset(blob: Blob): Promise<Pick<Asset, 'hash' | 'preview'>> {
+  const hash = await hashBlob(blob);
+  if (!RESIZABLE_TYPES.has(blob.type)) return { hash };
+  try {
+    const { width, height } = await imageSize(blob);
+    return { hash, preview: await createPreview(blob, width, height) };
+  } catch {
+    // Undecodable images are stored without a preview; thumbnails use the full image
+    return { hash };
+  }
+}
+
+/**
+ * Store an uploaded image as a project asset.
+ * Re-uploading the same bytes returns the existing asset instead of a copy.
+ * Images larger than the slide are downscaled, and a preview is generated;
+ * if the image can't be decoded it is stored as uploaded. With
+ * `keepOriginal`, a downscaled image also keeps the untouched upload.
+ */
+export async function ingestImage(projectId: string, file: File, options: IngestOptions = {}): Promise<Asset> {
+  const keepOriginal = options.keepOriginal ?? await getSetting(KEEP_ORIGINAL_IMAGES_SETTING, false);
+  const hash = await hashBlob(file);
+  const existing = await db.assets.where('[projectId+hash]').equals([projectId, hash]).first();
+  if (existing) {
+    // Same bytes uploaded again, this time asking to keep the original
+    if (keepOriginal && !existing.original && existing.blob.size !== file.size) {
+      existing.original = file;
+      await db.assets.update(existing.id, { original: file });
+    }
+    return existing;
+  }
+
+  let blob: Blob = file;
+  let preview: Blob | undefined;
+  if (RESIZABLE_TYPES.has(file.type)) {
+    try {
+      const { width, height } = await imageSize(file);
+
+      const side = coverSide(width, height, SLIDE_WIDTH, SLIDE_HEIGHT);
+      if (side < Math.max(width, height)) {
+        const resized = await resizeImage(file, side, file.type, 0.9);
+        if (resized.size < file.size) blob = resized;
+      }
+
+      preview = await createPreview(blob, width, height);
+    } catch (err) {
+      console.warn('[assets] Falha ao otimizar imagem, salvando original', err);
+      blob = file;
+      preview = undefined;
+    }
+  }
+
+  const asset: Asset = {
+    id: nanoid(),
+    projectId,
+    filename: assetFilename(file.name),
+    blob,
+    mimeType: blob.type || file.type,
+    size: blob.size,
+    createdAt: new Date(),
+    hash,
+    preview,
+    original: keepOriginal && blob !== file ? file : undefined,
+  };
+
+  await db.assets.put(asset);
+  return asset;
+}
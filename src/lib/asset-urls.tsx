@@ -1,8 +1,9 @@
 'use client';
 
-import { createContext, useContext, useState, useEffect, useCallback, useMemo, useRef } from 'react';
+import { createContext, useContext, useState, useEffect, useCallback, useMemo, useSyncExternalStore } from 'react';
 import type { ReactNode } from 'react';
-import { getAsset, getProjectAssets } from './projects';
+import { getAsset, getAssets } from './projects';
+import type { Slide } from '@/types/schema';
 
 export function createAssetUrl(blob: Blob): string {
   return URL.createObjectURL(blob);
@@ -41,72 +42,169 @@ export function useAssetUrl(projectId: string, filename: string): string | null
 }
 
 // ─── Asset Context ──────────────────────────────────────────
-
-interface AssetContextValue {
-  resolveUrl: (src: string) => string;
+// The context value is a store that never changes identity for a project.
+// Components subscribe to the URL of each asset they show (useResolvedUrl),
+// so loading, replacing or revoking one asset only re-renders its consumers.
+
+interface AssetStore {
+  getUrl: (filename: string) => string | undefined;
+  /**
+   * Listen for URL changes of one asset. While subscribed, the asset is
+   * loaded (if needed) and its URL is kept alive.
+   */
+  subscribe: (filename: string, listener: () => void) => () => void;
   registerAssetUrl: (filename: string, blob: Blob) => void;
-  isLoading: boolean;
 }
 
-const AssetContext = createContext<AssetContextValue | null>(null);
+const AssetContext = createContext<AssetStore | null>(null);
+
+// Grace period before unreferenced URLs are revoked, so a slide that is
+// unmounted and immediately remounted doesn't reload its images
+const RELEASE_DELAY_MS = 2000;
+
+const NOOP = () => {};
 
-export function useAssetContext(): AssetContextValue {
+export function useAssetContext(): AssetStore {
   const ctx = useContext(AssetContext);
   if (!ctx) throw new Error('useAssetContext must be used within an AssetProvider');
   return ctx;
 }
 
-export function AssetProvider({ projectId, children }: { projectId: string; children: ReactNode }) {
-  const [isLoading, setIsLoading] = useState(true);
-  const blobMapRef = useRef(new Map<string, string>());
+/** Asset paths referenced by a slide (background and image elements) */
+export function slideAssetRefs(slide: Slide): string[] {
+  const refs: string[] = [];
+  if (slide.backgroundImage?.startsWith('assets/')) refs.push(slide.backgroundImage);
+  for (const el of slide.elements) {
+    if (el.type === 'image' && el.src.startsWith('assets/')) refs.push(el.src);
+  }
+  return refs;
+}
 
-  // Load all existing assets on mount
-  useEffect(() => {
-    let cancelled = false;
+/**
+ * Resolve an image src for display. `assets/…` paths become object URLs once
+ * the asset is loaded (until then the path itself is returned); any other src
+ * is returned as is. Re-renders only when this asset's URL changes.
+ */
+export function useResolvedUrl(src: string | null | undefined): string | undefined {
+  const store = useAssetContext();
+  const filename = src?.startsWith('assets/') ? src : null;
+  const subscribe = useCallback(
+    (listener: () => void) => (filename ? store.subscribe(filename, listener) : NOOP),
+    [store, filename],
+  );
+  const getSnapshot = () => (filename ? store.getUrl(filename) : undefined);
+  const url = useSyncExternalStore(subscribe, getSnapshot, getSnapshot);
+  return src ? url ?? src : undefined;
+}
 
-    getProjectAssets(projectId).then((assets) => {
-      if (cancelled) return;
-      const map = blobMapRef.current;
-      for (const asset of assets) {
-        if (!map.has(asset.filename)) {
-          map.set(asset.filename, URL.createObjectURL(asset.blob));
-        }
+/**
+ * Loads assets on demand for one project. Lookups requested in the same tick
+ * are batched into a single [projectId+filename] query; URLs with no
+ * subscriber left are revoked after a grace period.
+ */
+function createAssetStore(projectId: string): AssetStore {
+  const urls = new Map<string, string>();
+  const listeners = new Map<string, Set<() => void>>();
+  const queue = new Set<string>();
+  const inFlight = new Set<string>();
+  // Paths with no stored asset, so they aren't looked up again
+  const missing = new Set<string>();
+  let releaseTimer: ReturnType<typeof setTimeout> | null = null;
+
+  const notify = (filename: string) => {
+    for (const listener of listeners.get(filename) ?? []) listener();
+  };
+
+  const sweep = () => {
+    releaseTimer = null;
+    for (const [filename, url] of urls) {
+      if (!listeners.has(filename)) {
+        URL.revokeObjectURL(url);
+        urls.delete(filename);
       }
-      setIsLoading(false);
-    });
+    }
+  };
 
-    return () => {
-      cancelled = true;
-      // Revoke all blob URLs on unmount
-      const map = blobMapRef.current;
-      for (const url of map.values()) {
-        URL.revokeObjectURL(url);
+  const scheduleSweep = () => {
+    releaseTimer ??= setTimeout(sweep, RELEASE_DELAY_MS);
+  };
+
+  const flush = () => {
+    const filenames = [...queue];
+    queue.clear();
+    for (const filename of filenames) inFlight.add(filename);
+
+    getAssets(projectId, filenames).then((assets) => {
+      for (const asset of assets) {
+        if (!urls.has(asset.filename)) urls.set(asset.filename, URL.createObjectURL(asset.blob));
       }
-      map.clear();
-    };
-  }, [projectId]);
+      for (const filename of filenames) {
+        inFlight.delete(filename);
+        if (!urls.has(filename)) missing.add(filename);
+        else if (listeners.has(filename)) notify(filename);
+        else scheduleSweep();
+      }
+    }, (err) => {
+      for (const filename of filenames) inFlight.delete(filename);
+      console.warn('[assets] Falha ao carregar assets', err);
+    });
+  };
+
+  const load = (filename: string) => {
+    if (urls.has(filename) || inFlight.has(filename) || missing.has(filename) || queue.has(filename)) return;
+    queue.add(filename);
+    if (queue.size === 1) queueMicrotask(flush);
+  };
+
+  return {
+    getUrl: (filename) => urls.get(filename),
+
+    subscribe(filename, listener) {
+      const set = listeners.get(filename) ?? new Set<() => void>();
+      listeners.set(filename, set);
+      set.add(listener);
+      load(filename);
+
+      return () => {
+        set.delete(listener);
+        if (set.size > 0 || listeners.get(filename) !== set) return;
+        listeners.delete(filename);
+        scheduleSweep();
+      };
+    },
+
+    registerAssetUrl(filename, blob) {
+      const existing = urls.get(filename);
+      if (existing) URL.revokeObjectURL(existing);
+      urls.set(filename, URL.createObjectURL(blob));
+      missing.delete(filename);
+      if (listeners.has(filename)) notify(filename);
+      else scheduleSweep();
+    },
+  };
+}
 
-  const resolveUrl = useCallback((src: string): string => {
-    if (!src) return src;
-    if (src.startsWith('http://') || src.startsWith('https://') || src.startsWith('data:') || src.startsWith('blob:')) {
-      return src;
-    }
-    if (src.startsWith('assets/')) {
-      return blobMapRef.current.get(src) ?? src;
-    }
-    return src;
-  }, []);
-
-  const registerAssetUrl = useCallback((filename: string, blob: Blob) => {
-    const existing = blobMapRef.current.get(filename);
-    if (existing) URL.revokeObjectURL(existing);
-    blobMapRef.current.set(filename, URL.createObjectURL(blob));
-  }, []);
-
-  const value = useMemo(
-    () => ({ resolveUrl, registerAssetUrl, isLoading }),
-    [resolveUrl, registerAssetUrl, isLoading],
-  );
+/**
+ * Resolves `assets/…` paths to object URLs on demand. An asset is loaded the
+ * first time a component subscribes to it, and its URL is revoked once no
+ * mounted component shows it (which includes the editor unmounting).
+ */
+export function AssetProvider({ projectId, children }: { projectId: string; children: ReactNode }) {
+  const store = useMemo(() => createAssetStore(projectId), [projectId]);
+  return <AssetContext value={store}>{children}</AssetContext>;
+}
 
-  return <AssetContext value={value}>{children}</AssetContext>;
+/**
+ * Asset context backed by a fixed filename → URL map. Used to render slides
+ * outside the editor tree (e.g. offscreen PNG export), where the caller owns
+ * the URLs and their lifetime.
+ */
+export function StaticAssetProvider({ urls, children }: { urls: Map<string, string>; children: ReactNode }) {
+  const store = useMemo<AssetStore>(() => ({
+    getUrl: (filename) => urls.get(filename),
+    subscribe: () => NOOP,
+    registerAssetUrl: NOOP,
+  }), [urls]);
+
+  return <AssetContext value={store}>{children}</AssetContext>;
 }
@@ -1,5 +1,7 @@
-import Dexie, { type EntityTable } from 'dexie';
-import type { CarouselSchema, ThemeColors, ThemeTypography } from '@/types/schema';
+import Dexie, { type EntityTable, type Table } from 'dexie';
+import type { CarouselSchema, Slide, ThemeColors, ThemeTypography } from '@/types/schema';
+import { summarizeSchema } from './project-index';
+import { replayJournal } from './journal';
 
 // ─── Table Interfaces ───────────────────────────────────────
 
@@ -10,14 +12,43 @@ export interface Project {
   tags?: string[];
   format: 'carousel' | 'single-post';
   thumbnail?: Blob;
+  // Content key of the slide the thumbnail was rendered from
+  thumbnailKey?: string;
+  // Denormalized from the schema on every save (see project-index.ts)
+  slideCount?: number;
+  firstHeading?: string;
+  searchTokens?: string[];
   createdAt: Date;
   updatedAt: Date;
 }
 
 export interface ProjectData {
   projectId: string;
+  // Since v3 the stored schema is a shell with `slides: []`; slide bodies live
+  // in the `slides` table, ordered by `slideIds`. Records without `slideIds`
+  // still embed their slides inline.
   schema: CarouselSchema | Record<string, unknown>;
   version: number;
+  slideIds?: string[];
+}
+
+export interface ProjectSlide {
+  projectId: string;
+  slideId: string;
+  slide: Slide;
+}
+
+// Write-ahead journal of autosave deltas, compacted into projectData/slides
+export interface JournalEntry {
+  seq?: number;
+  projectId: string;
+  createdAt: Date;
+  // Changed top-level schema fields (never `slides`)
+  fields?: Record<string, unknown>;
+  // New slide order, present when slides were added, removed or moved
+  slideIds?: string[];
+  // Slides that changed since the previous entry
+  slides?: Slide[];
 }
 
 export interface Asset {
@@ -28,6 +59,19 @@ export interface Asset {
   mimeType: string;
   size: number;
   createdAt: Date;
+  // SHA-256 of the uploaded bytes, used to dedupe uploads within a project
+  hash?: string;
+  // Small re-encoded copy used when rendering thumbnails
+  preview?: Blob;
+  // Untouched upload, kept only when it was downscaled and the user opted in
+  original?: Blob;
+}
+
+// Rendered slide bitmaps, keyed by a content hash of slide + theme
+export interface Thumbnail {
+  key: string;
+  blob: Blob;
+  lastUsed: number;
 }
 
 export interface UserSettings {
@@ -60,6 +104,9 @@ const db = new Dexie('CarouselEditor') as Dexie & {
   settings: EntityTable<UserSettings, 'key'>;
   customThemes: EntityTable<CustomTheme, 'name'>;
   gradientPresets: EntityTable<GradientPreset, 'id'>;
+  slides: Table<ProjectSlide, [string, string]>;
+  journal: EntityTable<JournalEntry, 'seq'>;
+  thumbnails: EntityTable<Thumbnail, 'key'>;
 };
 
 db.version(1).stores({
@@ -79,4 +126,92 @@ db.version(2).stores({
   gradientPresets: '++id, name, category',
 });
 
+db.version(3)
+  .stores({
+    projects: 'id, title, updatedAt, format',
+    projectData: 'projectId',
+    assets: 'id, projectId, filename, [projectId+filename]',
+    settings: 'key',
+    customThemes: 'name',
+    gradientPresets: '++id, name, category',
+    slides: '[projectId+slideId], projectId',
+    journal: '++seq, projectId',
+  })
+  .upgrade(async (tx) => {
+    // Split inline slides out of every stored schema
+    const records = await tx.table<ProjectData>('projectData').toArray();
+    for (const record of records) {
+      const schema = record.schema as { slides?: Slide[] };
+      const slides = Array.isArray(schema.slides) ? schema.slides : [];
+      await tx.table<ProjectSlide>('slides').bulkPut(
+        slides.map((slide) => ({ projectId: record.projectId, slideId: slide.id, slide })),
+      );
+      await tx.table<ProjectData>('projectData').put({
+        ...record,
+        schema: { ...schema, slides: [] },
+        slideIds: slides.map((slide) => slide.id),
+      });
+    }
+  });
+
+db.version(4).stores({
+  projects: 'id, title, updatedAt, format',
+  projectData: 'projectId',
+  assets: 'id, projectId, filename, [projectId+filename]',
+  settings: 'key',
+  customThemes: 'name',
+  gradientPresets: '++id, name, category',
+  slides: '[projectId+slideId], projectId',
+  journal: '++seq, projectId',
+  thumbnails: 'key, lastUsed',
+});
+
+db.version(5)
+  .stores({
+    projects: 'id, title, updatedAt, format, *searchTokens',
+    projectData: 'projectId',
+    assets: 'id, projectId, filename, [projectId+filename]',
+    settings: 'key',
+    customThemes: 'name',
+    gradientPresets: '++id, name, category',
+    slides: '[projectId+slideId], projectId',
+    journal: '++seq, projectId',
+    thumbnails: 'key, lastUsed',
+  })
+  .upgrade(async (tx) => {
+    // Backfill summary fields from the stored schemas
+    const projects = await tx.table<Project>('projects').toArray();
+    for (const project of projects) {
+      const data = await tx.table<ProjectData>('projectData').get(project.id);
+      if (!data) continue;
+      const records = await tx.table<ProjectSlide>('slides').where('projectId').equals(project.id).toArray();
+      const entries = await tx.table<JournalEntry>('journal').where('projectId').equals(project.id).sortBy('seq');
+
+      // Replay journal entries that were not compacted yet
+      const { shell, slideIds, slides: byId } = replayJournal({
+        shell: data.schema as Record<string, unknown>,
+        slideIds: data.slideIds ?? [],
+        slides: new Map(records.map((record) => [record.slideId, record.slide])),
+      }, entries);
+
+      const slides = slideIds
+        .map((id) => byId.get(id))
+        .filter((slide): slide is Slide => !!slide && Array.isArray(slide.elements));
+      const summary = summarizeSchema({ ...(shell as CarouselSchema), slides });
+      await tx.table<Project>('projects').update(project.id, summary);
+    }
+  });
+
+db.version(6).stores({
+  projects: 'id, title, updatedAt, format, *searchTokens',
+  projectData: 'projectId',
+  assets: 'id, projectId, filename, [projectId+filename], [projectId+hash]',
+  settings: 'key',
+  customThemes: 'name',
+  gradientPresets: '++id, name, category',
+  slides: '[projectId+slideId], projectId',
+  journal: '++seq, projectId',
+  thumbnails: 'key, lastUsed',
+});
+
 export { db };
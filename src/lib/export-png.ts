@@ -1,21 +1,60 @@
-import { toPng } from 'html-to-image';
-import JSZip from 'jszip';
+import { createElement } from 'react';
+import { createRoot } from 'react-dom/client';
+import { flushSync } from 'react-dom';
+import { toCanvas } from 'html-to-image';
+import { SlideRenderer } from '@/components/editor/SlideRenderer';
+import { slideAssetRefs, StaticAssetProvider } from './asset-urls';
+import { PREVIEW_HEIGHT, PREVIEW_WIDTH } from './asset-ingest';
+import { getAssets } from './projects';
+import { createZipStreamWriter, downloadBlob, openZipTarget } from './zip-export';
+import type { CarouselSchema } from '@/types/schema';
 
-/**
- * Find a slide renderer in the main canvas by its slide index.
- * Filters out thumbnail renderers (zoom <= 0.2) to only match the main canvas.
- */
-function findRendererByIndex(slideIndex: number): HTMLElement | null {
-  const candidates = document.querySelectorAll(
-    `.slide-renderer[data-slide-index="${slideIndex}"]`
-  );
-  for (const el of candidates) {
-    const zoom = parseFloat((el as HTMLElement).style.zoom || '1');
-    if (zoom > 0.2) {
-      return el as HTMLElement;
-    }
-  }
-  return null;
+// ============================================================
+// PNG Export
+// Slides are rendered into a hidden offscreen React root (so unmounted slides
+// export too and the live canvas is never touched), rasterized to a canvas and
+// encoded to PNG Blobs by a pool of workers. Each PNG is appended to the ZIP
+// of all slides as soon as it is encoded, streaming it to disk (or to a
+// chunked download) while the rest of the deck is still rendering.
+// ============================================================
+
+const SLIDE_WIDTH = 1080;
+const SLIDE_HEIGHT = 1440;
+
+const NOOP = () => {};
+
+export interface ExportProgress {
+  done: number;
+  total: number;
+}
+
+export interface PngExportOptions {
+  onProgress?: (progress: ExportProgress) => void;
+  signal?: AbortSignal;
+}
+
+export interface SlideImageOptions extends PngExportOptions {
+  /** Output size in pixels (defaults to the full 1080×1440 slide) */
+  width?: number;
+  height?: number;
+  /** Encoded image type and quality, as in `canvas.toBlob` */
+  type?: string;
+  quality?: number;
+  /** Wait for an idle period before each slide (background work) */
+  idle?: boolean;
+}
+
+interface EncodeFormat {
+  type: string;
+  quality?: number;
+}
+
+function slideFilename(slideIndex: number): string {
+  return `slide-${String(slideIndex + 1).padStart(2, '0')}.png`;
+}
+
+function throwIfAborted(signal?: AbortSignal) {
+  if (signal?.aborted) throw new DOMException('Exportação cancelada', 'AbortError');
 }
 
 function filterEditorUI(node: HTMLElement): boolean {
@@ -23,49 +62,379 @@ function filterEditorUI(node: HTMLElement): boolean {
   return true;
 }
 
-async function captureSlide(el: HTMLElement): Promise<string> {
-  const originalZoom = el.style.zoom;
-  el.style.zoom = '1';
+function whenIdle(): Promise<void> {
+  return new Promise((resolve) => {
+    if (typeof window.requestIdleCallback === 'function') {
+      window.requestIdleCallback(() => resolve());
+    } else {
+      setTimeout(resolve, 0);
+    }
+  });
+}
+
+// ─── Encoding ───────────────────────────────────────────────
+
+interface EncoderPool {
+  encode: (canvas: HTMLCanvasElement, format: EncodeFormat) => Promise<Blob>;
+  dispose: () => void;
+}
+
+function canvasToBlob(canvas: HTMLCanvasElement, { type, quality }: EncodeFormat): Promise<Blob> {
+  return new Promise((resolve, reject) => {
+    canvas.toBlob((blob) => (blob ? resolve(blob) : reject(new Error('Falha ao gerar imagem'))), type, quality);
+  });
+}
+
+function createEncoderWorker(): Worker {
+  return new Worker(new URL('./png-encoder.worker.ts', import.meta.url));
+}
+
+function runEncode(worker: Worker, bitmap: ImageBitmap, format: EncodeFormat): Promise<Blob> {
+  return new Promise<Blob>((resolve, reject) => {
+    worker.onmessage = (e: MessageEvent<{ blob?: Blob; error?: string }>) => {
+      if (e.data.blob) resolve(e.data.blob);
+      else reject(new Error(e.data.error));
+    };
+    worker.onerror = (e) => {
+      e.preventDefault();
+      reject(new Error(e.message));
+    };
+    worker.postMessage({ bitmap, ...format }, [bitmap]);
+  }).finally(() => {
+    worker.onmessage = null;
+    worker.onerror = null;
+  });
+}
+
+/**
+ * Pool of PNG encoder workers. Falls back to `canvas.toBlob` when workers or
+ * OffscreenCanvas are unavailable, or when a worker fails. A worker that
+ * failed is terminated and replaced rather than reused.
+ */
+function createEncoderPool(size: number): EncoderPool {
+  const supported = typeof Worker !== 'undefined'
+    && typeof OffscreenCanvas !== 'undefined'
+    && typeof createImageBitmap === 'function';
+  if (!supported || size < 1) return { encode: canvasToBlob, dispose: NOOP };
+
+  const workers = new Set(Array.from({ length: size }, createEncoderWorker));
+  const idle = [...workers];
+  const waiting: ((worker: Worker) => void)[] = [];
+  let disposed = false;
+
+  const acquire = (): Promise<Worker> =>
+    idle.length > 0 ? Promise.resolve(idle.pop()!) : new Promise((resolve) => waiting.push(resolve));
+
+  const release = (worker: Worker) => {
+    const next = waiting.shift();
+    if (next) next(worker);
+    else idle.push(worker);
+  };
+
+  const replace = (worker: Worker) => {
+    worker.terminate();
+    workers.delete(worker);
+    if (disposed) return;
+    const fresh = createEncoderWorker();
+    workers.add(fresh);
+    release(fresh);
+  };
+
+  return {
+    async encode(canvas, format) {
+      const worker = await acquire();
+      let bitmap: ImageBitmap;
+      try {
+        bitmap = await createImageBitmap(canvas);
+      } catch {
+        release(worker);
+        return canvasToBlob(canvas, format);
+      }
+
+      try {
+        const blob = await runEncode(worker, bitmap, format);
+        release(worker);
+        return blob;
+      } catch {
+        replace(worker);
+        return canvasToBlob(canvas, format);
+      }
+    },
+    dispose() {
+      disposed = true;
+      for (const worker of workers) worker.terminate();
+      workers.clear();
+      idle.length = 0;
+    },
+  };
+}
+
+// ─── Offscreen Rendering ────────────────────────────────────
+
+function collectAssetRefs(carousel: CarouselSchema, slideIndices: number[]): Set<string> {
+  const refs = new Set<string>();
+  for (const i of slideIndices) {
+    const slide = carousel.slides[i];
+    if (slide) for (const ref of slideAssetRefs(slide)) refs.add(ref);
+  }
+  return refs;
+}
+
+/** Object URLs for the referenced assets; small renders use their previews */
+async function loadAssetUrls(projectId: string, refs: Set<string>, usePreviews: boolean): Promise<Map<string, string>> {
+  const urls = new Map<string, string>();
+  const assets = await getAssets(projectId, [...refs]);
+  for (const asset of assets) {
+    const blob = (usePreviews && asset.preview) || asset.blob;
+    urls.set(asset.filename, URL.createObjectURL(blob));
+  }
+  return urls;
+}
+
+interface RenderRequest {
+  carousel: CarouselSchema;
+  projectId: string;
+  slideIndex: number;
+  assetUrls: Map<string, string>;
+}
+
+interface OffscreenStage {
+  render: (request: RenderRequest) => Promise<HTMLElement>;
+  /** Unmount the rendered slide but keep the root for the next render */
+  clear: () => void;
+  dispose: () => void;
+}
+
+function createOffscreenStage(): OffscreenStage {
+  const container = document.createElement('div');
+  container.setAttribute('aria-hidden', 'true');
+  container.style.cssText = 'position:fixed;top:0;left:-100000px;pointer-events:none;';
+  document.body.appendChild(container);
+  const root = createRoot(container);
+
+  return {
+    async render({ carousel, projectId, slideIndex, assetUrls }) {
+      const slide = carousel.slides[slideIndex];
+      flushSync(() => {
+        root.render(createElement(
+          StaticAssetProvider,
+          { urls: assetUrls },
+          createElement(SlideRenderer, {
+            key: slide.id,
+            slide,
+            theme: carousel.theme,
+            footer: carousel.footer.text,
+            handle: carousel.header.handle,
+            showCounter: carousel.header.showCounter,
+            slideNumber: slideIndex + 1,
+            totalSlides: carousel.slides.length,
+            isEditing: false,
+            selectedElementId: null,
+            onSelectElement: NOOP,
+            onUpdateElement: NOOP,
+            scale: 1,
+            projectId,
+          }),
+        ));
+      });
+
+      const el = container.querySelector<HTMLElement>('.slide-renderer');
+      if (!el) throw new Error('Falha ao renderizar slide');
+
+      await document.fonts.ready;
+      await Promise.all(
+        Array.from(el.querySelectorAll('img'), (img) => img.decode().catch(NOOP)),
+      );
+      return el;
+    },
+    clear() {
+      flushSync(() => root.render(null));
+    },
+    dispose() {
+      root.unmount();
+      container.remove();
+    },
+  };
+}
+
+// ─── Export Engine ──────────────────────────────────────────
+
+/**
+ * Renders slides to image Blobs on one offscreen stage and one encoder pool
+ * that are kept between calls, so a long-lived caller (the editor's
+ * thumbnails) doesn't mount a React root and start workers on every render.
+ * Calls are queued and run one at a time.
+ */
+export interface SlideImageRenderer {
+  render: (
+    carousel: CarouselSchema,
+    projectId: string,
+    slideIndices: number[],
+    onSlide: (slideIndex: number, blob: Blob) => void | Promise<void>,
+    options?: SlideImageOptions,
+  ) => Promise<void>;
+  dispose: () => void;
+}
+
+const INLINE_ENCODER: EncoderPool = { encode: canvasToBlob, dispose: NOOP };
+
+/**
+ * Create a reusable slide renderer. The stage and the worker pool are created
+ * on first use and live until `dispose`.
+ * Rasterization happens on the main thread (html-to-image needs the DOM);
+ * encoding runs in parallel in workers while the next slide is being
+ * rasterized. `onSlide` is called as each slide finishes, not necessarily in
+ * order; a returned promise holds that slide's encode slot until it settles.
+ */
+export function createSlideImageRenderer(): SlideImageRenderer {
+  let stage: OffscreenStage | null = null;
+  let pool: EncoderPool | null = null;
+  let poolSize = 0;
+  let queue: Promise<void> = Promise.resolve();
+  let disposed = false;
+
+  const run = async (
+    carousel: CarouselSchema,
+    projectId: string,
+    slideIndices: number[],
+    onSlide: (slideIndex: number, blob: Blob) => void | Promise<void>,
+    {
+      onProgress,
+      signal,
+      width = SLIDE_WIDTH,
+      height = SLIDE_HEIGHT,
+      type = 'image/png',
+      quality,
+      idle = false,
+    }: SlideImageOptions = {},
+  ): Promise<void> => {
+    const checkAborted = () => {
+      if (disposed) throw new DOMException('Renderização cancelada', 'AbortError');
+      throwIfAborted(signal);
+    };
+    checkAborted();
+
+    const total = slideIndices.length;
+    let done = 0;
+    onProgress?.({ done, total });
+
+    const assetUrls = await loadAssetUrls(
+      projectId,
+      collectAssetRefs(carousel, slideIndices),
+      width <= PREVIEW_WIDTH && height <= PREVIEW_HEIGHT,
+    );
+    const activeStage = (stage ??= createOffscreenStage());
+    // A single slide has nothing to overlap its encode with, so it is encoded
+    // in place instead of starting workers
+    if (total > 1 && !pool) {
+      poolSize = Math.min(total, Math.max(1, (navigator.hardwareConcurrency ?? 2) - 1), 4);
+      pool = createEncoderPool(poolSize);
+    }
+    const encoder = total > 1 && pool ? pool : INLINE_ENCODER;
+    const maxInFlight = encoder === INLINE_ENCODER ? 1 : poolSize;
+    const inFlight = new Set<Promise<void>>();
+
+    try {
+      for (const slideIndex of slideIndices) {
+        if (idle) await whenIdle();
+        checkAborted();
+        const el = await activeStage.render({ carousel, projectId, slideIndex, assetUrls });
+        const canvas = await toCanvas(el, {
+          width: SLIDE_WIDTH,
+          height: SLIDE_HEIGHT,
+          canvasWidth: width,
+          canvasHeight: height,
+          pixelRatio: 1,
+          filter: filterEditorUI,
+        });
+
+        const job = encoder.encode(canvas, { type, quality }).then(async (blob) => {
+          if (signal?.aborted || disposed) return;
+          await onSlide(slideIndex, blob);
+          done++;
+          onProgress?.({ done, total });
+        });
+        inFlight.add(job);
+        job.then(() => inFlight.delete(job), NOOP);
+
+        // Keep at most one pending encode per worker so canvases don't pile up
+        if (inFlight.size >= maxInFlight) await Promise.race(inFlight);
+      }
+      await Promise.all(inFlight);
+      checkAborted();
+    } finally {
+      if (!disposed) activeStage.clear();
+      for (const url of assetUrls.values()) URL.revokeObjectURL(url);
+    }
+  };
+
+  return {
+    render(...args) {
+      const job = queue.then(() => run(...args));
+      queue = job.catch(NOOP);
+      return job;
+    },
+    dispose() {
+      disposed = true;
+      stage?.dispose();
+      pool?.dispose();
+      stage = null;
+      pool = null;
+    },
+  };
+}
+
+/**
+ * Render the given slides to image Blobs (PNG unless `type` says otherwise)
+ * with a one-off renderer.
+ */
+export async function renderSlideImages(
+  carousel: CarouselSchema,
+  projectId: string,
+  slideIndices: number[],
+  onSlide: (slideIndex: number, blob: Blob) => void | Promise<void>,
+  options: SlideImageOptions = {},
+): Promise<void> {
+  const renderer = createSlideImageRenderer();
   try {
-    return await toPng(el, {
-      width: 1080,
-      height: 1440,
-      pixelRatio: 1,
-      filter: filterEditorUI,
-    });
+    await renderer.render(carousel, projectId, slideIndices, onSlide, options);
   } finally {
-    el.style.zoom = originalZoom;
+    renderer.dispose();
   }
 }
 
-export async function exportSlidePng(slideIndex: number): Promise<void> {
-  const el = findRendererByIndex(slideIndex);
-  if (!el) return;
+export async function exportSlidePng(carousel: CarouselSchema, projectId: string, slideIndex: number): Promise<void> {
+  if (!carousel.slides[slideIndex]) return;
 
-  const dataUrl = await captureSlide(el);
-  const link = document.createElement('a');
-  link.download = `slide-${String(slideIndex + 1).padStart(2, '0')}.png`;
-  link.href = dataUrl;
-  link.click();
+  const blobs: Blob[] = [];
+  await renderSlideImages(carousel, projectId, [slideIndex], (_, blob) => {
+    blobs.push(blob);
+  });
+  if (blobs[0]) downloadBlob(blobs[0], slideFilename(slideIndex));
 }
 
-export async function exportAllSlidesPng(totalSlides: number): Promise<void> {
-  const zip = new JSZip();
+export async function exportAllSlidesPng(
+  carousel: CarouselSchema,
+  projectId: string,
+  options: PngExportOptions = {},
+): Promise<void> {
+  // Choose the destination first, while the click's user activation is valid
+  const target = await openZipTarget('slides.zip');
+  if (!target) return;
 
-  for (let i = 0; i < totalSlides; i++) {
-    const el = findRendererByIndex(i);
-    if (!el) continue;
+  const writer = createZipStreamWriter(target);
+  const indices = carousel.slides.map((_, i) => i);
 
-    const dataUrl = await captureSlide(el);
-    const response = await fetch(dataUrl);
-    const blob = await response.blob();
-    zip.file(`slide-${String(i + 1).padStart(2, '0')}.png`, blob);
+  try {
+    // Each PNG goes into the archive as soon as it is encoded (stored as-is,
+    // PNGs are already compressed), so memory is bounded by the slides in
+    // flight rather than the deck
+    await renderSlideImages(carousel, projectId, indices, (slideIndex, blob) => (
+      writer.add(slideFilename(slideIndex), blob)
+    ), options);
+    await writer.finish();
+  } catch (err) {
+    await writer.abort();
+    throw err;
   }
-
-  const zipBlob = await zip.generateAsync({ type: 'blob' });
-  const link = document.createElement('a');
-  link.download = 'slides.zip';
-  link.href = URL.createObjectURL(zipBlob);
-  link.click();
-  setTimeout(() => URL.revokeObjectURL(link.href), 5000);
 }
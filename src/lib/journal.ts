@@ -0,0 +1,28 @@
+// ============================================================
+// Journal Replay
+// Folds uncompacted journal entries into a stored project. Shared by the
+// runtime reads in projects.ts and the database upgrades in db.ts, so both
+// rebuild a project the same way.
+// ============================================================
+
+import type { Slide } from '@/types/schema';
+import type { JournalEntry } from './db';
+
+/** A project as stored: schema shell, slide order and slides by id */
+export interface StoredProject {
+  shell: Record<string, unknown>;
+  slideIds: string[];
+  slides: Map<string, Slide>;
+}
+
+/** Apply `entries` (in `seq` order) on top of `stored`, without mutating it */
+export function replayJournal(stored: StoredProject, entries: JournalEntry[]): StoredProject {
+  let { shell, slideIds } = stored;
+  const slides = new Map(stored.slides);
+  for (const entry of entries) {
+    if (entry.fields) shell = { ...shell, ...entry.fields };
+    if (entry.slideIds) slideIds = entry.slideIds;
+    for (const slide of entry.slides ?? []) slides.set(slide.id, slide);
+  }
+  return { shell, slideIds, slides };
+}
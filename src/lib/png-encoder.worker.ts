@@ -0,0 +1,30 @@
+// ============================================================
+// PNG Encoder Worker
+// Receives a rasterized slide as an ImageBitmap and encodes it to an image
+// Blob (PNG by default) on an OffscreenCanvas, keeping the compression work
+// off the main thread.
+// ============================================================
+
+interface EncodeRequest {
+  bitmap: ImageBitmap;
+  type: string;
+  quality?: number;
+}
+
+const worker = self as unknown as Worker;
+
+worker.onmessage = async (e: MessageEvent<EncodeRequest>) => {
+  const { bitmap, type, quality } = e.data;
+  try {
+    const canvas = new OffscreenCanvas(bitmap.width, bitmap.height);
+    const ctx = canvas.getContext('2d');
+    if (!ctx) throw new Error('OffscreenCanvas 2D context indisponível');
+    ctx.drawImage(bitmap, 0, 0);
+    const blob = await canvas.convertToBlob({ type, quality });
+    worker.postMessage({ blob });
+  } catch (err) {
+    worker.postMessage({ error: err instanceof Error ? err.message : String(err) });
+  } finally {
+    bitmap.close();
+  }
+};
@@ -0,0 +1,119 @@
+// ============================================================
+// Project Index
+// Denormalized summary of a project's schema, stored on the Project record
+// so the gallery can list and search projects without loading any schema.
+// ============================================================
+
+import type { CarouselSchema, Slide } from '@/types/schema';
+
+export interface ProjectSummary {
+  slideCount: number;
+  firstHeading?: string;
+  tags?: string[];
+  searchTokens: string[];
+}
+
+const MIN_TOKEN_LENGTH = 2;
+
+function stripHtml(html: string): string {
+  return html.replace(/<[^>]*>/g, ' ').replace(/&nbsp;/g, ' ');
+}
+
+/**
+ * Split text into lowercase, accent-free search tokens
+ * ("Ação Rápida" → ["acao", "rapida"]).
+ */
+export function tokenize(text: string, minLength = MIN_TOKEN_LENGTH): string[] {
+  return text
+    .normalize('NFD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .toLowerCase()
+    .split(/[^a-z0-9@#]+/)
+    .filter((token) => token.length >= minLength);
+}
+
+// Tokens per (immutable) slide object, so unchanged slides are not re-scanned
+const slideTokenCache = new WeakMap<Slide, string[]>();
+
+function slideTokens(slide: Slide): string[] {
+  let tokens = slideTokenCache.get(slide);
+  if (!tokens) {
+    const text: string[] = [];
+    for (const el of slide.elements) {
+      if ('content' in el && typeof el.content === 'string') text.push(stripHtml(el.content));
+      if (el.type === 'quote' && el.attribution) text.push(el.attribution);
+    }
+    tokens = [...new Set(tokenize(text.join(' ')))];
+    slideTokenCache.set(slide, tokens);
+  }
+  return tokens;
+}
+
+// First non-empty heading per (immutable) slide object ('' when none)
+const slideHeadingCache = new WeakMap<Slide, string>();
+
+function slideHeading(slide: Slide): string {
+  let heading = slideHeadingCache.get(slide);
+  if (heading === undefined) {
+    heading = '';
+    for (const el of slide.elements) {
+      if (el.type === 'heading') {
+        const text = stripHtml(el.content).replace(/\s+/g, ' ').trim();
+        if (text) {
+          heading = text;
+          break;
+        }
+      }
+    }
+    slideHeadingCache.set(slide, heading);
+  }
+  return heading;
+}
+
+function findFirstHeading(slides: Slide[]): string | undefined {
+  for (const slide of slides) {
+    const heading = slideHeading(slide);
+    if (heading) return heading;
+  }
+  return undefined;
+}
+
+function sameList(a: string[] | undefined, b: string[] | undefined): boolean {
+  if (!a || !b) return a === b;
+  return a.length === b.length && a.every((item, i) => item === b[i]);
+}
+
+/**
+ * Whether replacing `before` with `after` can change the project summary
+ * (its text tokens or its heading differ). A slide with no `before` is new.
+ */
+export function slideSummaryChanged(before: Slide | undefined, after: Slide): boolean {
+  if (!before) return true;
+  if (before === after) return false;
+  return slideHeading(before) !== slideHeading(after) || !sameList(slideTokens(before), slideTokens(after));
+}
+
+export function sameSummary(a: Partial<ProjectSummary>, b: ProjectSummary): boolean {
+  return a.slideCount === b.slideCount
+    && a.firstHeading === b.firstHeading
+    && sameList(a.tags, b.tags)
+    && sameList(a.searchTokens, b.searchTokens);
+}
+
+export function summarizeSchema(schema: CarouselSchema): ProjectSummary {
+  const tokens = new Set<string>(tokenize(schema.title ?? ''));
+  const tags = Array.isArray(schema.tags) ? schema.tags : undefined;
+  for (const tag of tags ?? []) {
+    for (const token of tokenize(tag)) tokens.add(token);
+  }
+  for (const slide of schema.slides) {
+    for (const token of slideTokens(slide)) tokens.add(token);
+  }
+
+  return {
+    slideCount: schema.slides.length,
+    firstHeading: findFirstHeading(schema.slides),
+    tags,
+    searchTokens: [...tokens].sort(),
+  };
+}
@@ -1,22 +1,34 @@
-import { db, type Project, type Asset } from './db';
-import type { CarouselSchema } from '@/types/schema';
+import { db, type Project, type Asset, type JournalEntry, type ProjectData } from './db';
+import type { CarouselSchema, Slide } from '@/types/schema';
 import { createEmptySchema } from '@/types/schema';
 import { migrateSchema } from './schema-validation';
+import { sameSummary, slideSummaryChanged, summarizeSchema, tokenize } from './project-index';
 import { nanoid } from './nanoid';
+import { describeAsset } from './asset-ingest';
+import { replayJournal, type StoredProject } from './journal';
 
 export async function createProject(title: string): Promise<Project> {
   const id = nanoid();
   const now = new Date();
-  const project: Project = { id, title, format: 'carousel', createdAt: now, updatedAt: now };
+  const schema = createEmptySchema(id);
+  schema.title = title;
+
+  const project: Project = {
+    id,
+    title,
+    format: 'carousel',
+    createdAt: now,
+    updatedAt: now,
+    ...summarizeSchema(schema),
+  };
 
   await db.projects.add(project);
 
-  const schema = createEmptySchema(id);
-  schema.title = title;
   await db.projectData.add({
     projectId: id,
     schema,
     version: schema.version,
+    slideIds: [],
   });
 
   return project;
@@ -30,57 +42,287 @@ export async function getAllProjects(): Promise<Project[]> {
   return db.projects.orderBy('updatedAt').reverse().toArray();
 }
 
+/**
+ * Ids of the projects matching every word of `query` (prefix match against
+ * the title, tags and slide text tokens). Returns null when the query has no
+ * searchable words, meaning "no filter".
+ */
+export async function searchProjectIds(query: string): Promise<Set<string> | null> {
+  const tokens = [...new Set(tokenize(query, 1))];
+  if (tokens.length === 0) return null;
+  let result: Set<string> | null = null;
+  for (const token of tokens) {
+    const ids = new Set(await db.projects.where('searchTokens').startsWith(token).primaryKeys());
+    result = result ? new Set([...result].filter((id) => ids.has(id))) : ids;
+    if (result.size === 0) break;
+  }
+  return result ?? new Set();
+}
+
 export async function updateProject(id: string, data: Partial<Omit<Project, 'id'>>): Promise<void> {
   await db.projects.update(id, { ...data, updatedAt: new Date() });
 }
 
 export async function deleteProject(id: string): Promise<void> {
-  await db.transaction('rw', [db.projects, db.projectData, db.assets], async () => {
+  await db.transaction('rw', [db.projects, db.projectData, db.slides, db.journal, db.assets], async () => {
     await db.assets.where('projectId').equals(id).delete();
+    await db.journal.where('projectId').equals(id).delete();
+    await db.slides.where('projectId').equals(id).delete();
     await db.projectData.delete(id);
     await db.projects.delete(id);
   });
 }
 
+// ─── Schema Storage ─────────────────────────────────────────
+// A project is stored as a schema shell in projectData, one record per slide in
+// `slides`, and a journal of autosave deltas that is replayed on load and
+// periodically compacted into the other two tables.
+
+/** Journal entries after which the editor should compact in the background */
+export const JOURNAL_COMPACT_THRESHOLD = 10;
+
+function toShell(schema: CarouselSchema | Record<string, unknown>): Record<string, unknown> {
+  return { ...schema, slides: [] };
+}
+
+/**
+ * Rewrite the whole project (shell + every slide) and drop its journal.
+ * Used for imports and when no persisted baseline is known.
+ */
 export async function saveProjectSchema(projectId: string, schema: CarouselSchema): Promise<void> {
   // Clone with updated timestamp — never mutate the original (it's React state)
   const schemaToSave = { ...schema, updatedAt: new Date().toISOString() };
+  const slideIds = schemaToSave.slides.map((slide) => slide.id);
+  const keep = new Set(slideIds);
 
-  await db.projectData.put({
-    projectId,
-    schema: schemaToSave,
-    version: schemaToSave.version,
+  await db.transaction('rw', [db.projects, db.projectData, db.slides, db.journal], async () => {
+    const storedKeys = await db.slides.where('projectId').equals(projectId).primaryKeys();
+    await db.slides.bulkDelete(storedKeys.filter(([, slideId]) => !keep.has(slideId)));
+    await db.slides.bulkPut(schemaToSave.slides.map((slide) => ({ projectId, slideId: slide.id, slide })));
+    await db.journal.where('projectId').equals(projectId).delete();
+    await db.projectData.put({
+      projectId,
+      schema: toShell(schemaToSave),
+      version: schemaToSave.version,
+      slideIds,
+    });
+    await db.projects.update(projectId, { updatedAt: new Date(), ...summarizeSchema(schemaToSave) });
   });
+}
+
+/**
+ * Compute the journal delta between the last persisted schema and the current
+ * one. React state is never mutated, so unchanged slides keep their identity
+ * and the comparison is by reference.
+ */
+function diffForJournal(base: CarouselSchema, schema: CarouselSchema): Omit<JournalEntry, 'projectId' | 'createdAt'> | null {
+  const delta: Omit<JournalEntry, 'projectId' | 'createdAt'> = {};
+
+  const keys = new Set([...Object.keys(base), ...Object.keys(schema)]);
+  keys.delete('slides');
+  for (const key of keys) {
+    if (base[key] === schema[key]) continue;
+    delta.fields ??= {};
+    delta.fields[key] = schema[key];
+  }
 
-  await db.projects.update(projectId, { updatedAt: new Date() });
+  const baseById = new Map(base.slides.map((slide) => [slide.id, slide]));
+  const slides = schema.slides.filter((slide) => baseById.get(slide.id) !== slide);
+  if (slides.length > 0) delta.slides = slides;
+
+  const reordered = base.slides.length !== schema.slides.length
+    || schema.slides.some((slide, i) => slide.id !== base.slides[i].id);
+  if (reordered) delta.slideIds = schema.slides.map((slide) => slide.id);
+
+  return delta.fields || delta.slides || delta.slideIds ? delta : null;
 }
 
-export async function getProjectSchema(projectId: string): Promise<CarouselSchema | null> {
-  const record = await db.projectData.get(projectId);
-  return record ? migrateSchema(record.schema) : null;
+/**
+ * Whether a journal delta can change the project summary: the title or tags
+ * changed, slides were added, removed or moved, or a changed slide's text or
+ * heading differs from its persisted version.
+ */
+function deltaAffectsSummary(base: CarouselSchema, delta: Omit<JournalEntry, 'projectId' | 'createdAt'>): boolean {
+  if (delta.slideIds) return true;
+  if (delta.fields && ('title' in delta.fields || 'tags' in delta.fields)) return true;
+  if (!delta.slides) return false;
+  const baseById = new Map(base.slides.map((slide) => [slide.id, slide]));
+  return delta.slides.some((slide) => slideSummaryChanged(baseById.get(slide.id), slide));
 }
 
-export async function saveAsset(projectId: string, filename: string, blob: Blob): Promise<Asset> {
-  const existing = await db.assets.where('[projectId+filename]').equals([projectId, filename]).first();
+/**
+ * Append the changes between `base` (the last persisted schema) and `schema`
+ * to the project journal. Cost is proportional to the edit, not the project:
+ * the gallery summary is only recomputed when the edit can affect it, and
+ * only written when it actually changed.
+ * Returns false when there was nothing to write.
+ */
+export async function appendProjectJournal(
+  projectId: string,
+  base: CarouselSchema,
+  schema: CarouselSchema,
+): Promise<boolean> {
+  const delta = diffForJournal(base, schema);
+  if (!delta) return false;
 
-  const asset: Asset = {
-    id: existing?.id ?? nanoid(),
+  const now = new Date();
+  const entry: JournalEntry = {
+    ...delta,
     projectId,
-    filename,
-    blob,
-    mimeType: blob.type,
-    size: blob.size,
-    createdAt: existing?.createdAt ?? new Date(),
+    createdAt: now,
+    fields: { ...delta.fields, updatedAt: now.toISOString() },
+  };
+
+  const summary = deltaAffectsSummary(base, delta) ? summarizeSchema(schema) : null;
+
+  await db.transaction('rw', [db.projects, db.journal], async () => {
+    await db.journal.add(entry);
+    const project = summary ? await db.projects.get(projectId) : undefined;
+    if (summary && project && !sameSummary(project, summary)) {
+      await db.projects.update(projectId, { updatedAt: now, ...summary });
+    } else {
+      await db.projects.update(projectId, { updatedAt: now });
+    }
+  });
+  return true;
+}
+
+function readStoredProject(data: ProjectData, slides: Slide[]): StoredProject {
+  // Legacy records keep their slides inline in the schema
+  if (!data.slideIds) {
+    const inline = ((data.schema as { slides?: Slide[] }).slides ?? []);
+    return {
+      shell: toShell(data.schema),
+      slideIds: inline.map((slide) => slide.id),
+      slides: new Map(inline.map((slide) => [slide.id, slide])),
+    };
+  }
+  return {
+    shell: data.schema as Record<string, unknown>,
+    slideIds: data.slideIds,
+    slides: new Map(slides.map((slide) => [slide.id, slide])),
   };
+}
+
+/**
+ * Fold the project's journal into its shell and slide records.
+ * Only slides touched by the journal are rewritten.
+ */
+export async function compactProjectJournal(projectId: string): Promise<void> {
+  await db.transaction('rw', [db.projectData, db.slides, db.journal], async () => {
+    const entries = await db.journal.where('projectId').equals(projectId).sortBy('seq');
+    if (entries.length === 0) return;
 
-  await db.assets.put(asset);
+    const data = await db.projectData.get(projectId);
+    if (data) {
+      const stored = readStoredProject(data, []);
+      const touched = new Map<string, Slide>(data.slideIds ? [] : stored.slides);
+      for (const entry of entries) {
+        for (const slide of entry.slides ?? []) touched.set(slide.id, slide);
+      }
+      const { shell, slideIds } = replayJournal(stored, entries);
+      const keep = new Set(slideIds);
+
+      const removed = (data.slideIds ?? []).filter((id) => !keep.has(id));
+      await db.slides.bulkDelete(removed.map((id): [string, string] => [projectId, id]));
+      await db.slides.bulkPut(
+        [...touched.values()]
+          .filter((slide) => keep.has(slide.id))
+          .map((slide) => ({ projectId, slideId: slide.id, slide })),
+      );
+      await db.projectData.put({ ...data, schema: shell, slideIds });
+    }
+
+    await db.journal.bulkDelete(entries.map((entry) => entry.seq!));
+  });
+}
+
+/**
+ * Load a project's schema, replaying any journal entries that were not
+ * compacted yet (e.g. after a crash or a closed tab).
+ */
+export async function getProjectSchema(projectId: string): Promise<CarouselSchema | null> {
+  const loaded = await db.transaction('r', [db.projectData, db.slides, db.journal], async () => {
+    const data = await db.projectData.get(projectId);
+    if (!data) return null;
+    const records = await db.slides.where('projectId').equals(projectId).toArray();
+    const entries = await db.journal.where('projectId').equals(projectId).sortBy('seq');
+    return replayJournal(readStoredProject(data, records.map((record) => record.slide)), entries);
+  });
+  if (!loaded) return null;
+
+  const slides = loaded.slideIds
+    .map((id) => loaded.slides.get(id))
+    .filter((slide): slide is Slide => !!slide);
+  return migrateSchema({ ...loaded.shell, slides });
+}
+
+export async function saveAsset(projectId: string, filename: string, blob: Blob): Promise<Asset> {
+  const [asset] = await saveAssets(projectId, [{ filename, blob }]);
   return asset;
 }
 
+/** An asset to store; `hash` and `preview` are computed when missing */
+export interface AssetInput {
+  filename: string;
+  blob: Blob;
+  hash?: string;
+  preview?: Blob;
+}
+
+/**
+ * Save several assets in a single transaction: one lookup for the existing
+ * records (to keep their ids) and one bulkPut. Every record gets the content
+ * hash and thumbnail preview that uploads get (see asset-ingest.ts), so
+ * stored assets dedupe and render thumbnails the same way wherever they came
+ * from.
+ */
+export async function saveAssets(projectId: string, files: AssetInput[]): Promise<Asset[]> {
+  // Hashing and previews are async work that can't run inside the transaction
+  const described = await Promise.all(files.map(async (file) => (
+    file.hash ? file : { ...file, ...await describeAsset(file.blob) }
+  )));
+
+  return db.transaction('rw', db.assets, async () => {
+    const existing = await db.assets
+      .where('[projectId+filename]')
+      .anyOf(described.map(({ filename }) => [projectId, filename]))
+      .toArray();
+    const byFilename = new Map(existing.map((asset) => [asset.filename, asset]));
+
+    const assets = described.map(({ filename, blob, hash, preview }): Asset => {
+      const previous = byFilename.get(filename);
+      return {
+        id: previous?.id ?? nanoid(),
+        projectId,
+        filename,
+        blob,
+        mimeType: blob.type,
+        size: blob.size,
+        createdAt: previous?.createdAt ?? new Date(),
+        hash,
+        preview,
+      };
+    });
+
+    await db.assets.bulkPut(assets);
+    return assets;
+  });
+}
+
 export async function getAsset(projectId: string, filename: string): Promise<Asset | undefined> {
   return db.assets.where('[projectId+filename]').equals([projectId, filename]).first();
 }
 
+/** Look up several assets by filename in one query; missing ones are skipped */
+export async function getAssets(projectId: string, filenames: string[]): Promise<Asset[]> {
+  if (filenames.length === 0) return [];
+  return db.assets
+    .where('[projectId+filename]')
+    .anyOf(filenames.map((filename) => [projectId, filename]))
+    .toArray();
+}
+
 export async function getProjectAssets(projectId: string): Promise<Asset[]> {
   return db.assets.where('projectId').equals(projectId).toArray();
 }
@@ -0,0 +1,142 @@
+// ============================================================
+// Render Profiler
+// Development-only instrumentation for the editor. Counts React commits per
+// reducer action and accumulates render time per profiled region (editor,
+// slide, panel, element). Regions report through React's <Profiler>, except
+// elements, which are too many for one <Profiler> each and are timed with
+// performance marks instead; actions are marked with performance.mark so each action → commit span also shows up
+// in the browser's Performance panel. Everything is a no-op until enabled.
+// ============================================================
+
+export const PROFILER_AVAILABLE = process.env.NODE_ENV === 'development';
+
+export interface RegionStats {
+  renders: number;
+  /** Inclusive of nested regions, like React's actualDuration */
+  totalMs: number;
+  maxMs: number;
+}
+
+export interface ActionStats {
+  dispatches: number;
+  commits: number;
+  commitMs: number;
+}
+
+export interface ProfilerSnapshot {
+  enabled: boolean;
+  version: number;
+}
+
+// Commits not directly caused by a dispatched action (local UI state,
+// effects, asset loads)
+export const OTHER_COMMITS = '(outros)';
+
+// The panel re-reads stats at most this often, so it doesn't dominate what
+// it measures
+const NOTIFY_INTERVAL_MS = 500;
+
+const regions = new Map<string, RegionStats>();
+const actions = new Map<string, ActionStats>();
+const listeners = new Set<() => void>();
+let snapshot: ProfilerSnapshot = { enabled: false, version: 0 };
+let pendingAction: string | null = null;
+let notifyTimer: ReturnType<typeof setTimeout> | null = null;
+
+function emit() {
+  if (notifyTimer) clearTimeout(notifyTimer);
+  notifyTimer = null;
+  snapshot = { enabled: snapshot.enabled, version: snapshot.version + 1 };
+  for (const listener of listeners) listener();
+}
+
+function scheduleEmit() {
+  if (!notifyTimer) notifyTimer = setTimeout(emit, NOTIFY_INTERVAL_MS);
+}
+
+export function subscribeProfiler(listener: () => void): () => void {
+  listeners.add(listener);
+  return () => listeners.delete(listener);
+}
+
+export function getProfilerSnapshot(): ProfilerSnapshot {
+  return snapshot;
+}
+
+export function setProfilerEnabled(enabled: boolean): void {
+  snapshot = { ...snapshot, enabled };
+  emit();
+}
+
+export function resetProfiler(): void {
+  regions.clear();
+  actions.clear();
+  pendingAction = null;
+  emit();
+}
+
+/** Called on every reducer dispatch */
+export function markAction(type: string): void {
+  if (!snapshot.enabled) return;
+  const stats = actions.get(type) ?? { dispatches: 0, commits: 0, commitMs: 0 };
+  stats.dispatches++;
+  actions.set(type, stats);
+  pendingAction = type;
+  performance.mark(`editor:${type}`);
+}
+
+/** Called from a region's <Profiler> onRender */
+export function recordRender(id: string, durationMs: number): void {
+  if (!snapshot.enabled) return;
+  const stats = regions.get(id) ?? { renders: 0, totalMs: 0, maxMs: 0 };
+  stats.renders++;
+  stats.totalMs += durationMs;
+  stats.maxMs = Math.max(stats.maxMs, durationMs);
+  regions.set(id, stats);
+  scheduleEmit();
+}
+
+/** Called at the start of an element view's render */
+export function markElementRender(id: string): void {
+  if (!snapshot.enabled) return;
+  performance.mark(`element:${id}`);
+}
+
+/**
+ * Called from the last child of an element view. React renders depth first,
+ * so by then the element's whole subtree has rendered; the span since
+ * markElementRender is recorded as the element's render time.
+ */
+export function measureElementRender(id: string): void {
+  if (!snapshot.enabled) return;
+  const name = `element:${id}`;
+  // Profiling may have been switched on between the two calls
+  if (performance.getEntriesByName(name, 'mark').length === 0) return;
+  const { duration } = performance.measure(name, name);
+  performance.clearMarks(name);
+  performance.clearMeasures(name);
+  recordRender(name, duration);
+}
+
+/** Called when the editor root commits; attributed to the last dispatched action */
+export function recordCommit(durationMs: number): void {
+  if (!snapshot.enabled) return;
+  const type = pendingAction ?? OTHER_COMMITS;
+  const stats = actions.get(type) ?? { dispatches: 0, commits: 0, commitMs: 0 };
+  stats.commits++;
+  stats.commitMs += durationMs;
+  actions.set(type, stats);
+  if (pendingAction) {
+    performance.measure(`editor:${pendingAction} → commit`, `editor:${pendingAction}`);
+    pendingAction = null;
+  }
+  scheduleEmit();
+}
+
+export function getRegionStats(): [string, RegionStats][] {
+  return [...regions];
+}
+
+export function getActionStats(): [string, ActionStats][] {
+  return [...actions];
+}
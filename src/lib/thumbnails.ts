@@ -0,0 +1,146 @@
+// ============================================================
+// Slide Thumbnails
+// Small rendered bitmaps of slides, cached in IndexedDB by a content hash of
+// everything that affects the slide's pixels. Unchanged slides keep their key
+// (and their cached bitmap) across edits, so only edited slides re-render.
+// ============================================================
+
+import { db } from './db';
+import { slideAssetRefs } from './asset-urls';
+import type { SlideImageRenderer } from './export-png';
+import type { CarouselSchema } from '@/types/schema';
+
+export const THUMBNAIL_WIDTH = 270;
+export const THUMBNAIL_HEIGHT = 360;
+
+/** Thumbnails kept in IndexedDB before the least recently used are evicted */
+const MAX_THUMBNAILS = 500;
+
+/** cyrb53 — fast 53-bit string hash, plenty for cache keys */
+function hashString(str: string): string {
+  let h1 = 0xdeadbeef;
+  let h2 = 0x41c6ce57;
+  for (let i = 0; i < str.length; i++) {
+    const ch = str.charCodeAt(i);
+    h1 = Math.imul(h1 ^ ch, 2654435761);
+    h2 = Math.imul(h2 ^ ch, 1597334677);
+  }
+  h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+  h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+  return (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(36);
+}
+
+// Content hash per (immutable) object, so unchanged slides are not
+// re-serialized on every reducer update
+const hashCache = new WeakMap<object, string>();
+
+function contentHash(value: object): string {
+  let hash = hashCache.get(value);
+  if (hash === undefined) {
+    hash = hashString(JSON.stringify(value));
+    hashCache.set(value, hash);
+  }
+  return hash;
+}
+
+/**
+ * Content version of every asset in a project, by filename. An asset that is
+ * replaced under the same filename gets a new version.
+ */
+export async function getAssetVersions(projectId: string): Promise<Map<string, string>> {
+  const versions = new Map<string, string>();
+  await db.assets.where('projectId').equals(projectId).each((asset) => {
+    versions.set(asset.filename, `${asset.id}:${asset.hash ?? ''}:${asset.size}`);
+  });
+  return versions;
+}
+
+/**
+ * Content key for a slide's thumbnail: the slide, the versions of the assets
+ * it shows, the theme and the chrome drawn around it (header, counter,
+ * footer).
+ */
+export function slideThumbnailKey(
+  carousel: CarouselSchema,
+  slideIndex: number,
+  assetVersions: Map<string, string>,
+): string {
+  const { header, footer, theme, slides } = carousel;
+  const slide = slides[slideIndex];
+  const counter = header.showCounter ? `${slideIndex + 1}/${slides.length}` : '';
+  return hashString([
+    contentHash(slide),
+    ...slideAssetRefs(slide).map((ref) => assetVersions.get(ref) ?? ''),
+    contentHash(theme),
+    header.handle,
+    counter,
+    footer.text,
+  ].join('\u0000'));
+}
+
+/**
+ * Look up cached thumbnails and mark the hits as recently used.
+ */
+export async function getCachedThumbnails(keys: string[]): Promise<Map<string, Blob>> {
+  const found = new Map<string, Blob>();
+  if (keys.length === 0) return found;
+
+  const records = await db.thumbnails.bulkGet(keys);
+  const now = Date.now();
+  const touched: { key: string; changes: { lastUsed: number } }[] = [];
+  for (const record of records) {
+    if (!record) continue;
+    found.set(record.key, record.blob);
+    touched.push({ key: record.key, changes: { lastUsed: now } });
+  }
+  if (touched.length > 0) await db.thumbnails.bulkUpdate(touched);
+  return found;
+}
+
+async function evictThumbnails(): Promise<void> {
+  const count = await db.thumbnails.count();
+  if (count <= MAX_THUMBNAILS) return;
+  const oldest = await db.thumbnails.orderBy('lastUsed').limit(count - MAX_THUMBNAILS).primaryKeys();
+  await db.thumbnails.bulkDelete(oldest);
+}
+
+/**
+ * Render thumbnails for the given slides (slide index → content key) in idle
+ * time on the caller's renderer, storing each in the cache as it finishes.
+ */
+export async function generateThumbnails(
+  renderer: SlideImageRenderer,
+  carousel: CarouselSchema,
+  projectId: string,
+  keys: Map<number, string>,
+  onThumbnail: (slideIndex: number, key: string, blob: Blob) => void,
+  signal?: AbortSignal,
+): Promise<void> {
+  if (keys.size === 0) return;
+
+  const writes: Promise<unknown>[] = [];
+  await renderer.render(carousel, projectId, [...keys.keys()], (slideIndex, blob) => {
+    const key = keys.get(slideIndex)!;
+    writes.push(db.thumbnails.put({ key, blob, lastUsed: Date.now() }));
+    onThumbnail(slideIndex, key, blob);
+  }, {
+    width: THUMBNAIL_WIDTH,
+    height: THUMBNAIL_HEIGHT,
+    type: 'image/webp',
+    quality: 0.8,
+    idle: true,
+    signal,
+  });
+  await Promise.all(writes);
+  await evictThumbnails();
+}
+
+/**
+ * Use a slide thumbnail as the project's cover in the gallery.
+ * Skips the write when the cover was already rendered from the same content.
+ */
+export async function setProjectThumbnail(projectId: string, key: string, blob: Blob): Promise<void> {
+  const project = await db.projects.get(projectId);
+  if (!project || project.thumbnailKey === key) return;
+  await db.projects.update(projectId, { thumbnail: blob, thumbnailKey: key });
+}
@@ -0,0 +1,149 @@
+// ============================================================
+// Undo History
+// Patch-based history for the editor reducer. The reducer never mutates
+// carousel objects, so a patch can hold references to the previous slides /
+// elements and only the paths that changed are recorded per entry.
+// ============================================================
+
+import type { CarouselSchema, Slide, SlideElement } from '@/types/schema';
+import type { CarouselPatch, HistoryEntry, SlidePatch } from '@/types/editor';
+
+/** Fixed cost charged per entry (patch objects, array slots) */
+const ENTRY_OVERHEAD_BYTES = 256;
+
+function estimateBytes(value: unknown): number {
+  if (value === undefined || value === null) return 0;
+  if (typeof value === 'string') return value.length * 2;
+  if (typeof value !== 'object') return 8;
+  return (JSON.stringify(value)?.length ?? 0) * 2;
+}
+
+function sameIds(a: { id: string }[], b: { id: string }[]): boolean {
+  if (a.length !== b.length) return false;
+  for (let i = 0; i < a.length; i++) {
+    if (a[i].id !== b[i].id) return false;
+  }
+  return true;
+}
+
+/** Bytes of the items in `next` that are not already referenced by `prev` */
+function listBytes<T>(prev: T[], next: T[]): number {
+  const shared = new Set(prev);
+  let bytes = next.length * 8;
+  for (const item of next) {
+    if (!shared.has(item)) bytes += estimateBytes(item);
+  }
+  return bytes;
+}
+
+function diffFields<T extends object>(
+  from: T,
+  to: T,
+  skip: keyof T,
+): { fields?: Partial<T>; bytes: number } {
+  let fields: Partial<T> | undefined;
+  let bytes = 0;
+  const keys = new Set([...Object.keys(from), ...Object.keys(to)]) as Set<keyof T>;
+  for (const key of keys) {
+    if (key === skip || from[key] === to[key]) continue;
+    fields ??= {};
+    fields[key] = to[key];
+    bytes += estimateBytes(to[key]);
+  }
+  return { fields, bytes };
+}
+
+function diffSlide(from: Slide, to: Slide): { patch: SlidePatch; bytes: number } {
+  const { fields, bytes: fieldBytes } = diffFields(from, to, 'elements');
+  const patch: SlidePatch = {};
+  let bytes = fieldBytes;
+  if (fields) patch.fields = fields;
+
+  if (from.elements !== to.elements) {
+    if (sameIds(from.elements, to.elements)) {
+      const changed: Record<number, SlideElement> = {};
+      to.elements.forEach((el, i) => {
+        if (el !== from.elements[i]) {
+          changed[i] = el;
+          bytes += estimateBytes(el);
+        }
+      });
+      patch.changedElements = changed;
+    } else {
+      patch.elements = to.elements;
+      bytes += listBytes(from.elements, to.elements);
+    }
+  }
+
+  return { patch, bytes };
+}
+
+/**
+ * Compute a patch that turns `from` into `to`, plus an estimate of the
+ * memory that the patch keeps alive on its own.
+ */
+export function diffCarousel(from: CarouselSchema, to: CarouselSchema): { patch: CarouselPatch; bytes: number } {
+  const { fields, bytes: fieldBytes } = diffFields(from, to, 'slides');
+  const patch: CarouselPatch = {};
+  let bytes = fieldBytes;
+  if (fields) patch.fields = fields;
+
+  if (from.slides !== to.slides) {
+    if (sameIds(from.slides, to.slides)) {
+      const changed: Record<number, SlidePatch> = {};
+      to.slides.forEach((slide, i) => {
+        if (slide === from.slides[i]) return;
+        const diff = diffSlide(from.slides[i], slide);
+        changed[i] = diff.patch;
+        bytes += diff.bytes;
+      });
+      patch.changedSlides = changed;
+    } else {
+      patch.slides = to.slides;
+      bytes += listBytes(from.slides, to.slides);
+    }
+  }
+
+  return { patch, bytes };
+}
+
+function applySlidePatch(slide: Slide, patch: SlidePatch): Slide {
+  let elements = patch.elements ?? slide.elements;
+  if (patch.changedElements) {
+    elements = [...elements];
+    for (const [i, el] of Object.entries(patch.changedElements)) {
+      elements[Number(i)] = el;
+    }
+  }
+  return { ...slide, ...patch.fields, elements };
+}
+
+export function applyCarouselPatch(carousel: CarouselSchema, patch: CarouselPatch): CarouselSchema {
+  let slides = patch.slides ?? carousel.slides;
+  if (patch.changedSlides) {
+    slides = [...slides];
+    for (const [i, slidePatch] of Object.entries(patch.changedSlides)) {
+      slides[Number(i)] = applySlidePatch(slides[Number(i)], slidePatch);
+    }
+  }
+  return { ...carousel, ...patch.fields, slides };
+}
+
+/** History entry that restores `target` when applied to `current` */
+export function createHistoryEntry(current: CarouselSchema, target: CarouselSchema): HistoryEntry {
+  const { patch, bytes } = diffCarousel(current, target);
+  return { patch, bytes: bytes + ENTRY_OVERHEAD_BYTES };
+}
+
+/**
+ * Drop the oldest entries until the stack fits in `maxBytes`.
+ * The newest entry is always kept, however large it is.
+ */
+export function trimHistory(entries: HistoryEntry[], maxBytes: number): HistoryEntry[] {
+  let total = 0;
+  for (let i = entries.length - 1; i >= 0; i--) {
+    total += entries[i].bytes;
+    if (total > maxBytes) return entries.slice(Math.min(i + 1, entries.length - 1));
+  }
+  return entries;
+}
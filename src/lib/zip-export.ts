@@ -1,10 +1,17 @@
 import JSZip from 'jszip';
 import { getProjectSchema, getProjectAssets } from './projects';
 
+type SaveFilePicker = (options: {
+  suggestedName?: string;
+  types?: { description?: string; accept: Record<string, string[]> }[];
+}) => Promise<FileSystemFileHandle>;
+
 /**
- * Export a project as a .zip file containing schema.json + assets/
+ * Build the project archive: compact schema.json + assets/.
+ * Assets are images that are already compressed, so they are stored as-is
+ * instead of being deflated a second time.
  */
-export async function exportProjectAsZip(projectId: string): Promise<Blob> {
+async function buildProjectZip(projectId: string): Promise<JSZip> {
   const schema = await getProjectSchema(projectId);
   if (!schema) throw new Error('Schema do projeto não encontrado');
 
@@ -14,14 +21,284 @@ export async function exportProjectAsZip(projectId: string): Promise<Blob> {
 
   // Add schema.json with updated timestamp
   const schemaWithTimestamp = { ...schema, updatedAt: new Date().toISOString() };
-  zip.file('schema.json', JSON.stringify(schemaWithTimestamp, null, 2));
+  zip.file('schema.json', JSON.stringify(schemaWithTimestamp), { compression: 'DEFLATE' });
 
   // Add assets into the zip preserving their filename paths (e.g. "assets/cover.jpg")
   for (const asset of assets) {
-    zip.file(asset.filename, asset.blob);
+    zip.file(asset.filename, asset.blob, { compression: 'STORE' });
+  }
+
+  return zip;
+}
+
+// ─── Streaming Writer ───────────────────────────────────────
+
+/** Destination a generated archive is streamed into, chunk by chunk */
+export interface ZipTarget {
+  write: (chunk: Uint8Array) => Promise<void>;
+  close: () => Promise<void>;
+  abort: () => Promise<void>;
+}
+
+function fileTarget(handle: FileSystemFileHandle): ZipTarget {
+  let writable: FileSystemWritableFileStream | null = null;
+  return {
+    async write(chunk) {
+      writable ??= await handle.createWritable();
+      await writable.write(chunk);
+    },
+    async close() {
+      writable ??= await handle.createWritable();
+      await writable.close();
+    },
+    async abort() {
+      await writable?.abort();
+    },
+  };
+}
+
+/**
+ * Collects the streamed chunks as small Blobs and downloads them as one file.
+ * Each chunk is handed to the browser's blob storage as it arrives, so the
+ * archive is never assembled into a single buffer on the JS heap.
+ */
+function downloadTarget(filename: string): ZipTarget {
+  let parts: Blob[] = [];
+  return {
+    async write(chunk) {
+      parts.push(new Blob([chunk]));
+    },
+    async close() {
+      downloadBlob(new Blob(parts, { type: 'application/zip' }), filename);
+      parts = [];
+    },
+    async abort() {
+      parts = [];
+    },
+  };
+}
+
+/**
+ * Choose where an archive will be saved. Uses the File System Access picker
+ * where available and a download everywhere else.
+ * Must be called while the click's user activation is still valid, i.e.
+ * before any IndexedDB or rendering work. Resolves to null if the user
+ * cancels the picker.
+ */
+export async function openZipTarget(filename: string): Promise<ZipTarget | null> {
+  const showSaveFilePicker = (window as Window & { showSaveFilePicker?: SaveFilePicker }).showSaveFilePicker;
+  if (!showSaveFilePicker) return downloadTarget(filename);
+
+  try {
+    const handle = await showSaveFilePicker({
+      suggestedName: filename,
+      types: [{ description: 'Arquivo ZIP', accept: { 'application/zip': ['.zip'] } }],
+    });
+    return fileTarget(handle);
+  } catch (err) {
+    if (err instanceof DOMException && err.name === 'AbortError') return null;
+    throw err;
+  }
+}
+
+/**
+ * Stream `zip` into `target` one entry at a time, with backpressure: JSZip is
+ * paused until each chunk has been written. The target is closed on success
+ * and aborted on failure or when `signal` fires.
+ */
+export async function writeZip(zip: JSZip, target: ZipTarget, signal?: AbortSignal): Promise<void> {
+  try {
+    await new Promise<void>((resolve, reject) => {
+      const stream = zip.generateInternalStream({ type: 'uint8array', streamFiles: true });
+      const onAbort = () => {
+        stream.pause();
+        reject(new DOMException('Exportação cancelada', 'AbortError'));
+      };
+      if (signal?.aborted) return onAbort();
+      signal?.addEventListener('abort', onAbort, { once: true });
+
+      stream
+        .on('data', (chunk) => {
+          // Hold JSZip back until the chunk has been written
+          stream.pause();
+          target.write(chunk).then(() => {
+            if (!signal?.aborted) stream.resume();
+          }, reject);
+        })
+        .on('error', reject)
+        .on('end', () => {
+          signal?.removeEventListener('abort', onAbort);
+          resolve();
+        })
+        .resume();
+    });
+    await target.close();
+  } catch (err) {
+    await target.abort();
+    throw err;
+  }
+}
+
+// ─── Incremental Writer ─────────────────────────────────────
+
+const LOCAL_SIGNATURE = 0x04034b50;
+const CENTRAL_SIGNATURE = 0x02014b50;
+const EOCD_SIGNATURE = 0x06054b50;
+const LOCAL_HEADER_SIZE = 30;
+const CENTRAL_HEADER_SIZE = 46;
+const EOCD_SIZE = 22;
+const ZIP_VERSION = 20;
+const FLAG_UTF8 = 0x0800;
+const MAX_ZIP32 = 0xffffffff;
+
+let crcTable: Uint32Array | null = null;
+
+function crc32(data: Uint8Array): number {
+  if (!crcTable) {
+    crcTable = new Uint32Array(256);
+    for (let n = 0; n < 256; n++) {
+      let c = n;
+      for (let k = 0; k < 8; k++) c = c & 1 ? 0xedb88320 ^ (c >>> 1) : c >>> 1;
+      crcTable[n] = c >>> 0;
+    }
   }
+  let crc = 0xffffffff;
+  for (let i = 0; i < data.length; i++) crc = crcTable[(crc ^ data[i]) & 0xff] ^ (crc >>> 8);
+  return (crc ^ 0xffffffff) >>> 0;
+}
+
+function dosDateTime(date: Date): { time: number; date: number } {
+  return {
+    time: (date.getHours() << 11) | (date.getMinutes() << 5) | (date.getSeconds() >> 1),
+    date: ((date.getFullYear() - 1980) << 9) | ((date.getMonth() + 1) << 5) | date.getDate(),
+  };
+}
+
+interface WrittenEntry {
+  name: Uint8Array;
+  crc: number;
+  size: number;
+  offset: number;
+}
+
+/** Archive written into a target as entries become available */
+export interface ZipStreamWriter {
+  /** Append a stored (uncompressed) entry; entries are written in call order */
+  add: (name: string, blob: Blob) => Promise<void>;
+  /** Write the central directory and close the target */
+  finish: () => Promise<void>;
+  abort: () => Promise<void>;
+}
+
+/**
+ * Write an archive of stored entries straight into `target`, one entry at a
+ * time as the caller produces them, so only the entry being written is held
+ * in memory. Meant for already-compressed files (PNGs); entries are not
+ * deflated and the archive must stay under 4 GB (no ZIP64).
+ */
+export function createZipStreamWriter(target: ZipTarget): ZipStreamWriter {
+  const encoder = new TextEncoder();
+  const stamp = dosDateTime(new Date());
+  const entries: WrittenEntry[] = [];
+  let offset = 0;
+  let queue: Promise<void> = Promise.resolve();
 
-  return zip.generateAsync({ type: 'blob' });
+  const enqueue = (task: () => Promise<void>) => {
+    const next = queue.then(task);
+    // A failed write fails every later call too
+    queue = next;
+    return next;
+  };
+
+  const write = async (chunk: Uint8Array) => {
+    await target.write(chunk);
+    offset += chunk.length;
+  };
+
+  return {
+    add: (name, blob) => enqueue(async () => {
+      const data = new Uint8Array(await blob.arrayBuffer());
+      if (offset + LOCAL_HEADER_SIZE + name.length * 3 + data.length > MAX_ZIP32) {
+        throw new Error('Arquivo ZIP maior que 4 GB');
+      }
+      const entry: WrittenEntry = { name: encoder.encode(name), crc: crc32(data), size: data.length, offset };
+
+      const header = new Uint8Array(LOCAL_HEADER_SIZE + entry.name.length);
+      const view = new DataView(header.buffer);
+      view.setUint32(0, LOCAL_SIGNATURE, true);
+      view.setUint16(4, ZIP_VERSION, true);
+      view.setUint16(6, FLAG_UTF8, true);
+      view.setUint16(8, 0, true); // stored
+      view.setUint16(10, stamp.time, true);
+      view.setUint16(12, stamp.date, true);
+      view.setUint32(14, entry.crc, true);
+      view.setUint32(18, entry.size, true);
+      view.setUint32(22, entry.size, true);
+      view.setUint16(26, entry.name.length, true);
+      header.set(entry.name, LOCAL_HEADER_SIZE);
+
+      await write(header);
+      await write(data);
+      entries.push(entry);
+    }),
+
+    finish: () => enqueue(async () => {
+      const directoryOffset = offset;
+      for (const entry of entries) {
+        const header = new Uint8Array(CENTRAL_HEADER_SIZE + entry.name.length);
+        const view = new DataView(header.buffer);
+        view.setUint32(0, CENTRAL_SIGNATURE, true);
+        view.setUint16(4, ZIP_VERSION, true);
+        view.setUint16(6, ZIP_VERSION, true);
+        view.setUint16(8, FLAG_UTF8, true);
+        view.setUint16(10, 0, true); // stored
+        view.setUint16(12, stamp.time, true);
+        view.setUint16(14, stamp.date, true);
+        view.setUint32(16, entry.crc, true);
+        view.setUint32(20, entry.size, true);
+        view.setUint32(24, entry.size, true);
+        view.setUint16(28, entry.name.length, true);
+        view.setUint32(42, entry.offset, true);
+        header.set(entry.name, CENTRAL_HEADER_SIZE);
+        await write(header);
+      }
+
+      const eocd = new Uint8Array(EOCD_SIZE);
+      const view = new DataView(eocd.buffer);
+      view.setUint32(0, EOCD_SIGNATURE, true);
+      view.setUint16(8, entries.length, true);
+      view.setUint16(10, entries.length, true);
+      view.setUint32(12, offset - directoryOffset, true);
+      view.setUint32(16, directoryOffset, true);
+      await write(eocd);
+      await target.close();
+    }),
+
+    async abort() {
+      // Wait for the queued writes to settle, so none lands after the abort
+      await queue.catch(() => {});
+      await target.abort();
+    },
+  };
+}
+
+/**
+ * Export a project and save it to disk, streaming the archive into the chosen
+ * file (or into a chunked download) so it is never held in memory as a whole.
+ * Resolves without saving if the user cancels the file picker.
+ */
+export async function saveProjectZip(projectId: string, filename: string): Promise<void> {
+  const target = await openZipTarget(filename);
+  if (!target) return;
+
+  let zip: JSZip;
+  try {
+    zip = await buildProjectZip(projectId);
+  } catch (err) {
+    await target.abort();
+    throw err;
+  }
+  await writeZip(zip, target);
 }
 
 /**
@@ -1,6 +1,8 @@
 import JSZip from 'jszip';
-import { createProject, saveProjectSchema, saveAsset } from './projects';
+import { createProject, deleteProject, saveProjectSchema, saveAssets, type AssetInput } from './projects';
+import { describeAsset } from './asset-ingest';
 import { validateSchema, migrateSchema } from './schema-validation';
+import { readZipEntries, type ZipEntry } from './zip-reader';
 import type { CarouselSchema, ImageElement } from '@/types/schema';
 
 const MIME_TYPES: Record<string, string> = {
@@ -12,19 +14,120 @@ const MIME_TYPES: Record<string, string> = {
   '.svg': 'image/svg+xml',
 };
 
+// Assets inflated (and hashed) at the same time
+const ASSET_CONCURRENCY = 4;
+
+// Inflated assets are written as soon as a batch fills, so at most a few
+// batches of the bundle are in memory at once
+const ASSET_BATCH_MAX = 16;
+const ASSET_BATCH_BYTES = 16 * 1024 * 1024;
+
+/**
+ * Open an archive with the streaming reader, falling back to JSZip (which
+ * loads the whole file) for archives the streaming reader doesn't support.
+ */
+async function openZip(file: File): Promise<ZipEntry[]> {
+  const entries = await readZipEntries(file).catch(() => null);
+  if (entries) return entries;
+
+  const zip = await JSZip.loadAsync(file);
+  return Object.values(zip.files).map((entry) => ({
+    path: entry.name,
+    dir: entry.dir,
+    blob: async (type = '') => {
+      const blob = await entry.async('blob');
+      return type ? new Blob([blob], { type }) : blob;
+    },
+    text: () => entry.async('text'),
+  }));
+}
+
+/**
+ * Call `fn` for each item with at most `limit` calls in flight. Waits for
+ * every call to settle and then rethrows the first failure, so nothing is
+ * still running when the caller handles it.
+ */
+async function forEachConcurrent<T>(items: T[], limit: number, fn: (item: T) => Promise<void>): Promise<void> {
+  let next = 0;
+  const run = async () => {
+    while (next < items.length) {
+      await fn(items[next++]);
+    }
+  };
+  const results = await Promise.allSettled(Array.from({ length: Math.min(limit, items.length) }, run));
+  const failure = results.find((result): result is PromiseRejectedResult => result.status === 'rejected');
+  if (failure) throw failure.reason;
+}
+
+function mimeTypeOf(path: string): string {
+  const ext = '.' + (path.split('.').pop()?.toLowerCase() || '');
+  return MIME_TYPES[ext] || 'application/octet-stream';
+}
+
+/**
+ * Inflate the assets concurrently and store them in bounded batches as they
+ * come out of the reader, one bulkPut transaction per batch. A worker that
+ * fills a batch waits for it to be written before inflating more, so memory
+ * stays bounded by the batch size rather than the bundle size.
+ * After the first failure no further asset is inflated or written, and the
+ * returned promise only rejects once every pending write has settled, so the
+ * caller can delete the project without leaving orphan assets behind.
+ * Returns the stored filenames.
+ */
+async function importAssets(projectId: string, entries: ZipEntry[]): Promise<Set<string>> {
+  const imported = new Set<string>();
+  let batch: AssetInput[] = [];
+  let batchBytes = 0;
+  let aborted = false;
+  // Batches are written one after another, in the order they fill
+  let writing: Promise<unknown> = Promise.resolve();
+
+  const flush = () => {
+    const files = batch;
+    batch = [];
+    batchBytes = 0;
+    writing = writing.then(() => saveAssets(projectId, files));
+    return writing;
+  };
+
+  try {
+    await forEachConcurrent(entries, ASSET_CONCURRENCY, async (entry) => {
+      if (aborted) return;
+      try {
+        const blob = await entry.blob(mimeTypeOf(entry.path));
+        const description = await describeAsset(blob);
+        if (aborted) return;
+        batch.push({ filename: entry.path, blob, ...description });
+        batchBytes += blob.size;
+        imported.add(entry.path);
+        if (batch.length >= ASSET_BATCH_MAX || batchBytes >= ASSET_BATCH_BYTES) await flush();
+      } catch (err) {
+        aborted = true;
+        throw err;
+      }
+    });
+    if (batch.length > 0) flush();
+    await writing;
+  } catch (err) {
+    aborted = true;
+    await writing.catch(() => {});
+    throw err;
+  }
+  return imported;
+}
+
 /**
  * Import a .zip file as a new project.
  * Returns the new project ID.
  */
 export async function importZipAsProject(file: File): Promise<string> {
-  const arrayBuffer = await file.arrayBuffer();
-  const zip = await JSZip.loadAsync(arrayBuffer);
+  const entries = await openZip(file);
 
   // Find and parse schema.json
-  const schemaFile = zip.file('schema.json');
-  if (!schemaFile) throw new Error('schema.json não encontrado no arquivo ZIP');
+  const schemaEntry = entries.find((entry) => entry.path === 'schema.json');
+  if (!schemaEntry) throw new Error('schema.json não encontrado no arquivo ZIP');
 
-  const schemaText = await schemaFile.async('text');
+  const schemaText = await schemaEntry.text();
   let schemaData: unknown;
   try {
     schemaData = JSON.parse(schemaText);
@@ -44,56 +147,43 @@ export async function importZipAsProject(file: File): Promise<string> {
   // Create project
   const project = await createProject(schema.title || 'Carrossel Importado');
 
-  // Save schema with the new project's ID
-  schema.id = project.id;
-
-  // Extract and save assets — collect imported paths
-  const importedAssets = new Set<string>();
-  const assetsFolder = zip.folder('assets');
-  if (assetsFolder) {
-    const assetFiles: string[] = [];
-    assetsFolder.forEach((relativePath) => {
-      assetFiles.push(relativePath);
-    });
-
-    for (const relativePath of assetFiles) {
-      const assetFile = assetsFolder.file(relativePath);
-      if (!assetFile || assetFile.dir) continue;
-
-      const blob = await assetFile.async('blob');
-      const ext = '.' + (relativePath.split('.').pop()?.toLowerCase() || '');
-      const mimeType = MIME_TYPES[ext] || 'application/octet-stream';
-      const typedBlob = new Blob([blob], { type: mimeType });
-
-      const assetPath = `assets/${relativePath}`;
-      await saveAsset(project.id, assetPath, typedBlob);
-      importedAssets.add(assetPath);
-    }
-  }
-
-  // Validate asset references — clear broken refs instead of failing
-  for (const slide of schema.slides) {
-    // Check slide backgroundImage
-    if (slide.backgroundImage && typeof slide.backgroundImage === 'string' && slide.backgroundImage.startsWith('assets/')) {
-      if (!importedAssets.has(slide.backgroundImage)) {
-        console.warn(`[zip-import] Asset ausente para backgroundImage: ${slide.backgroundImage}`);
-        slide.backgroundImage = null;
+  try {
+    // Save schema with the new project's ID
+    schema.id = project.id;
+
+    const importedAssets = await importAssets(
+      project.id,
+      entries.filter((entry) => !entry.dir && entry.path.startsWith('assets/')),
+    );
+
+    // Validate asset references — clear broken refs instead of failing
+    for (const slide of schema.slides) {
+      // Check slide backgroundImage
+      if (slide.backgroundImage && typeof slide.backgroundImage === 'string' && slide.backgroundImage.startsWith('assets/')) {
+        if (!importedAssets.has(slide.backgroundImage)) {
+          console.warn(`[zip-import] Asset ausente para backgroundImage: ${slide.backgroundImage}`);
+          slide.backgroundImage = null;
+        }
       }
-    }
 
-    // Check image elements
-    for (const el of slide.elements) {
-      if (el.type === 'image') {
-        const img = el as ImageElement;
-        if (img.src && img.src.startsWith('assets/') && !importedAssets.has(img.src)) {
-          console.warn(`[zip-import] Asset ausente para imagem: ${img.src}`);
-          img.src = '';
+      // Check image elements
+      for (const el of slide.elements) {
+        if (el.type === 'image') {
+          const img = el as ImageElement;
+          if (img.src && img.src.startsWith('assets/') && !importedAssets.has(img.src)) {
+            console.warn(`[zip-import] Asset ausente para imagem: ${img.src}`);
+            img.src = '';
+          }
         }
       }
     }
-  }
 
-  await saveProjectSchema(project.id, schema);
+    await saveProjectSchema(project.id, schema);
+  } catch (err) {
+    // Don't leave a half-imported project behind
+    await deleteProject(project.id);
+    throw err;
+  }
 
   return project.id;
 }
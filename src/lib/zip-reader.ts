@@ -0,0 +1,120 @@
+// ============================================================
+// Streaming ZIP Reader
+// Reads a ZIP's central directory straight from the File and inflates each
+// entry on demand with the native DecompressionStream, so the archive is never
+// loaded into memory as a whole and entries can be inflated in parallel.
+// Archives it can't handle (ZIP64, encryption, compression other than
+// store/deflate) yield null, and callers fall back to JSZip.
+// ============================================================
+
+export interface ZipEntry {
+  path: string;
+  dir: boolean;
+  blob: (type?: string) => Promise<Blob>;
+  text: () => Promise<string>;
+}
+
+const EOCD_SIGNATURE = 0x06054b50;
+const CENTRAL_SIGNATURE = 0x02014b50;
+const LOCAL_SIGNATURE = 0x04034b50;
+const EOCD_SIZE = 22;
+const CENTRAL_HEADER_SIZE = 46;
+const LOCAL_HEADER_SIZE = 30;
+const MAX_COMMENT_SIZE = 0xffff;
+
+const METHOD_STORE = 0;
+const METHOD_DEFLATE = 8;
+const FLAG_ENCRYPTED = 0x1;
+
+async function readView(file: Blob, start: number, end: number): Promise<DataView> {
+  return new DataView(await file.slice(start, end).arrayBuffer());
+}
+
+function supportsDeflateRaw(): boolean {
+  if (typeof DecompressionStream === 'undefined') return false;
+  try {
+    new DecompressionStream('deflate-raw');
+    return true;
+  } catch {
+    return false;
+  }
+}
+
+function createEntry(file: Blob, path: string, method: number, compressedSize: number, localOffset: number): ZipEntry {
+  const compressedData = async (): Promise<Blob> => {
+    // Name/extra lengths in the local header may differ from the central
+    // directory's, so the data offset has to be read from it
+    const header = await readView(file, localOffset, localOffset + LOCAL_HEADER_SIZE);
+    if (header.getUint32(0, true) !== LOCAL_SIGNATURE) {
+      throw new Error(`Entrada corrompida no ZIP: ${path}`);
+    }
+    const start = localOffset + LOCAL_HEADER_SIZE + header.getUint16(26, true) + header.getUint16(28, true);
+    return file.slice(start, start + compressedSize);
+  };
+
+  const blob = async (type = ''): Promise<Blob> => {
+    const data = await compressedData();
+    if (method === METHOD_STORE) return data.slice(0, data.size, type);
+    const inflated = await new Response(data.stream().pipeThrough(new DecompressionStream('deflate-raw'))).blob();
+    return type ? new Blob([inflated], { type }) : inflated;
+  };
+
+  return {
+    path,
+    dir: path.endsWith('/'),
+    blob,
+    text: async () => (await blob()).text(),
+  };
+}
+
+/**
+ * List the entries of a ZIP archive without reading their contents.
+ * Returns null when the archive uses features this reader doesn't support.
+ */
+export async function readZipEntries(file: Blob): Promise<ZipEntry[] | null> {
+  if (!supportsDeflateRaw() || file.size < EOCD_SIZE) return null;
+
+  // The end-of-central-directory record sits in the last 22 bytes plus an
+  // optional comment of up to 64 KB
+  const tailStart = Math.max(0, file.size - EOCD_SIZE - MAX_COMMENT_SIZE);
+  const tail = await readView(file, tailStart, file.size);
+  let eocd = -1;
+  for (let i = tail.byteLength - EOCD_SIZE; i >= 0; i--) {
+    if (tail.getUint32(i, true) === EOCD_SIGNATURE) {
+      eocd = i;
+      break;
+    }
+  }
+  if (eocd < 0) return null;
+
+  const count = tail.getUint16(eocd + 10, true);
+  const dirSize = tail.getUint32(eocd + 12, true);
+  const dirOffset = tail.getUint32(eocd + 16, true);
+  // 0xffff / 0xffffffff mark ZIP64 archives
+  if (count === 0xffff || dirOffset === 0xffffffff) return null;
+
+  const dir = await readView(file, dirOffset, dirOffset + dirSize);
+  const decoder = new TextDecoder();
+  const entries: ZipEntry[] = [];
+  let p = 0;
+
+  for (let n = 0; n < count; n++) {
+    if (p + CENTRAL_HEADER_SIZE > dir.byteLength || dir.getUint32(p, true) !== CENTRAL_SIGNATURE) return null;
+    const flags = dir.getUint16(p + 8, true);
+    const method = dir.getUint16(p + 10, true);
+    const compressedSize = dir.getUint32(p + 20, true);
+    const nameLength = dir.getUint16(p + 28, true);
+    const extraLength = dir.getUint16(p + 30, true);
+    const commentLength = dir.getUint16(p + 32, true);
+    const localOffset = dir.getUint32(p + 42, true);
+    const path = decoder.decode(new Uint8Array(dir.buffer, dir.byteOffset + p + CENTRAL_HEADER_SIZE, nameLength));
+    p += CENTRAL_HEADER_SIZE + nameLength + extraLength + commentLength;
+
+    if (flags & FLAG_ENCRYPTED) return null;
+    if (method !== METHOD_STORE && method !== METHOD_DEFLATE) return null;
+    if (compressedSize === 0xffffffff || localOffset === 0xffffffff) return null;
+
+    entries.push(createEntry(file, path, method, compressedSize, localOffset));
+  }
+  return entries;
+}
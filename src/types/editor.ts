@@ -10,13 +10,42 @@ export interface EditorState {
   selectedElementId: string | null;
   isPreviewMode: boolean;
   isDirty: boolean;
-  undoStack: CarouselSchema[];
-  redoStack: CarouselSchema[];
+  undoStack: HistoryEntry[];
+  redoStack: HistoryEntry[];
   viewMode: 'horizontal' | 'grid';
   zoom: number;
   lastUndoAction: { type: string; elementId?: string; timestamp: number } | null;
 }
 
+// ─── Undo History ───────────────────────────────────────────
+// History entries are patches, not snapshots. Values inside a patch are
+// references to the (immutable) objects they restore, so unchanged slides and
+// elements are shared with the live carousel instead of being copied.
+
+export interface SlidePatch {
+  /** Changed slide properties (never `elements`) */
+  fields?: Partial<Slide>;
+  /** Full element list, recorded only when ids or order changed */
+  elements?: SlideElement[];
+  /** Replaced elements by index, when the element list kept its shape */
+  changedElements?: Record<number, SlideElement>;
+}
+
+export interface CarouselPatch {
+  /** Changed top-level properties (never `slides`) */
+  fields?: Partial<CarouselSchema>;
+  /** Full slide list, recorded only when ids or order changed */
+  slides?: Slide[];
+  /** Patched slides by index, when the slide list kept its shape */
+  changedSlides?: Record<number, SlidePatch>;
+}
+
+export interface HistoryEntry {
+  patch: CarouselPatch;
+  /** Estimated bytes retained only by this entry */
+  bytes: number;
+}
+
 export type EditorAction =
   | { type: 'SET_CAROUSEL'; payload: CarouselSchema }
   | { type: 'SELECT_SLIDE'; payload: number }